@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import os
+import threading
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import wraps
 from pathlib import Path
-from typing import Generator, Iterable, Sequence
+from typing import Callable, Generator, Hashable, Iterable, ParamSpec, Sequence, TypeVar
 
 from sqlalchemy import ForeignKey, Integer, String, Text, create_engine, text
 from sqlalchemy.engine import Engine
@@ -507,12 +509,277 @@ MIGRATIONS: tuple[Migration, ...] = (
             """,
         ),
     ),
+    Migration(
+        version=15,
+        description="index price entries by provider and model",
+        statements=(
+            """
+            CREATE INDEX IF NOT EXISTS idx_price_entries_provider_model_id
+                ON price_entries (provider_id, model, id)
+            """,
+        ),
+    ),
+    Migration(
+        version=16,
+        description="maintain 5-minute telemetry rollups",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS telemetry_rollups (
+                bucket_start TEXT NOT NULL,
+                provider_id TEXT NOT NULL,
+                route TEXT NOT NULL,
+                run_count INTEGER NOT NULL,
+                tokens_in INTEGER NOT NULL,
+                tokens_out INTEGER NOT NULL,
+                duration_ms_sum INTEGER NOT NULL,
+                success_count INTEGER NOT NULL,
+                cost_usd REAL NOT NULL,
+                missing_tokens_in INTEGER NOT NULL,
+                missing_tokens_out INTEGER NOT NULL,
+                min_ts TEXT NOT NULL,
+                max_ts TEXT NOT NULL,
+                PRIMARY KEY (bucket_start, provider_id, route)
+            )
+            """,
+            """
+            INSERT INTO telemetry_rollups (
+                bucket_start,
+                provider_id,
+                route,
+                run_count,
+                tokens_in,
+                tokens_out,
+                duration_ms_sum,
+                success_count,
+                cost_usd,
+                missing_tokens_in,
+                missing_tokens_out,
+                min_ts,
+                max_ts
+            )
+            SELECT
+                substr(ts, 1, 14) || printf('%02d', CAST(substr(ts, 15, 2) AS INTEGER) / 5 * 5) || ':00+00:00',
+                provider_id,
+                IFNULL(route, ''),
+                COUNT(*),
+                SUM(tokens_in),
+                SUM(tokens_out),
+                SUM(duration_ms),
+                SUM(CASE WHEN LOWER(status) = 'success' THEN 1 ELSE 0 END),
+                SUM(COALESCE(cost_estimated_usd, 0)),
+                SUM(CASE WHEN cost_estimated_usd IS NULL THEN tokens_in ELSE 0 END),
+                SUM(CASE WHEN cost_estimated_usd IS NULL THEN tokens_out ELSE 0 END),
+                MIN(ts),
+                MAX(ts)
+            FROM telemetry_events
+            WHERE ts GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]T[0-9][0-9]:[0-9][0-9]:[0-9][0-9]*+00:00'
+            GROUP BY 1, 2, 3
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_telemetry_rollups_insert
+            AFTER INSERT ON telemetry_events
+            WHEN NEW.ts GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]T[0-9][0-9]:[0-9][0-9]:[0-9][0-9]*+00:00'
+            BEGIN
+                INSERT INTO telemetry_rollups (
+                    bucket_start,
+                    provider_id,
+                    route,
+                    run_count,
+                    tokens_in,
+                    tokens_out,
+                    duration_ms_sum,
+                    success_count,
+                    cost_usd,
+                    missing_tokens_in,
+                    missing_tokens_out,
+                    min_ts,
+                    max_ts
+                ) VALUES (
+                    substr(NEW.ts, 1, 14) || printf('%02d', CAST(substr(NEW.ts, 15, 2) AS INTEGER) / 5 * 5) || ':00+00:00',
+                    NEW.provider_id,
+                    IFNULL(NEW.route, ''),
+                    1,
+                    NEW.tokens_in,
+                    NEW.tokens_out,
+                    NEW.duration_ms,
+                    CASE WHEN LOWER(NEW.status) = 'success' THEN 1 ELSE 0 END,
+                    COALESCE(NEW.cost_estimated_usd, 0),
+                    CASE WHEN NEW.cost_estimated_usd IS NULL THEN NEW.tokens_in ELSE 0 END,
+                    CASE WHEN NEW.cost_estimated_usd IS NULL THEN NEW.tokens_out ELSE 0 END,
+                    NEW.ts,
+                    NEW.ts
+                )
+                ON CONFLICT (bucket_start, provider_id, route) DO UPDATE SET
+                    run_count = run_count + excluded.run_count,
+                    tokens_in = tokens_in + excluded.tokens_in,
+                    tokens_out = tokens_out + excluded.tokens_out,
+                    duration_ms_sum = duration_ms_sum + excluded.duration_ms_sum,
+                    success_count = success_count + excluded.success_count,
+                    cost_usd = cost_usd + excluded.cost_usd,
+                    missing_tokens_in = missing_tokens_in + excluded.missing_tokens_in,
+                    missing_tokens_out = missing_tokens_out + excluded.missing_tokens_out,
+                    min_ts = MIN(min_ts, excluded.min_ts),
+                    max_ts = MAX(max_ts, excluded.max_ts);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_telemetry_rollups_delete
+            AFTER DELETE ON telemetry_events
+            WHEN OLD.ts GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]T[0-9][0-9]:[0-9][0-9]:[0-9][0-9]*+00:00'
+            BEGIN
+                DELETE FROM telemetry_rollups
+                WHERE bucket_start = substr(OLD.ts, 1, 14) || printf('%02d', CAST(substr(OLD.ts, 15, 2) AS INTEGER) / 5 * 5) || ':00+00:00'
+                    AND provider_id = OLD.provider_id
+                    AND route = IFNULL(OLD.route, '');
+                INSERT INTO telemetry_rollups (
+                    bucket_start,
+                    provider_id,
+                    route,
+                    run_count,
+                    tokens_in,
+                    tokens_out,
+                    duration_ms_sum,
+                    success_count,
+                    cost_usd,
+                    missing_tokens_in,
+                    missing_tokens_out,
+                    min_ts,
+                    max_ts
+                )
+                SELECT
+                    substr(ts, 1, 14) || printf('%02d', CAST(substr(ts, 15, 2) AS INTEGER) / 5 * 5) || ':00+00:00',
+                    provider_id,
+                    IFNULL(route, ''),
+                    COUNT(*),
+                    SUM(tokens_in),
+                    SUM(tokens_out),
+                    SUM(duration_ms),
+                    SUM(CASE WHEN LOWER(status) = 'success' THEN 1 ELSE 0 END),
+                    SUM(COALESCE(cost_estimated_usd, 0)),
+                    SUM(CASE WHEN cost_estimated_usd IS NULL THEN tokens_in ELSE 0 END),
+                    SUM(CASE WHEN cost_estimated_usd IS NULL THEN tokens_out ELSE 0 END),
+                    MIN(ts),
+                    MAX(ts)
+                FROM telemetry_events
+                WHERE provider_id = OLD.provider_id
+                    AND IFNULL(route, '') = IFNULL(OLD.route, '')
+                    AND ts GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]T[0-9][0-9]:[0-9][0-9]:[0-9][0-9]*+00:00'
+                    AND substr(ts, 1, 14) || printf('%02d', CAST(substr(ts, 15, 2) AS INTEGER) / 5 * 5) || ':00+00:00' = substr(OLD.ts, 1, 14) || printf('%02d', CAST(substr(OLD.ts, 15, 2) AS INTEGER) / 5 * 5) || ':00+00:00'
+                GROUP BY 1, 2, 3;
+            END
+            """,
+        ),
+    ),
+    Migration(
+        version=17,
+        description="track a revision watermark for telemetry aggregates",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS telemetry_watermark (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                revision INTEGER NOT NULL,
+                modified_at TEXT NOT NULL
+            )
+            """,
+            """
+            INSERT OR IGNORE INTO telemetry_watermark (id, revision, modified_at)
+            VALUES (1, 0, strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+            """,
+            # Aggregates read telemetry events and fill missing costs from the
+            # price table, so writes to either advance the watermark.
+            *(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS trg_telemetry_watermark_{table}_{event.lower()}
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE telemetry_watermark
+                    SET revision = revision + 1,
+                        modified_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
+                    WHERE id = 1;
+                END
+                """
+                for table in ("telemetry_events", "price_entries")
+                for event in ("INSERT", "UPDATE", "DELETE")
+            ),
+        ),
+    ),
 )
 
 _engine: Engine | None = None
 _engine_path: Path | None = None
 _SessionLocal: sessionmaker[Session] | None = None
 
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+class StoreVersion:
+    """Write counter for a persisted store, used to key cached reads.
+
+    Store modules wrap their mutating helpers with :meth:`bumps`; the counter
+    advances once the wrapped call returns (after its transaction committed) or
+    raises. :meth:`current` pairs the counter with the active engine so cached
+    reads never survive a switch to another database file or
+    :func:`reset_state`.
+    """
+
+    __slots__ = ("_writes", "_lock")
+
+    def __init__(self) -> None:
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def current(self) -> tuple[Engine, int]:
+        # Engines compare by identity, and holding the reference in a cache key
+        # keeps a disposed engine's id from being reused by its successor.
+        return (get_engine(), self._writes)
+
+    def bump(self) -> None:
+        with self._lock:
+            self._writes += 1
+
+    def bumps(self, func: Callable[_P, _R]) -> Callable[_P, _R]:
+        @wraps(func)
+        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.bump()
+
+        return wrapper
+
+    def memoize(self, maxsize: int = 1024) -> Callable[[Callable[..., _R]], Callable[..., _R]]:
+        """Cache a reader's results by positional arguments until the store is written.
+
+        All entries are dropped once :meth:`current` moves. A result computed
+        while a write was in flight is returned but not stored, so it cannot
+        outlive the version it was read under.
+        """
+
+        def decorator(func: Callable[..., _R]) -> Callable[..., _R]:
+            lock = threading.Lock()
+            cache: dict[tuple[Hashable, ...], _R] = {}
+            cached_version: list[object] = [None]
+
+            @wraps(func)
+            def wrapper(*args: Hashable) -> _R:
+                version = self.current()
+                with lock:
+                    if cached_version[0] != version:
+                        cache.clear()
+                        cached_version[0] = version
+                    elif args in cache:
+                        return cache[args]
+                result = func(*args)
+                with lock:
+                    if cached_version[0] == version and len(cache) < maxsize:
+                        cache[args] = result
+                return result
+
+            return wrapper
+
+        return decorator
+
 
 def _resolve_database_path(path: Path | None = None) -> Path:
     env_override = os.getenv(DB_ENV_VAR)
@@ -535,6 +802,7 @@ def get_engine(path: Path | None = None) -> Engine:
             echo=False,
             future=True,
             connect_args={"check_same_thread": False},
+            insertmanyvalues_page_size=1000,
         )
         _engine_path = db_path
         _SessionLocal = None
@@ -658,6 +926,7 @@ __all__ = [
     "Base",
     "Migration",
     "MIGRATIONS",
+    "StoreVersion",
     "DEFAULT_DB_PATH",
     "DB_ENV_VAR",
     "User",
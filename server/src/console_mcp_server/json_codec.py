@@ -0,0 +1,58 @@
+"""JSON encoding helpers that prefer ``orjson`` when it is installed."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from datetime import datetime
+from typing import Any
+
+try:  # pragma: no cover - optional dependency resolution
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - fallback to the standard library
+    orjson = None  # type: ignore[assignment]
+
+# Combined once at import rather than on every ``dumps_bytes`` call.
+_BYTES_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def dumps(value: Any) -> str:
+    """Serialize ``value`` into a compact JSON string."""
+
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        rendered = value.isoformat()
+        return rendered[:-6] + "Z" if rendered.endswith("+00:00") else rendered
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """Serialize ``value`` into UTF-8 JSON bytes ready to be sent as a response body.
+
+    ``datetime`` values are rendered natively (UTC as ``Z``), matching the output
+    of the pydantic response models. Dataclass instances are encoded field by
+    field, which orjson does in C without building an intermediate dict.
+    Non-string keys are coerced to strings the way :func:`json.dumps` does.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(value, option=_BYTES_OPTIONS)
+    return json.dumps(value, default=_default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(value: str | bytes) -> Any:
+    """Parse a JSON document from ``str`` or ``bytes``."""
+
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+__all__ = ["dumps", "dumps_bytes", "loads"]
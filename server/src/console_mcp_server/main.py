@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 import os
 from typing import Any
@@ -9,9 +10,10 @@ from typing import Any
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from .database import bootstrap_database, database_path
-from .routes import router as api_router
+from .routes import api_exception_handlers, router as api_router
 from .supervisor import process_supervisor
 from .security import DEFAULT_AUDIT_LOGGER, RBACMiddleware
 
@@ -92,8 +94,12 @@ app = FastAPI(
     title="Console MCP Server",
     description="Prototype API surface for orchestrating MCP providers",
     version="0.1.0",
+    exception_handlers=api_exception_handlers,
 )
 app.include_router(api_router)
+# Listing, log and simulation payloads are repetitive JSON; small bodies are
+# left alone since compressing them costs more than it saves on the wire.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
 
 cors_origins_raw = os.getenv(CORS_ENV_VAR)
 cors_origins = (
@@ -136,12 +142,34 @@ async def root() -> dict[str, Any]:
     }
 
 
+def _server_implementations() -> dict[str, str]:
+    """Pin uvloop/httptools (shipped with ``uvicorn[standard]``) when installed.
+
+    Both entrypoints use the same implementations so dev and prod behave alike.
+    """
+
+    return {
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") is not None else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") is not None else "h11",
+    }
+
+
 def run() -> None:
     """Production oriented entrypoint (host/port configurable via env)."""
     host = os.getenv(SERVER_HOST_ENV_VAR, "0.0.0.0")
     port = _read_port(SERVER_PORT_ENV_VAR, 8000, strict=True)
+    implementations = _server_implementations()
+    logger.info(
+        "Serving with loop=%s http=%s", implementations["loop"], implementations["http"]
+    )
 
-    uvicorn.run("console_mcp_server.main:app", host=host, port=port, factory=False)
+    uvicorn.run(
+        "console_mcp_server.main:app",
+        host=host,
+        port=port,
+        factory=False,
+        **implementations,
+    )
 
 
 def run_dev() -> None:
@@ -154,6 +182,7 @@ def run_dev() -> None:
         port=port,
         reload=True,
         factory=False,
+        **_server_implementations(),
     )
 
 
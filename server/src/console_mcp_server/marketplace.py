@@ -13,7 +13,8 @@ from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from .database import session_scope
+from . import json_codec
+from .database import StoreVersion, session_scope
 
 
 class MarketplaceEntryNotFoundError(KeyError):
@@ -32,6 +33,10 @@ class MarketplaceArtifactError(RuntimeError):
     """Raised when marketplace artifacts are missing or invalid."""
 
 
+marketplace_version = StoreVersion()
+"""Bumped on every marketplace write; keys cached listings."""
+
+
 @dataclass(frozen=True)
 class MarketplaceEntryRecord:
     """Canonical representation of a stored marketplace entry."""
@@ -107,6 +112,11 @@ class MarketplaceEntryRecord:
             "updated_at": self.updated_at,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Encode the record as JSON without building an intermediate dict."""
+
+        return json_codec.dumps_bytes(self)
+
 
 @dataclass(frozen=True)
 class MarketplaceInstallBundle:
@@ -126,7 +136,7 @@ def _now() -> datetime:
     return datetime.now(tz=timezone.utc)
 
 
-def _fetch_one(session: Session, entry_id: str) -> MarketplaceEntryRecord:
+def _fetch_optional(session: Session, entry_id: str) -> MarketplaceEntryRecord | None:
     row = session.execute(
         text(
             """
@@ -155,9 +165,14 @@ def _fetch_one(session: Session, entry_id: str) -> MarketplaceEntryRecord:
         ),
         {"entry_id": entry_id},
     ).mappings().one_or_none()
-    if row is None:
+    return MarketplaceEntryRecord.from_row(row) if row is not None else None
+
+
+def _fetch_one(session: Session, entry_id: str) -> MarketplaceEntryRecord:
+    record = _fetch_optional(session, entry_id)
+    if record is None:
         raise MarketplaceEntryNotFoundError(entry_id)
-    return MarketplaceEntryRecord.from_row(row)
+    return record
 
 
 def list_marketplace_entries() -> list[MarketplaceEntryRecord]:
@@ -192,6 +207,7 @@ def list_marketplace_entries() -> list[MarketplaceEntryRecord]:
         return [MarketplaceEntryRecord.from_row(row) for row in rows]
 
 
+@marketplace_version.bumps
 def create_marketplace_entry(
     *,
     entry_id: str,
@@ -289,6 +305,14 @@ def get_marketplace_entry(entry_id: str) -> MarketplaceEntryRecord:
         return _fetch_one(session, entry_id)
 
 
+def lookup_marketplace_entry(entry_id: str) -> MarketplaceEntryRecord | None:
+    """Return a single marketplace entry, or ``None`` when it does not exist."""
+
+    with session_scope() as session:
+        return _fetch_optional(session, entry_id)
+
+
+@marketplace_version.bumps
 def update_marketplace_entry(
     entry_id: str,
     *,
@@ -359,6 +383,7 @@ def update_marketplace_entry(
     return get_marketplace_entry(entry_id)
 
 
+@marketplace_version.bumps
 def delete_marketplace_entry(entry_id: str) -> None:
     with session_scope() as session:
         result = session.execute(
@@ -426,6 +451,7 @@ def prepare_marketplace_install(entry_id: str, destination: Path) -> Marketplace
 
 
 __all__ = [
+    "marketplace_version",
     "MarketplaceEntryRecord",
     "MarketplaceInstallBundle",
     "MarketplaceEntryNotFoundError",
@@ -435,6 +461,7 @@ __all__ = [
     "list_marketplace_entries",
     "create_marketplace_entry",
     "get_marketplace_entry",
+    "lookup_marketplace_entry",
     "update_marketplace_entry",
     "delete_marketplace_entry",
     "prepare_marketplace_install",
@@ -11,7 +11,8 @@ from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from .database import session_scope
+from . import json_codec
+from .database import StoreVersion, session_scope
 
 
 class CostPolicyNotFoundError(KeyError):
@@ -22,6 +23,10 @@ class CostPolicyAlreadyExistsError(RuntimeError):
     """Raised when attempting to create a duplicate cost policy."""
 
 
+policies_version = StoreVersion()
+"""Bumped on every cost policy write; keys cached listings."""
+
+
 @dataclass(frozen=True)
 class CostPolicyRecord:
     """Canonical representation of a stored cost policy."""
@@ -63,6 +68,11 @@ class CostPolicyRecord:
             "updated_at": self.updated_at,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Encode the record as JSON without building an intermediate dict."""
+
+        return json_codec.dumps_bytes(self)
+
 
 def _serialize_list(values: Iterable[str]) -> str:
     return json.dumps(list(values))
@@ -72,7 +82,7 @@ def _now() -> datetime:
     return datetime.now(tz=timezone.utc)
 
 
-def _fetch_one(session: Session, policy_id: str) -> CostPolicyRecord:
+def _fetch_optional(session: Session, policy_id: str) -> CostPolicyRecord | None:
     result = session.execute(
         text(
             """
@@ -83,9 +93,14 @@ def _fetch_one(session: Session, policy_id: str) -> CostPolicyRecord:
         ),
         {"policy_id": policy_id},
     ).mappings().one_or_none()
-    if result is None:
+    return CostPolicyRecord.from_row(result) if result is not None else None
+
+
+def _fetch_one(session: Session, policy_id: str) -> CostPolicyRecord:
+    record = _fetch_optional(session, policy_id)
+    if record is None:
         raise CostPolicyNotFoundError(policy_id)
-    return CostPolicyRecord.from_row(result)
+    return record
 
 
 def list_policies() -> List[CostPolicyRecord]:
@@ -104,6 +119,7 @@ def list_policies() -> List[CostPolicyRecord]:
         return [CostPolicyRecord.from_row(row) for row in rows]
 
 
+@policies_version.bumps
 def create_policy(
     *,
     policy_id: str,
@@ -153,6 +169,14 @@ def get_policy(policy_id: str) -> CostPolicyRecord:
         return _fetch_one(session, policy_id)
 
 
+def lookup_policy(policy_id: str) -> CostPolicyRecord | None:
+    """Return a single cost policy, or ``None`` when it does not exist."""
+
+    with session_scope() as session:
+        return _fetch_optional(session, policy_id)
+
+
+@policies_version.bumps
 def update_policy(
     policy_id: str,
     *,
@@ -197,6 +221,7 @@ def update_policy(
         return _fetch_one(session, policy_id)
 
 
+@policies_version.bumps
 def delete_policy(policy_id: str) -> None:
     """Remove a cost policy from the data store."""
 
@@ -209,12 +234,14 @@ def delete_policy(policy_id: str) -> None:
 
 
 __all__ = [
+    "policies_version",
     "CostPolicyRecord",
     "CostPolicyNotFoundError",
     "CostPolicyAlreadyExistsError",
     "list_policies",
     "create_policy",
     "get_policy",
+    "lookup_policy",
     "update_policy",
     "delete_policy",
 ]
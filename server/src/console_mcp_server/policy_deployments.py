@@ -7,13 +7,36 @@ from datetime import datetime, timezone
 from typing import List
 from uuid import uuid4
 
+from sqlalchemy import Column, Integer, MetaData, String, Table, text
 from sqlalchemy.orm import Session
-from sqlalchemy import text
 
-from .database import session_scope
+from . import json_codec
+from .database import StoreVersion, session_scope
 from .policy_templates import iter_policy_templates
 
 
+_metadata = MetaData()
+
+# Core table construct mirroring migration 6; statements built from it are
+# cached by SQLAlchemy after their first compilation.
+_policy_deployments = Table(
+    "policy_deployments",
+    _metadata,
+    Column("id", String, primary_key=True),
+    Column("template_id", String, nullable=False),
+    Column("deployed_at", String, nullable=False),
+    Column("author", String, nullable=False),
+    Column("window", String),
+    Column("note", String),
+    Column("slo_p95_ms", Integer, nullable=False),
+    Column("budget_usage_pct", Integer, nullable=False),
+    Column("incidents_count", Integer, nullable=False),
+    Column("guardrail_score", Integer, nullable=False),
+    Column("created_at", String, nullable=False),
+    Column("updated_at", String, nullable=False),
+)
+
+
 class PolicyDeploymentNotFoundError(KeyError):
     """Raised when a deployment could not be located."""
 
@@ -22,6 +45,10 @@ class InvalidPolicyTemplateError(ValueError):
     """Raised when attempting to reference an unknown policy template."""
 
 
+policy_deployments_version = StoreVersion()
+"""Bumped on every deployment write; keys the cached deployment history."""
+
+
 @dataclass(frozen=True)
 class PolicyDeploymentRecord:
     """Canonical representation of a policy deployment entry."""
@@ -56,6 +83,39 @@ class PolicyDeploymentRecord:
             updated_at=datetime.fromisoformat(str(row["updated_at"])),
         )
 
+    @classmethod
+    def from_values(
+        cls,
+        id: object,
+        template_id: object,
+        deployed_at: object,
+        author: object,
+        window: object,
+        note: object,
+        slo_p95_ms: object,
+        budget_usage_pct: object,
+        incidents_count: object,
+        guardrail_score: object,
+        created_at: object,
+        updated_at: object,
+    ) -> "PolicyDeploymentRecord":
+        """Build a record from a positional driver row (see ``_LIST_DEPLOYMENTS_SQL``)."""
+
+        return cls(
+            id=str(id),
+            template_id=str(template_id),
+            deployed_at=datetime.fromisoformat(str(deployed_at)),
+            author=str(author),
+            window=str(window) if window is not None else None,
+            note=str(note) if note is not None else None,
+            slo_p95_ms=int(slo_p95_ms),
+            budget_usage_pct=int(budget_usage_pct),
+            incidents_count=int(incidents_count),
+            guardrail_score=int(guardrail_score),
+            created_at=datetime.fromisoformat(str(created_at)),
+            updated_at=datetime.fromisoformat(str(updated_at)),
+        )
+
     def to_dict(self) -> dict[str, object]:
         return {
             "id": self.id,
@@ -72,27 +132,36 @@ class PolicyDeploymentRecord:
             "updated_at": self.updated_at,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Encode the record as JSON without building an intermediate dict."""
 
-def _hash_string(value: str) -> int:
-    hash_value = 0
+        return json_codec.dumps_bytes(self)
+
+
+def _hash_state(value: str, hash_value: int = 0) -> int:
     for character in value:
         hash_value = ((hash_value << 5) - hash_value + ord(character)) & 0xFFFFFFFF
-    if hash_value & 0x80000000:
-        hash_value -= 0x100000000
-    return abs(hash_value)
+    return hash_value
 
 
-def _seeded_mod(value: str, modulo: int) -> int:
-    if modulo <= 0:
-        raise ValueError("Modulo must be greater than zero")
-    return _hash_string(value) % modulo
+def _finalize_hash(hash_value: int) -> int:
+    # Same result as sign-extending the 32-bit state and taking ``abs()``.
+    return min(hash_value, 0x100000000 - hash_value)
 
 
 def _compute_metrics(template_id: str) -> tuple[int, int, int, int]:
-    slo_p95_ms = 480 + _seeded_mod(f"{template_id}-slo", 520)
-    budget_usage_pct = 62 + _seeded_mod(f"{template_id}-budget", 24)
-    incidents_count = _seeded_mod(f"{template_id}-incidents", 4)
-    guardrail_score = 68 + _seeded_mod(f"{template_id}-guardrail", 18)
+    # The rolling hash mirrors ``hashString`` in the frontend, so the values must
+    # stay identical. It is prefix-incremental: hash ``template_id`` once and
+    # extend the shared state with each suffix instead of rehashing four strings.
+    prefix = _hash_state(template_id)
+
+    def seeded(suffix: str, modulo: int) -> int:
+        return _finalize_hash(_hash_state(suffix, prefix)) % modulo
+
+    slo_p95_ms = 480 + seeded("-slo", 520)
+    budget_usage_pct = 62 + seeded("-budget", 24)
+    incidents_count = seeded("-incidents", 4)
+    guardrail_score = 68 + seeded("-guardrail", 18)
     return slo_p95_ms, budget_usage_pct, incidents_count, guardrail_score
 
 
@@ -110,6 +179,36 @@ def _now() -> datetime:
     return datetime.now(tz=timezone.utc)
 
 
+# Column order must match the positional arguments of
+# ``PolicyDeploymentRecord.from_values``.
+_LIST_DEPLOYMENTS_SQL = """
+    SELECT
+        id,
+        template_id,
+        deployed_at,
+        author,
+        window,
+        note,
+        slo_p95_ms,
+        budget_usage_pct,
+        incidents_count,
+        guardrail_score,
+        created_at,
+        updated_at
+    FROM policy_deployments
+    ORDER BY deployed_at, rowid
+"""
+
+# Reverse walk of ``idx_policy_deployments_deployed_at``: the same tail row as
+# ``_LIST_DEPLOYMENTS_SQL`` without reading the rest of the history.
+_ACTIVE_DEPLOYMENT_SQL = """
+    SELECT id
+    FROM policy_deployments
+    ORDER BY deployed_at DESC, rowid DESC
+    LIMIT 1
+"""
+
+
 def _fetch_one(session: Session, deployment_id: str) -> PolicyDeploymentRecord:
     result = session.execute(
         text(
@@ -142,30 +241,18 @@ def list_policy_deployments() -> List[PolicyDeploymentRecord]:
     """Return stored policy deployments ordered by deployment timestamp."""
 
     with session_scope() as session:
-        rows = session.execute(
-            text(
-                """
-                SELECT
-                    id,
-                    template_id,
-                    deployed_at,
-                    author,
-                    window,
-                    note,
-                    slo_p95_ms,
-                    budget_usage_pct,
-                    incidents_count,
-                    guardrail_score,
-                    created_at,
-                    updated_at
-                FROM policy_deployments
-                ORDER BY deployed_at
-                """
-            )
-        ).mappings()
-        return [PolicyDeploymentRecord.from_row(row) for row in rows]
+        rows = session.connection().exec_driver_sql(_LIST_DEPLOYMENTS_SQL).fetchall()
+    return [PolicyDeploymentRecord.from_values(*row) for row in rows]
+
+
+def active_policy_deployment_id() -> str | None:
+    """Return the id of the most recent deployment, i.e. the active one."""
+
+    with session_scope() as session:
+        return session.connection().exec_driver_sql(_ACTIVE_DEPLOYMENT_SQL).scalar()
 
 
+@policy_deployments_version.bumps
 def create_policy_deployment(
     *,
     template_id: str,
@@ -184,37 +271,7 @@ def create_policy_deployment(
 
     with session_scope() as session:
         session.execute(
-            text(
-                """
-                INSERT INTO policy_deployments (
-                    id,
-                    template_id,
-                    deployed_at,
-                    author,
-                    window,
-                    note,
-                    slo_p95_ms,
-                    budget_usage_pct,
-                    incidents_count,
-                    guardrail_score,
-                    created_at,
-                    updated_at
-                ) VALUES (
-                    :id,
-                    :template_id,
-                    :deployed_at,
-                    :author,
-                    :window,
-                    :note,
-                    :slo_p95_ms,
-                    :budget_usage_pct,
-                    :incidents_count,
-                    :guardrail_score,
-                    :created_at,
-                    :updated_at
-                )
-                """
-            ),
+            _policy_deployments.insert(),
             {
                 "id": deployment_id,
                 "template_id": template_id,
@@ -242,13 +299,13 @@ def get_policy_deployment(deployment_id: str) -> PolicyDeploymentRecord:
         return _fetch_one(session, deployment_id)
 
 
+@policy_deployments_version.bumps
 def delete_policy_deployment(deployment_id: str) -> None:
     """Remove a deployment entry from the store."""
 
     with session_scope() as session:
         result = session.execute(
-            text("DELETE FROM policy_deployments WHERE id = :deployment_id"),
-            {"deployment_id": deployment_id},
+            _policy_deployments.delete().where(_policy_deployments.c.id == deployment_id)
         )
         if result.rowcount == 0:
             raise PolicyDeploymentNotFoundError(deployment_id)
@@ -258,7 +315,9 @@ __all__ = [
     "PolicyDeploymentRecord",
     "PolicyDeploymentNotFoundError",
     "InvalidPolicyTemplateError",
+    "policy_deployments_version",
     "list_policy_deployments",
+    "active_policy_deployment_id",
     "create_policy_deployment",
     "get_policy_deployment",
     "delete_policy_deployment",
@@ -6,11 +6,32 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import List
 
-from sqlalchemy import text
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table, text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from .database import session_scope
+from . import json_codec
+from .database import StoreVersion, session_scope
+
+
+_metadata = MetaData()
+
+# Core table construct mirroring migration 5; statements built from it are
+# cached by SQLAlchemy after their first compilation.
+_policy_overrides = Table(
+    "policy_overrides",
+    _metadata,
+    Column("id", String, primary_key=True),
+    Column("route", String, nullable=False),
+    Column("project", String, nullable=False),
+    Column("template_id", String, nullable=False),
+    Column("max_latency_ms", Integer),
+    Column("max_cost_usd", Float),
+    Column("require_manual_approval", Integer, nullable=False),
+    Column("notes", String),
+    Column("created_at", String, nullable=False),
+    Column("updated_at", String, nullable=False),
+)
 
 
 class PolicyOverrideNotFoundError(KeyError):
@@ -21,6 +42,10 @@ class PolicyOverrideAlreadyExistsError(RuntimeError):
     """Raised when attempting to create a duplicate policy override."""
 
 
+policy_overrides_version = StoreVersion()
+"""Bumped on every policy override write; keys cached listings."""
+
+
 @dataclass(frozen=True)
 class PolicyOverrideRecord:
     """Canonical representation of a stored policy override."""
@@ -70,12 +95,17 @@ class PolicyOverrideRecord:
             "updated_at": self.updated_at,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Encode the record as JSON without building an intermediate dict."""
+
+        return json_codec.dumps_bytes(self)
+
 
 def _now() -> datetime:
     return datetime.now(tz=timezone.utc)
 
 
-def _fetch_one(session: Session, override_id: str) -> PolicyOverrideRecord:
+def _fetch_optional(session: Session, override_id: str) -> PolicyOverrideRecord | None:
     result = session.execute(
         text(
             """
@@ -96,9 +126,14 @@ def _fetch_one(session: Session, override_id: str) -> PolicyOverrideRecord:
         ),
         {"override_id": override_id},
     ).mappings().one_or_none()
-    if result is None:
+    return PolicyOverrideRecord.from_row(result) if result is not None else None
+
+
+def _fetch_one(session: Session, override_id: str) -> PolicyOverrideRecord:
+    record = _fetch_optional(session, override_id)
+    if record is None:
         raise PolicyOverrideNotFoundError(override_id)
-    return PolicyOverrideRecord.from_row(result)
+    return record
 
 
 def list_policy_overrides() -> List[PolicyOverrideRecord]:
@@ -127,8 +162,12 @@ def list_policy_overrides() -> List[PolicyOverrideRecord]:
         return [PolicyOverrideRecord.from_row(row) for row in rows]
 
 
+@policy_overrides_version.memoize()
 def find_policy_override(route: str, project: str) -> PolicyOverrideRecord | None:
-    """Return the most recent override matching the provided route/project."""
+    """Return the most recent override matching the provided route/project.
+
+    Memoised per ``(route, project)`` until the next override write.
+    """
 
     with session_scope() as session:
         row = session.execute(
@@ -158,6 +197,7 @@ def find_policy_override(route: str, project: str) -> PolicyOverrideRecord | Non
     return PolicyOverrideRecord.from_row(row)
 
 
+@policy_overrides_version.bumps
 def create_policy_override(
     *,
     override_id: str,
@@ -175,33 +215,7 @@ def create_policy_override(
     try:
         with session_scope() as session:
             session.execute(
-                text(
-                    """
-                    INSERT INTO policy_overrides (
-                        id,
-                        route,
-                        project,
-                        template_id,
-                        max_latency_ms,
-                        max_cost_usd,
-                        require_manual_approval,
-                        notes,
-                        created_at,
-                        updated_at
-                    ) VALUES (
-                        :id,
-                        :route,
-                        :project,
-                        :template_id,
-                        :max_latency_ms,
-                        :max_cost_usd,
-                        :require_manual_approval,
-                        :notes,
-                        :created_at,
-                        :updated_at
-                    )
-                    """
-                ),
+                _policy_overrides.insert(),
                 {
                     "id": override_id,
                     "route": route,
@@ -229,6 +243,14 @@ def get_policy_override(override_id: str) -> PolicyOverrideRecord:
         return _fetch_one(session, override_id)
 
 
+def lookup_policy_override(override_id: str) -> PolicyOverrideRecord | None:
+    """Return a single policy override, or ``None`` when it does not exist."""
+
+    with session_scope() as session:
+        return _fetch_optional(session, override_id)
+
+
+@policy_overrides_version.bumps
 def update_policy_override(
     override_id: str,
     *,
@@ -245,32 +267,18 @@ def update_policy_override(
     updated_at = _now().isoformat()
     with session_scope() as session:
         result = session.execute(
-            text(
-                """
-                UPDATE policy_overrides
-                SET
-                    route = :route,
-                    project = :project,
-                    template_id = :template_id,
-                    max_latency_ms = :max_latency_ms,
-                    max_cost_usd = :max_cost_usd,
-                    require_manual_approval = :require_manual_approval,
-                    notes = :notes,
-                    updated_at = :updated_at
-                WHERE id = :override_id
-                """
-            ),
-            {
-                "override_id": override_id,
-                "route": route,
-                "project": project,
-                "template_id": template_id,
-                "max_latency_ms": max_latency_ms,
-                "max_cost_usd": max_cost_usd,
-                "require_manual_approval": 1 if require_manual_approval else 0,
-                "notes": notes,
-                "updated_at": updated_at,
-            },
+            _policy_overrides.update()
+            .where(_policy_overrides.c.id == override_id)
+            .values(
+                route=route,
+                project=project,
+                template_id=template_id,
+                max_latency_ms=max_latency_ms,
+                max_cost_usd=max_cost_usd,
+                require_manual_approval=1 if require_manual_approval else 0,
+                notes=notes,
+                updated_at=updated_at,
+            )
         )
         if result.rowcount == 0:
             raise PolicyOverrideNotFoundError(override_id)
@@ -279,19 +287,20 @@ def update_policy_override(
         return _fetch_one(session, override_id)
 
 
+@policy_overrides_version.bumps
 def delete_policy_override(override_id: str) -> None:
     """Remove a policy override from the data store."""
 
     with session_scope() as session:
         result = session.execute(
-            text("DELETE FROM policy_overrides WHERE id = :override_id"),
-            {"override_id": override_id},
+            _policy_overrides.delete().where(_policy_overrides.c.id == override_id)
         )
         if result.rowcount == 0:
             raise PolicyOverrideNotFoundError(override_id)
 
 
 __all__ = [
+    "policy_overrides_version",
     "PolicyOverrideRecord",
     "PolicyOverrideNotFoundError",
     "PolicyOverrideAlreadyExistsError",
@@ -299,6 +308,7 @@ __all__ = [
     "find_policy_override",
     "create_policy_override",
     "get_policy_override",
+    "lookup_policy_override",
     "update_policy_override",
     "delete_policy_override",
 ]
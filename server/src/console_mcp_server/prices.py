@@ -2,16 +2,42 @@
 
 from __future__ import annotations
 
-import json
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Iterable, List
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, List, Mapping, Sequence
 
-from sqlalchemy import text
+from sqlalchemy import Column, Float, MetaData, String, Table, bindparam, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from .database import session_scope
+from . import json_codec
+from .database import StoreVersion, session_scope
+
+
+_metadata = MetaData()
+
+# Core table construct mirroring migration 3; used where SQLAlchemy needs
+# column metadata, e.g. batched INSERT ... RETURNING.
+_price_entries = Table(
+    "price_entries",
+    _metadata,
+    Column("id", String, primary_key=True),
+    Column("provider_id", String, nullable=False),
+    Column("model", String, nullable=False),
+    Column("currency", String, nullable=False),
+    Column("unit", String, nullable=False),
+    Column("input_cost_per_1k", Float),
+    Column("output_cost_per_1k", Float),
+    Column("embedding_cost_per_1k", Float),
+    Column("tags", String, nullable=False),
+    Column("notes", String),
+    Column("effective_at", String),
+    Column("created_at", String, nullable=False),
+    Column("updated_at", String, nullable=False),
+)
 
 
 class PriceEntryNotFoundError(KeyError):
@@ -22,7 +48,20 @@ class PriceEntryAlreadyExistsError(RuntimeError):
     """Raised when attempting to create a duplicate price entry."""
 
 
-@dataclass(frozen=True)
+price_entries_version = StoreVersion()
+"""Bumped on every price table write; keys cached listings."""
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(value: str) -> datetime:
+    # ``fromisoformat`` is already implemented in C, so a regex fast path would be
+    # slower. Stored timestamps repeat heavily instead (created_at == updated_at,
+    # rows written by one bulk insert, shared effective dates), and datetimes are
+    # immutable, so memoizing the parse is safe.
+    return datetime.fromisoformat(value)
+
+
+@dataclass(frozen=True, slots=True)
 class PriceEntryRecord:
     """Canonical representation of a stored price entry."""
 
@@ -41,28 +80,28 @@ class PriceEntryRecord:
     updated_at: datetime
 
     @classmethod
-    def from_row(cls, row: dict[str, object]) -> "PriceEntryRecord":
+    def from_row(cls, row: Mapping[str, Any]) -> "PriceEntryRecord":
+        # TEXT columns already come back as ``str`` from the driver, so they are
+        # passed through without re-coercion.
         def _to_float(value: object | None) -> float | None:
             return float(value) if value is not None else None
 
         tags_raw = row.get("tags") or "[]"
         effective_raw = row.get("effective_at")
-        effective_at = (
-            datetime.fromisoformat(str(effective_raw)) if effective_raw else None
-        )
-        created_at = datetime.fromisoformat(str(row["created_at"]))
-        updated_at = datetime.fromisoformat(str(row["updated_at"]))
+        effective_at = _parse_timestamp(str(effective_raw)) if effective_raw else None
+        created_at = _parse_timestamp(str(row["created_at"]))
+        updated_at = _parse_timestamp(str(row["updated_at"]))
         return cls(
-            id=str(row["id"]),
-            provider_id=str(row["provider_id"]),
-            model=str(row["model"]),
-            currency=str(row["currency"]),
-            unit=str(row["unit"]),
+            id=row["id"],
+            provider_id=row["provider_id"],
+            model=row["model"],
+            currency=row["currency"],
+            unit=row["unit"],
             input_cost_per_1k=_to_float(row.get("input_cost_per_1k")),
             output_cost_per_1k=_to_float(row.get("output_cost_per_1k")),
             embedding_cost_per_1k=_to_float(row.get("embedding_cost_per_1k")),
-            tags=list(json.loads(tags_raw)),
-            notes=str(row["notes"]) if row.get("notes") is not None else None,
+            tags=list(json_codec.loads(tags_raw)),
+            notes=row.get("notes"),
             effective_at=effective_at,
             created_at=created_at,
             updated_at=updated_at,
@@ -85,9 +124,20 @@ class PriceEntryRecord:
             "updated_at": self.updated_at,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Encode the record as JSON without building an intermediate dict."""
+
+        return json_codec.dumps_bytes(self)
+
 
 def _serialize_list(values: Iterable[str]) -> str:
-    return json.dumps(list(values))
+    return _serialize_tags(tuple(values))
+
+
+@lru_cache(maxsize=1024)
+def _serialize_tags(values: tuple[str, ...]) -> str:
+    # Bulk imports repeat the same tag sets across many models.
+    return json_codec.dumps(list(values))
 
 
 def _normalize_cost(value: float | int | None) -> float | None:
@@ -99,74 +149,267 @@ def _normalize_cost(value: float | int | None) -> float | None:
 def _serialize_datetime(value: datetime | None) -> str | None:
     if value is None:
         return None
+    return _serialize_datetime_value(value)
+
+
+@lru_cache(maxsize=256)
+def _serialize_datetime_value(value: datetime) -> str:
     if value.tzinfo is None:
         value = value.replace(tzinfo=timezone.utc)
     return value.astimezone(timezone.utc).isoformat()
 
 
-def _now() -> datetime:
-    return datetime.now(tz=timezone.utc)
+def _now_iso() -> str:
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat()
+
+
+# Statements are built once at import time so every call reuses the same
+# TextClause and hits SQLAlchemy's compiled-statement cache.
+_SELECT_ALL = text(
+    """
+    SELECT
+        id,
+        provider_id,
+        model,
+        currency,
+        unit,
+        input_cost_per_1k,
+        output_cost_per_1k,
+        embedding_cost_per_1k,
+        tags,
+        notes,
+        effective_at,
+        created_at,
+        updated_at
+    FROM price_entries
+    ORDER BY provider_id, model, id
+    """
+)
+
+_SELECT_ONE = text(
+    """
+    SELECT
+        id,
+        provider_id,
+        model,
+        currency,
+        unit,
+        input_cost_per_1k,
+        output_cost_per_1k,
+        embedding_cost_per_1k,
+        tags,
+        notes,
+        effective_at,
+        created_at,
+        updated_at
+    FROM price_entries
+    WHERE id = :entry_id
+    """
+)
+
+_UPDATE_RETURNING = text(
+    """
+    UPDATE price_entries
+    SET
+        provider_id = :provider_id,
+        model = :model,
+        currency = :currency,
+        unit = :unit,
+        input_cost_per_1k = :input_cost_per_1k,
+        output_cost_per_1k = :output_cost_per_1k,
+        embedding_cost_per_1k = :embedding_cost_per_1k,
+        tags = :tags,
+        notes = :notes,
+        effective_at = :effective_at,
+        updated_at = :updated_at
+    WHERE id = :id
+    RETURNING
+        id,
+        provider_id,
+        model,
+        currency,
+        unit,
+        input_cost_per_1k,
+        output_cost_per_1k,
+        embedding_cost_per_1k,
+        tags,
+        notes,
+        effective_at,
+        created_at,
+        updated_at
+    """
+)
+
+_upsert = sqlite_insert(_price_entries)
+_UPSERT = _upsert.on_conflict_do_update(
+    index_elements=[_price_entries.c.id],
+    set_={
+        column.name: _upsert.excluded[column.name]
+        for column in _price_entries.c
+        if column.name not in {"id", "created_at"}
+    },
+)
+
+_DELETE = text("DELETE FROM price_entries WHERE id = :entry_id")
+
+_DELETE_MANY = text("DELETE FROM price_entries WHERE id IN :entry_ids RETURNING id").bindparams(
+    bindparam("entry_ids", expanding=True)
+)
+
+
+def _fetch_optional(session: Session, entry_id: str) -> PriceEntryRecord | None:
+    result = session.execute(_SELECT_ONE, {"entry_id": entry_id}).mappings().one_or_none()
+    return PriceEntryRecord.from_row(result) if result is not None else None
 
 
 def _fetch_one(session: Session, entry_id: str) -> PriceEntryRecord:
-    result = session.execute(
-        text(
-            """
-            SELECT
-                id,
-                provider_id,
-                model,
-                currency,
-                unit,
-                input_cost_per_1k,
-                output_cost_per_1k,
-                embedding_cost_per_1k,
-                tags,
-                notes,
-                effective_at,
-                created_at,
-                updated_at
-            FROM price_entries
-            WHERE id = :entry_id
-            """
-        ),
-        {"entry_id": entry_id},
-    ).mappings().one_or_none()
-    if result is None:
+    record = _fetch_optional(session, entry_id)
+    if record is None:
         raise PriceEntryNotFoundError(entry_id)
-    return PriceEntryRecord.from_row(result)
+    return record
 
 
-def list_price_entries() -> List[PriceEntryRecord]:
-    """Return all stored price entries ordered by provider/model."""
+_ITER_BATCH_SIZE = 1000
+
+
+def iter_price_entries() -> Iterator[PriceEntryRecord]:
+    """Yield stored price entries ordered by provider/model.
+
+    Rows are pulled from the driver in batches of ``_ITER_BATCH_SIZE``, so
+    memory stays bounded by the batch rather than the table size.
+    """
 
     with session_scope() as session:
-        rows = session.execute(
-            text(
-                """
-                SELECT
-                    id,
-                    provider_id,
-                    model,
-                    currency,
-                    unit,
-                    input_cost_per_1k,
-                    output_cost_per_1k,
-                    embedding_cost_per_1k,
-                    tags,
-                    notes,
-                    effective_at,
-                    created_at,
-                    updated_at
-                FROM price_entries
-                ORDER BY provider_id, model, id
-                """
-            )
-        ).mappings()
-        return [PriceEntryRecord.from_row(row) for row in rows]
+        result = session.execute(_SELECT_ALL).yield_per(_ITER_BATCH_SIZE)
+        for batch in result.partitions():
+            yield from _records_from_rows(batch)
 
 
-def create_price_entry(
+@price_entries_version.memoize(maxsize=1)
+def price_entries_by_provider() -> Mapping[str, tuple[PriceEntryRecord, ...]]:
+    """Return the stored price entries grouped by provider, in listing order.
+
+    The grouping is built once per price table version, so per-request pricing
+    lookups skip both the table scan and the provider filter. Callers must treat
+    the mapping as read-only.
+    """
+
+    grouped: dict[str, list[PriceEntryRecord]] = {}
+    for entry in iter_price_entries():
+        grouped.setdefault(entry.provider_id, []).append(entry)
+    return {provider_id: tuple(entries) for provider_id, entries in grouped.items()}
+
+
+def _combined_rate(entry: PriceEntryRecord) -> float:
+    return (entry.input_cost_per_1k or 0.0) + (entry.output_cost_per_1k or 0.0)
+
+
+def _entry_cost(entry: PriceEntryRecord, in_k: float, out_k: float) -> float:
+    return (entry.input_cost_per_1k or 0.0) * in_k + (entry.output_cost_per_1k or 0.0) * out_k
+
+
+@price_entries_version.memoize(maxsize=1)
+def _price_index() -> tuple[
+    Mapping[str, tuple[tuple[int, PriceEntryRecord], ...]],
+    Mapping[tuple[str, str], tuple[tuple[int, PriceEntryRecord], ...]],
+]:
+    """Index ``(listing position, entry)`` pairs by provider and by model.
+
+    Candidates are ordered cheapest first by their combined input + output
+    rate; the sort is stable, so equally priced entries keep listing order.
+    """
+
+    by_provider: dict[str, tuple[tuple[int, PriceEntryRecord], ...]] = {}
+    by_model: dict[tuple[str, str], list[tuple[int, PriceEntryRecord]]] = {}
+    for provider_id, entries in price_entries_by_provider().items():
+        ranked = tuple(sorted(enumerate(entries), key=lambda pair: _combined_rate(pair[1])))
+        by_provider[provider_id] = ranked
+        for pair in ranked:
+            by_model.setdefault((provider_id, pair[1].model), []).append(pair)
+    return by_provider, {key: tuple(pairs) for key, pairs in by_model.items()}
+
+
+def get_best_price(
+    provider_id: str, model: str | None, tokens_in: int, tokens_out: int
+) -> tuple[PriceEntryRecord, float] | None:
+    """Return the cheapest entry for the provider and its unrounded cost.
+
+    Entries for ``model`` win when any exist and ties go to the entry listed
+    first. ``None`` means the provider has no pricing at all. With equal,
+    non-zero input and output token counts the ranking in the index is exact
+    and the first candidate is returned directly; otherwise the (usually
+    short) candidate list is scanned with the actual weights.
+    """
+
+    by_provider, by_model = _price_index()
+    candidates = by_model.get((provider_id, model)) if model else None
+    if not candidates:
+        candidates = by_provider.get(provider_id)
+        if not candidates:
+            return None
+
+    in_k = tokens_in / 1000.0
+    out_k = tokens_out / 1000.0
+    if tokens_in == tokens_out and tokens_in:
+        best = candidates[0][1]
+        return best, _entry_cost(best, in_k, out_k)
+    best_cost, _, best = min(
+        (_entry_cost(entry, in_k, out_k), position, entry) for position, entry in candidates
+    )
+    return best, best_cost
+
+
+def list_price_entries() -> List[PriceEntryRecord]:
+    """Return all stored price entries ordered by provider/model."""
+
+    return list(iter_price_entries())
+
+
+def _records_from_rows(rows: Sequence[Sequence[Any]]) -> List[PriceEntryRecord]:
+    """Build records from positional rows in ``PriceEntryRecord`` field order.
+
+    Equivalent to ``from_row`` per row, but unpacks tuples directly and binds the
+    converters once so large listings avoid per-row mapping lookups.
+    """
+
+    parse = _parse_timestamp
+    loads = json_codec.loads
+    record = PriceEntryRecord
+    return [
+        record(
+            entry_id,
+            provider_id,
+            model,
+            currency,
+            unit,
+            float(input_cost) if input_cost is not None else None,
+            float(output_cost) if output_cost is not None else None,
+            float(embedding_cost) if embedding_cost is not None else None,
+            list(loads(tags or "[]")),
+            notes,
+            parse(str(effective_at)) if effective_at else None,
+            parse(str(created_at)),
+            parse(str(updated_at)),
+        )
+        for (
+            entry_id,
+            provider_id,
+            model,
+            currency,
+            unit,
+            input_cost,
+            output_cost,
+            embedding_cost,
+            tags,
+            notes,
+            effective_at,
+            created_at,
+            updated_at,
+        ) in rows
+    ]
+
+
+def _write_params(
     *,
     entry_id: str,
     provider_id: str,
@@ -179,67 +422,85 @@ def create_price_entry(
     tags: Iterable[str] | None = None,
     notes: str | None = None,
     effective_at: datetime | None = None,
-) -> PriceEntryRecord:
-    """Persist a new price table entry."""
-
-    created_at = updated_at = _now().isoformat()
+    timestamp: str,
+) -> dict[str, Any]:
+    return {
+        "id": entry_id,
+        "provider_id": provider_id,
+        "model": model,
+        "currency": currency,
+        "unit": unit,
+        "input_cost_per_1k": _normalize_cost(input_cost_per_1k),
+        "output_cost_per_1k": _normalize_cost(output_cost_per_1k),
+        "embedding_cost_per_1k": _normalize_cost(embedding_cost_per_1k),
+        "tags": _serialize_list(tags or []),
+        "notes": notes,
+        "effective_at": _serialize_datetime(effective_at),
+        "created_at": timestamp,
+        "updated_at": timestamp,
+    }
+
+
+@price_entries_version.bumps
+def create_price_entries_bulk(entries: Iterable[Mapping[str, Any]]) -> List[PriceEntryRecord]:
+    """Persist several price table entries in a single transaction.
+
+    Each mapping accepts the keyword arguments of :func:`create_price_entry`.
+    Rows are written with one batched ``INSERT ... RETURNING`` and returned in
+    input order.
+    """
+
+    timestamp = _now_iso()
+    params = [_write_params(**entry, timestamp=timestamp) for entry in entries]
+    if not params:
+        return []
     try:
         with session_scope() as session:
-            session.execute(
-                text(
-                    """
-                    INSERT INTO price_entries (
-                        id,
-                        provider_id,
-                        model,
-                        currency,
-                        unit,
-                        input_cost_per_1k,
-                        output_cost_per_1k,
-                        embedding_cost_per_1k,
-                        tags,
-                        notes,
-                        effective_at,
-                        created_at,
-                        updated_at
-                    ) VALUES (
-                        :id,
-                        :provider_id,
-                        :model,
-                        :currency,
-                        :unit,
-                        :input_cost_per_1k,
-                        :output_cost_per_1k,
-                        :embedding_cost_per_1k,
-                        :tags,
-                        :notes,
-                        :effective_at,
-                        :created_at,
-                        :updated_at
-                    )
-                    """
+            rows = session.execute(
+                _price_entries.insert().returning(
+                    *_price_entries.c, sort_by_parameter_order=True
                 ),
-                {
-                    "id": entry_id,
-                    "provider_id": provider_id,
-                    "model": model,
-                    "currency": currency,
-                    "unit": unit,
-                    "input_cost_per_1k": _normalize_cost(input_cost_per_1k),
-                    "output_cost_per_1k": _normalize_cost(output_cost_per_1k),
-                    "embedding_cost_per_1k": _normalize_cost(embedding_cost_per_1k),
-                    "tags": _serialize_list(tags or []),
-                    "notes": notes,
-                    "effective_at": _serialize_datetime(effective_at),
-                    "created_at": created_at,
-                    "updated_at": updated_at,
-                },
-            )
+                params,
+            ).mappings()
+            return [PriceEntryRecord.from_row(row) for row in rows]
     except IntegrityError as exc:  # pragma: no cover - depends on SQLite internals
-        raise PriceEntryAlreadyExistsError(entry_id) from exc
+        raise PriceEntryAlreadyExistsError(", ".join(item["id"] for item in params)) from exc
 
-    with session_scope() as session:
-        return _fetch_one(session, entry_id)
+
+def create_price_entry(
+    *,
+    entry_id: str,
+    provider_id: str,
+    model: str,
+    currency: str = "USD",
+    unit: str = "tokens",
+    input_cost_per_1k: float | int | None = None,
+    output_cost_per_1k: float | int | None = None,
+    embedding_cost_per_1k: float | int | None = None,
+    tags: Iterable[str] | None = None,
+    notes: str | None = None,
+    effective_at: datetime | None = None,
+) -> PriceEntryRecord:
+    """Persist a new price table entry."""
+
+    (record,) = create_price_entries_bulk(
+        [
+            {
+                "entry_id": entry_id,
+                "provider_id": provider_id,
+                "model": model,
+                "currency": currency,
+                "unit": unit,
+                "input_cost_per_1k": input_cost_per_1k,
+                "output_cost_per_1k": output_cost_per_1k,
+                "embedding_cost_per_1k": embedding_cost_per_1k,
+                "tags": tags,
+                "notes": notes,
+                "effective_at": effective_at,
+            }
+        ]
+    )
+    return record
 
 
 def get_price_entry(entry_id: str) -> PriceEntryRecord:
@@ -249,6 +510,13 @@ def get_price_entry(entry_id: str) -> PriceEntryRecord:
         return _fetch_one(session, entry_id)
 
 
+def lookup_price_entry(entry_id: str) -> PriceEntryRecord | None:
+    """Return a single price entry, or ``None`` when it does not exist."""
+
+    with session_scope() as session:
+        return _fetch_optional(session, entry_id)
+
+
 def update_price_entry(
     entry_id: str,
     *,
@@ -265,67 +533,114 @@ def update_price_entry(
 ) -> PriceEntryRecord:
     """Update an existing price entry."""
 
-    updated_at = _now().isoformat()
-    with session_scope() as session:
-        result = session.execute(
-            text(
-                """
-                UPDATE price_entries
-                SET
-                    provider_id = :provider_id,
-                    model = :model,
-                    currency = :currency,
-                    unit = :unit,
-                    input_cost_per_1k = :input_cost_per_1k,
-                    output_cost_per_1k = :output_cost_per_1k,
-                    embedding_cost_per_1k = :embedding_cost_per_1k,
-                    tags = :tags,
-                    notes = :notes,
-                    effective_at = :effective_at,
-                    updated_at = :updated_at
-                WHERE id = :entry_id
-                """
-            ),
+    (record,) = update_price_entries_bulk(
+        [
             {
                 "entry_id": entry_id,
                 "provider_id": provider_id,
                 "model": model,
                 "currency": currency,
                 "unit": unit,
-                "input_cost_per_1k": _normalize_cost(input_cost_per_1k),
-                "output_cost_per_1k": _normalize_cost(output_cost_per_1k),
-                "embedding_cost_per_1k": _normalize_cost(embedding_cost_per_1k),
-                "tags": _serialize_list(tags or []),
+                "input_cost_per_1k": input_cost_per_1k,
+                "output_cost_per_1k": output_cost_per_1k,
+                "embedding_cost_per_1k": embedding_cost_per_1k,
+                "tags": tags,
                 "notes": notes,
-                "effective_at": _serialize_datetime(effective_at),
-                "updated_at": updated_at,
-            },
-        )
-        if result.rowcount == 0:
-            raise PriceEntryNotFoundError(entry_id)
-
+                "effective_at": effective_at,
+            }
+        ]
+    )
+    return record
+
+
+@price_entries_version.bumps
+def update_price_entries_bulk(entries: Iterable[Mapping[str, Any]]) -> List[PriceEntryRecord]:
+    """Update several price entries in a single transaction.
+
+    Each mapping accepts ``entry_id`` plus the keyword arguments of
+    :func:`update_price_entry`. Every ``UPDATE ... RETURNING`` row is trusted as
+    the stored state, so no verification ``SELECT`` is issued. When an id is
+    unknown the transaction is rolled back and :class:`PriceEntryNotFoundError`
+    is raised.
+    """
+
+    timestamp = _now_iso()
+    params = [_write_params(**entry, timestamp=timestamp) for entry in entries]
+    records: List[PriceEntryRecord] = []
     with session_scope() as session:
-        return _fetch_one(session, entry_id)
+        for item in params:
+            row = session.execute(_UPDATE_RETURNING, item).mappings().one_or_none()
+            if row is None:
+                raise PriceEntryNotFoundError(item["id"])
+            records.append(PriceEntryRecord.from_row(row))
+    return records
+
+
+@price_entries_version.bumps
+def bulk_upsert_price_entries(entries: Iterable[Mapping[str, Any]]) -> int:
+    """Insert or replace several price entries with one batched statement.
+
+    Each mapping accepts the keyword arguments of :func:`create_price_entry`.
+    Existing ids keep their ``created_at`` and have every other column
+    overwritten. The engine's ``insertmanyvalues_page_size`` chunks large
+    imports. Returns the number of entries written.
+    """
+
+    timestamp = _now_iso()
+    params = [_write_params(**entry, timestamp=timestamp) for entry in entries]
+    if not params:
+        return 0
+    with session_scope() as session:
+        session.execute(_UPSERT, params)
+    return len(params)
 
 
+@price_entries_version.bumps
 def delete_price_entry(entry_id: str) -> None:
     """Remove a price entry from the data store."""
 
     with session_scope() as session:
-        result = session.execute(
-            text("DELETE FROM price_entries WHERE id = :entry_id"), {"entry_id": entry_id}
-        )
+        result = session.execute(_DELETE, {"entry_id": entry_id})
         if result.rowcount == 0:
             raise PriceEntryNotFoundError(entry_id)
 
 
+@price_entries_version.bumps
+def delete_price_entries(entry_ids: Iterable[str]) -> int:
+    """Remove several price entries with a single ``DELETE ... WHERE id IN``.
+
+    The operation is all-or-nothing: when any id is unknown the transaction is
+    rolled back and :class:`PriceEntryNotFoundError` lists the missing ids.
+    Returns the number of deleted entries.
+    """
+
+    requested = list(dict.fromkeys(entry_ids))
+    if not requested:
+        return 0
+    with session_scope() as session:
+        deleted = set(session.execute(_DELETE_MANY, {"entry_ids": requested}).scalars())
+        missing = [entry_id for entry_id in requested if entry_id not in deleted]
+        if missing:
+            raise PriceEntryNotFoundError(", ".join(missing))
+    return len(deleted)
+
+
 __all__ = [
+    "price_entries_version",
     "PriceEntryRecord",
     "PriceEntryNotFoundError",
     "PriceEntryAlreadyExistsError",
+    "iter_price_entries",
     "list_price_entries",
     "create_price_entry",
+    "create_price_entries_bulk",
+    "bulk_upsert_price_entries",
     "get_price_entry",
+    "get_best_price",
+    "lookup_price_entry",
+    "price_entries_by_provider",
     "update_price_entry",
+    "update_price_entries_bulk",
     "delete_price_entry",
+    "delete_price_entries",
 ]
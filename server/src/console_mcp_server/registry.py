@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
+import threading
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 from uuid import uuid4
 
 from .config import Settings, get_settings
@@ -14,17 +17,89 @@ class ProviderRegistry:
     """Access layer for provider metadata loaded from the manifest."""
 
     def __init__(self, settings: Optional[Settings] = None) -> None:
-        self._settings = settings or get_settings()
+        self._explicit_settings = settings
+        self._settings: Settings | None = None
+        self._settings_version: object = None
+        self._providers: tuple[ProviderSummary, ...] = ()
+        self._ids: tuple[str, ...] = ()
+        self._by_id: Dict[str, ProviderSummary] = {}
+        self._by_id_view: Mapping[str, ProviderSummary] = MappingProxyType(self._by_id)
+        self._fingerprint = ""
+        self._loaded_at = datetime.now(tz=timezone.utc)
+        self._snapshot()
+
+    def _snapshot(self) -> tuple[ProviderSummary, ...]:
+        """Return the cached summaries, rebuilding them when the settings change.
+
+        Without explicit settings the registry follows ``get_settings()``, so a
+        ``reload_settings()`` call is picked up on the next access. Holding a
+        reference to the cached ``Settings`` keeps its identity stable.
+        """
+
+        settings = self._explicit_settings or get_settings()
+        version = getattr(settings, "version", None)
+        if settings is not self._settings or version != self._settings_version:
+            self._providers = tuple(
+                ProviderSummary.model_construct(**provider.model_dump(), is_available=True)
+                for provider in settings.providers
+            )
+            self._ids = tuple(provider.id for provider in self._providers)
+            self._by_id = {provider.id: provider for provider in self._providers}
+            self._by_id_view = MappingProxyType(self._by_id)
+            digest = hashlib.blake2b(digest_size=8)
+            for provider in self._providers:
+                digest.update(provider.model_dump_json().encode())
+            self._fingerprint = digest.hexdigest()
+            self._loaded_at = datetime.now(tz=timezone.utc)
+            self._settings = settings
+            self._settings_version = version
+        return self._providers
 
     @property
     def providers(self) -> List[ProviderSummary]:
-        return [ProviderSummary(**provider.model_dump(), is_available=True) for provider in self._settings.providers]
+        return list(self._snapshot())
+
+    @property
+    def providers_map(self) -> Mapping[str, ProviderSummary]:
+        """Read-only view of the current providers keyed by id, in manifest order."""
+
+        self._snapshot()
+        return self._by_id_view
+
+    @property
+    def provider_ids(self) -> tuple[str, ...]:
+        """Identifiers of the current providers, in manifest order."""
+
+        self._snapshot()
+        return self._ids
+
+    @property
+    def version(self) -> tuple[object, object]:
+        """Identify the current provider snapshot; changes when settings reload."""
+
+        self._snapshot()
+        return (self._settings, self._settings_version)
+
+    @property
+    def fingerprint(self) -> str:
+        """Digest of the current provider summaries; stable across restarts."""
+
+        self._snapshot()
+        return self._fingerprint
+
+    @property
+    def loaded_at(self) -> datetime:
+        """When the current provider snapshot was built."""
+
+        self._snapshot()
+        return self._loaded_at
 
     def get(self, provider_id: str) -> ProviderSummary:
-        for provider in self.providers:
-            if provider.id == provider_id:
-                return provider
-        raise KeyError(provider_id)
+        self._snapshot()
+        try:
+            return self._by_id[provider_id]
+        except KeyError as exc:
+            raise KeyError(provider_id) from exc
 
 
 class SessionRegistry:
@@ -32,9 +107,10 @@ class SessionRegistry:
 
     def __init__(self) -> None:
         self._sessions: Dict[str, Session] = {}
+        self._lock = threading.Lock()
 
     def create(self, provider_id: str, *, reason: Optional[str] = None, client: Optional[str] = None) -> Session:
-        session_id = str(uuid4())
+        session_id = uuid4().hex
         session = Session(
             id=session_id,
             provider_id=provider_id,
@@ -43,15 +119,18 @@ class SessionRegistry:
             reason=reason,
             client=client,
         )
-        self._sessions[session_id] = session
+        with self._lock:
+            self._sessions[session_id] = session
         return session
 
     def list(self) -> List[Session]:
-        return list(self._sessions.values())
+        with self._lock:
+            return list(self._sessions.values())
 
     def get(self, session_id: str) -> Session:
         try:
-            return self._sessions[session_id]
+            with self._lock:
+                return self._sessions[session_id]
         except KeyError as exc:  # pragma: no cover - simple passthrough guard
             raise KeyError(session_id) from exc
 
@@ -3,19 +3,48 @@
 from __future__ import annotations
 
 import difflib
+import hashlib
 import json
+import operator
+import os
 import secrets
+import threading
 import time
 from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any, Dict, Iterable, Mapping, Optional, Sequence
+from typing import (
+    Annotated,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Literal,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+)
 from uuid import uuid4
 
 import structlog
 from fastapi import APIRouter, HTTPException, Query, Request, Response, status
-from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field, ValidationError, field_validator
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import (
+    AnyHttpUrl,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+)
 import yaml
 from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
@@ -26,8 +55,9 @@ from .policies import (
     CostPolicyNotFoundError,
     create_policy,
     delete_policy,
-    get_policy,
     list_policies,
+    lookup_policy,
+    policies_version,
     update_policy,
 )
 from .notifications import list_notifications
@@ -37,19 +67,23 @@ from .policy_overrides import (
     create_policy_override,
     delete_policy_override,
     find_policy_override,
-    get_policy_override,
     list_policy_overrides,
+    lookup_policy_override,
+    policy_overrides_version,
     update_policy_override,
 )
 from .policy_deployments import (
     InvalidPolicyTemplateError,
     PolicyDeploymentNotFoundError,
+    active_policy_deployment_id,
     create_policy_deployment,
     delete_policy_deployment,
     list_policy_deployments,
+    policy_deployments_version,
 )
-from .policy_rollout import build_rollout_plans
-from .policy_templates import list_policy_templates
+from .policy_rollout import RolloutPlan, build_rollout_plans
+from .policy_templates import PolicyTemplate, iter_policy_templates
+from . import json_codec
 from .diagnostics import diagnostics_service
 from .database import Role as RoleModel
 from .database import User as UserModel
@@ -63,8 +97,9 @@ from .marketplace import (
     MarketplaceSignatureError,
     create_marketplace_entry,
     delete_marketplace_entry as delete_marketplace_entry_record,
-    get_marketplace_entry,
     list_marketplace_entries,
+    lookup_marketplace_entry,
+    marketplace_version,
     prepare_marketplace_install,
     update_marketplace_entry as update_marketplace_entry_record,
 )
@@ -73,8 +108,10 @@ from .prices import (
     PriceEntryNotFoundError,
     create_price_entry,
     delete_price_entry,
-    get_price_entry,
-    list_price_entries,
+    get_best_price,
+    iter_price_entries,
+    lookup_price_entry,
+    price_entries_version,
     update_price_entry,
 )
 from .registry import provider_registry, session_registry
@@ -85,7 +122,7 @@ from .routing import (
     RoutingRule,
     build_routes,
     compute_plan,
-    render_plan_result,
+    render_plan_payload,
 )
 from .fixtures import load_response_fixture
 from .config_assistant.intents import AssistantIntent
@@ -137,13 +174,7 @@ from .schemas import (
     PolicyDeploymentCreateRequest,
     PolicyDeploymentResponse,
     PolicyDeploymentsResponse,
-    PolicyRolloutAllocation,
-    PolicyRolloutOverview,
-    PolicyRolloutPlan,
-    PolicyRolloutSegment,
-    PolicyTemplateResponse,
     PolicyTemplatesResponse,
-    NotificationResponse,
     NotificationsResponse,
     HealthStatus,
     PriceEntriesResponse,
@@ -159,6 +190,7 @@ from .schemas import (
     MCPServerResponse,
     MCPServerUpdateRequest,
     MCPServersResponse,
+    ProviderSummary,
     ProvidersResponse,
     DiagnosticsRequest,
     DiagnosticsResponse,
@@ -186,16 +218,14 @@ from .schemas import (
     TelemetryLaneCostResponse,
     MarketplacePerformanceEntry,
     MarketplacePerformanceResponse,
-    SecretMetadataResponse,
     SecretValueResponse,
     SecretWriteRequest,
     SecretTestResponse,
     SecretsResponse,
-    ServerProcessLifecycle,
-    ServerProcessLogEntry,
+    ServerProcessBatchRequest,
+    ServerProcessBatchResponse,
     ServerProcessLogsResponse,
     ServerProcessResponse,
-    ServerProcessState,
     ServerProcessesResponse,
     SessionCreateRequest,
     SessionResponse,
@@ -248,7 +278,7 @@ from .schemas import (
     SecurityUserUpdateRequest,
     SecurityUsersResponse,
 )
-from .secrets import secret_store
+from .secrets import SecretValue, secret_store
 from .secret_validation import (
     ProviderNotRegisteredError,
     SecretNotConfiguredError,
@@ -270,6 +300,9 @@ from .servers import (
     delete_server,
     get_server,
     list_servers,
+    lookup_server,
+    lookup_servers,
+    servers_version,
     update_server,
 )
 from .telemetry import (
@@ -283,8 +316,9 @@ from .telemetry import (
     query_route_breakdown,
     query_runs,
     query_timeseries,
-    render_telemetry_export,
     record_ui_events,
+    stream_telemetry_export,
+    telemetry_watermark,
     TelemetryUIEvent,
 )
 from .schemas_plan import DiffSummary, Plan, PlanExecutionMode, PlanExecutionStatus, PlanStep, Risk
@@ -300,17 +334,373 @@ from .supervisor import (
     ProcessAlreadyRunningError,
     ProcessLogEntry,
     ProcessNotRunningError,
+    ProcessOperation,
     ProcessStartError,
     ProcessSnapshot,
+    ProcessSupervisorError,
     process_supervisor,
 )
 
-router = APIRouter(prefix="/api/v1", tags=["console"])
+
+class JSONBytesResponse(Response):
+    """Response that encodes already JSON-shaped content with :mod:`json_codec`.
+
+    It is the router's default response class, so endpoints returning models
+    are encoded with orjson (when installed) after FastAPI's usual validation.
+    Handlers may also return it directly to bypass ``response_model``
+    revalidation; that is reserved for content built from trusted store records
+    whose dataclass fields match the declared response model.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return json_codec.dumps_bytes(content)
+
+
+router = APIRouter(prefix="/api/v1", tags=["console"], default_response_class=JSONBytesResponse)
 assistant_logger = structlog.get_logger("console.config.routes")
 security_logger = structlog.get_logger("console.security.routes")
 telemetry_logger = structlog.get_logger("console.telemetry.routes")
 
 
+@lru_cache(maxsize=256)
+def _parse_query_timestamp(raw: str) -> datetime | str:
+    """Parse an ISO 8601 bound (``Z`` suffix included), or return it unchanged."""
+
+    candidate = raw[:-1] + "+00:00" if raw.endswith(("Z", "z")) else raw
+    try:
+        return datetime.fromisoformat(candidate)
+    except ValueError:
+        return raw
+
+
+def _cached_query_timestamp(value: Any) -> Any:
+    """Resolve full ISO 8601 datetimes through a memo; dashboards re-send the same bounds.
+
+    Anything else (or a string ``fromisoformat`` rejects) is handed back
+    untouched for pydantic's own datetime parsing and error reporting.
+    """
+
+    if isinstance(value, str) and len(value) >= 19 and value[10] == "T":
+        return _parse_query_timestamp(value)
+    return value
+
+
+# Shared telemetry filter declarations so every endpoint reuses one Query
+# definition per parameter instead of re-declaring it inline.
+TelemetryStartParam = Annotated[
+    datetime | None,
+    BeforeValidator(_cached_query_timestamp),
+    Query(description="Inclusive lower bound (ISO 8601) for filtering telemetry events"),
+]
+TelemetryEndParam = Annotated[
+    datetime | None,
+    BeforeValidator(_cached_query_timestamp),
+    Query(description="Inclusive upper bound (ISO 8601) for filtering telemetry events"),
+]
+TelemetryProviderParam = Annotated[
+    str | None,
+    Query(description="Optional provider identifier to filter telemetry events"),
+]
+TelemetryRouteParam = Annotated[
+    str | None,
+    Query(description="Optional route identifier to filter telemetry events"),
+]
+TelemetryLaneParam = Annotated[
+    str | None,
+    Query(description="Optional lane (economy/balanced/turbo) to limit providers"),
+]
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Evaluate ``If-None-Match`` with the weak comparison RFC 9110 requires.
+
+    Browsers and proxies may send a list of validators, ``W/``-prefixed ones
+    (e.g. after compression) or ``*``; any of them matching counts as a hit.
+    """
+
+    if if_none_match is None:
+        return False
+    # Clients almost always echo the single tag they were given.
+    if if_none_match == etag:
+        return True
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class VersionedResponseCache:
+    """Memoize encoded listing bodies per store version and honour ``If-None-Match``.
+
+    Entries are keyed by listing name and replaced whenever the owning store's
+    :class:`~console_mcp_server.database.StoreVersion` moves, so cache hits skip
+    both the store read and JSON encoding.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[object, bytes, str]] = {}
+
+    def respond(
+        self,
+        request: Request,
+        key: str,
+        version: object,
+        build: Callable[[], Any | None],
+    ) -> Response | None:
+        """Return the cached listing, building it when ``version`` changed.
+
+        ``build`` returns the listing content, or its already encoded ``bytes``
+        (see :func:`_encode_listing`). It may return ``None`` to signal that the
+        current content should not be cached (e.g. an empty store served from
+        fixtures); ``None`` is then returned to the caller.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            content = build()
+            if content is None:
+                return None
+            body = content if isinstance(content, bytes) else json_codec.dumps_bytes(content)
+            etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            entry = (version, body, etag)
+            self._entries[key] = entry
+        return self._serve(request, entry)
+
+    async def respond_offloaded(
+        self,
+        request: Request,
+        key: str,
+        version: object,
+        build: Callable[[], Any | None],
+    ) -> Response | None:
+        """Like :meth:`respond`, but run a rebuild in the threadpool.
+
+        Lets ``async def`` handlers over store-backed listings answer cache hits
+        and 304s on the event loop; only a store read pays the threadpool hop.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            return await run_in_threadpool(self.respond, request, key, version, build)
+        return self._serve(request, entry)
+
+    @staticmethod
+    def _serve(request: Request, entry: tuple[object, bytes, str]) -> Response:
+        _, body, etag = entry
+        # ``no-cache`` lets clients and proxies store the body but revalidate it
+        # on every poll, which the ETag turns into a cheap 304.
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=body, media_type=JSONBytesResponse.media_type, headers=headers)
+
+
+listing_cache = VersionedResponseCache()
+
+
+def _no_content() -> Response:
+    """Build the empty ``204`` answer shared by the delete handlers.
+
+    A fresh object is needed per request: FastAPI attaches the request's
+    background tasks to the returned response and CORS writes into its
+    ``raw_headers``, so a module-level instance would carry state across calls.
+    """
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+def _encode_listing(
+    key: str,
+    items: Iterable[Any],
+    encode: Callable[[Any], bytes] = json_codec.dumps_bytes,
+) -> bytes:
+    """Encode ``{key: [...]}`` one item at a time.
+
+    Fed from a streaming iterator, each record can be released once encoded,
+    so a large listing never holds every record and the full body at once.
+    ``encode`` lets callers supply memoized per-item encoders.
+    """
+
+    return b"".join(
+        (
+            b"{" + json_codec.dumps_bytes(key) + b":[",
+            b",".join(map(encode, items)),
+            b"]}",
+        )
+    )
+
+
+NOTIFICATIONS_TTL_ENV_VAR = "CONSOLE_MCP_NOTIFICATIONS_TTL"
+_DEFAULT_NOTIFICATIONS_TTL = 15.0
+
+
+def _notifications_ttl() -> float:
+    """Read the notification cache TTL (seconds) from the environment."""
+
+    raw = os.getenv(NOTIFICATIONS_TTL_ENV_VAR)
+    if not raw:
+        return _DEFAULT_NOTIFICATIONS_TTL
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        return _DEFAULT_NOTIFICATIONS_TTL
+
+
+class _TTLBodyCache:
+    """Hold the last encoded response body for a short, monotonic TTL.
+
+    Used for polled endpoints whose content changes rarely (notifications) or
+    only by the clock (health), so callers are served the previous body until it
+    expires or :meth:`clear` is called. A TTL of ``0`` disables caching.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._entry: tuple[float, bytes] | None = None
+
+    def get_or_build(self, build: Callable[[], bytes]) -> bytes:
+        # Hits read the entry tuple with a single attribute load; the lock only
+        # serialises rebuilds so concurrent misses build the body once.
+        entry = self._entry
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        with self._lock:
+            entry = self._entry
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+            body = build()
+            if self._ttl > 0:
+                self._entry = (time.monotonic() + self._ttl, body)
+            return body
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entry = None
+
+
+_notifications_cache = _TTLBodyCache(_notifications_ttl())
+
+
+def invalidate_notifications_cache() -> None:
+    """Drop the cached notifications so the next request recomputes them."""
+
+    _notifications_cache.clear()
+
+
+@lru_cache(maxsize=None)
+def _fixture_body(model: type[BaseModel], name: str) -> bytes | None:
+    """Validate and encode a listing fixture once for empty-store fallbacks."""
+
+    fixture = load_response_fixture(model, name)
+    if fixture is None:
+        return None
+    return json_codec.dumps_bytes(fixture.model_dump(mode="json"))
+
+
+class _EncodedRecord(Protocol):
+    def to_json_bytes(self) -> bytes: ...
+
+
+def _record_response(record: _EncodedRecord, status_code: int = status.HTTP_200_OK) -> Response:
+    """Send a trusted store record as its own JSON encoding.
+
+    Shared by the CRUD handlers; ``response_model`` on the route still
+    documents the shape, but no model is built or validated on the way out.
+    """
+
+    return Response(
+        content=record.to_json_bytes(),
+        status_code=status_code,
+        media_type=JSONBytesResponse.media_type,
+    )
+
+
+_STORE_ERRORS: dict[type[Exception], tuple[int, str]] = {
+    CostPolicyNotFoundError: (status.HTTP_404_NOT_FOUND, "Policy '{}' not found"),
+    CostPolicyAlreadyExistsError: (status.HTTP_409_CONFLICT, "Policy '{}' already exists"),
+    PolicyOverrideNotFoundError: (status.HTTP_404_NOT_FOUND, "Policy override '{}' not found"),
+    PolicyOverrideAlreadyExistsError: (
+        status.HTTP_409_CONFLICT,
+        "Policy override '{}' already exists",
+    ),
+    PolicyDeploymentNotFoundError: (status.HTTP_404_NOT_FOUND, "Deployment '{}' not found"),
+    PriceEntryNotFoundError: (status.HTTP_404_NOT_FOUND, "Price entry '{}' not found"),
+    PriceEntryAlreadyExistsError: (status.HTTP_409_CONFLICT, "Price entry '{}' already exists"),
+    MCPServerNotFoundError: (status.HTTP_404_NOT_FOUND, "Server '{}' not found"),
+    MCPServerAlreadyExistsError: (status.HTTP_409_CONFLICT, "Server '{}' already exists"),
+    MarketplaceEntryNotFoundError: (status.HTTP_404_NOT_FOUND, "Marketplace entry '{}' not found"),
+    MarketplaceEntryAlreadyExistsError: (
+        status.HTTP_409_CONFLICT,
+        "Marketplace entry '{}' already exists",
+    ),
+}
+"""Store exceptions surfaced as HTTP errors; messages are formatted with the record id."""
+
+
+def _store_error(error_type: type[Exception], identifier: object) -> HTTPException:
+    """Build the ``HTTPException`` registered in ``_STORE_ERRORS`` for ``error_type``."""
+
+    status_code, detail = _STORE_ERRORS[error_type]
+    return HTTPException(status_code=status_code, detail=detail.format(identifier))
+
+
+def _error_response(status_code: int, detail: str) -> Response:
+    return Response(
+        content=json_codec.dumps_bytes({"detail": detail}),
+        status_code=status_code,
+        media_type=JSONBytesResponse.media_type,
+    )
+
+
+def _store_error_handler(
+    error_type: type[Exception],
+) -> Callable[[Request, Exception], Awaitable[Response]]:
+    status_code, detail = _STORE_ERRORS[error_type]
+
+    async def handle(request: Request, exc: Exception) -> Response:
+        return _error_response(status_code, detail.format(exc.args[0]))
+
+    return handle
+
+
+_SUPERVISOR_ERRORS: dict[type[ProcessSupervisorError], int] = {
+    ProcessAlreadyRunningError: status.HTTP_409_CONFLICT,
+    ProcessNotRunningError: status.HTTP_409_CONFLICT,
+    ProcessStartError: status.HTTP_500_INTERNAL_SERVER_ERROR,
+}
+"""Supervisor exceptions surfaced as HTTP errors; their message is the detail."""
+
+
+def _supervisor_error_handler(
+    error_type: type[ProcessSupervisorError],
+) -> Callable[[Request, Exception], Awaitable[Response]]:
+    status_code = _SUPERVISOR_ERRORS[error_type]
+
+    async def handle(request: Request, exc: Exception) -> Response:
+        return _error_response(status_code, str(exc))
+
+    return handle
+
+
+api_exception_handlers = {
+    **{error_type: _store_error_handler(error_type) for error_type in _STORE_ERRORS},
+    **{error_type: _supervisor_error_handler(error_type) for error_type in _SUPERVISOR_ERRORS},
+}
+"""App-level handlers rendering ``_STORE_ERRORS`` and ``_SUPERVISOR_ERRORS``.
+
+Installed on the application so routes let these errors propagate instead of
+wrapping every handler in a translating ``try``/``except``.
+"""
+
+
 class RoleNotFoundError(LookupError):
     """Raised when attempting to reference a role that does not exist."""
 
@@ -335,14 +725,18 @@ def _parse_timestamp(value: str | None) -> datetime | None:
     return datetime.fromisoformat(value)
 
 
+def _as_utc(value: datetime) -> datetime:
+    """Read naive datetimes as UTC and convert aware ones to UTC."""
+
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
 def _normalize_datetime(value: datetime | None) -> str | None:
     if value is None:
         return None
-    if value.tzinfo is None:
-        value = value.replace(tzinfo=timezone.utc)
-    else:
-        value = value.astimezone(timezone.utc)
-    return value.isoformat()
+    return _as_utc(value).isoformat()
 
 
 def _token_status(token: UserTokenModel, *, now: datetime | None = None) -> str:
@@ -922,7 +1316,7 @@ def delete_security_user(user_id: str, http_request: Request) -> Response:
         resource=f"/security/users/{user_id}",
         metadata=metadata,
     )
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return _no_content()
 
 
 @router.get("/security/roles", response_model=SecurityRolesResponse)
@@ -1000,7 +1394,7 @@ def delete_security_role(role_id: str, http_request: Request) -> Response:
         resource=f"/security/roles/{role_id}",
         metadata=metadata,
     )
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return _no_content()
 
 
 @router.get("/security/api-keys", response_model=ApiKeysResponse)
@@ -1091,7 +1485,7 @@ def revoke_api_key(token_id: str, http_request: Request) -> Response:
         resource=f"/security/api-keys/{token_id}",
         metadata=metadata,
     )
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return _no_content()
 
 
 @router.get("/audit/logs", response_model=AuditLogsResponse)
@@ -2480,18 +2874,52 @@ def reload_artifacts(request: ReloadRequest, http_request: Request) -> ReloadRes
         metadata={"artifact_type": request.artifact_type, "target_path": request.target_path},
     )
     return ReloadResponse(message=message, plan=plan, patch=patch)
+_HEALTH_DEFAULTS = HealthStatus.model_fields
+_HEALTH_PREFIX = b'{"status":%s,"timestamp":' % json_codec.dumps_bytes(
+    _HEALTH_DEFAULTS["status"].default
+)
+_HEALTH_SUFFIX = b',"version":%s}' % json_codec.dumps_bytes(_HEALTH_DEFAULTS["version"].default)
+# Load balancers poll health far more often than once a second; the timestamp is
+# allowed to be that stale.
+_health_cache = _TTLBodyCache(1.0)
+
+
+def _build_health_body() -> bytes:
+    timestamp = json_codec.dumps_bytes(datetime.now().astimezone())
+    return _HEALTH_PREFIX + timestamp + _HEALTH_SUFFIX
+
+
+# Handlers that only read in-memory state (health, provider and session
+# registries) are ``async def`` so they run on the event loop instead of taking a
+# threadpool hop. The process supervisor reads stay sync because they can wait on
+# its lock while a process is spawned, and so do store-backed handlers unless they
+# serve a cached listing through ``listing_cache.respond_offloaded``.
 @router.get("/healthz", response_model=HealthStatus)
-def read_health() -> HealthStatus:
-    """Return an instantaneous health snapshot."""
+async def read_health() -> Response:
+    """Return a health snapshot, refreshed at most once per second.
 
-    return HealthStatus()
+    Only the timestamp varies between calls, so it is spliced into the
+    pre-encoded ``HealthStatus`` defaults.
+    """
+
+    return Response(
+        content=_health_cache.get_or_build(_build_health_body),
+        media_type=JSONBytesResponse.media_type,
+    )
 
 
 @router.get("/providers", response_model=ProvidersResponse)
-def list_providers() -> ProvidersResponse:
+async def list_providers(request: Request) -> Response:
     """List the configured MCP providers available to the console."""
 
-    return ProvidersResponse(providers=provider_registry.providers)
+    return listing_cache.respond(
+        request,
+        "providers",
+        provider_registry.version,
+        lambda: ProvidersResponse.model_construct(
+            providers=provider_registry.providers
+        ).model_dump(mode="json"),
+    )
 
 
 @router.post("/diagnostics/run", response_model=DiagnosticsResponse)
@@ -2867,27 +3295,64 @@ def ingest_ui_telemetry_events(
     return Response(status_code=status.HTTP_202_ACCEPTED)
 
 
+def _telemetry_not_modified(
+    request: Request,
+    response: Response,
+    start: datetime | None,
+    end: datetime | None,
+) -> Response | None:
+    """Attach telemetry cache validators and short-circuit unchanged polls.
+
+    Invalid bounds are rejected first so a conditional request still gets its
+    400. The validators combine the watermark revision with the provider
+    registry, whose lanes and names the aggregates embed. ``If-None-Match``
+    takes precedence; otherwise ``If-Modified-Since`` is compared at the
+    one-second resolution of HTTP dates. Returns a 304 response, or ``None``
+    after setting ``ETag``/``Last-Modified`` on ``response``.
+    """
+
+    if start is not None and end is not None and _as_utc(start) > _as_utc(end):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="start must be before end"
+        )
+
+    revision, modified_at = telemetry_watermark()
+    modified_at = max(modified_at, provider_registry.loaded_at).replace(microsecond=0)
+    headers = {
+        "ETag": f'"telemetry-{revision}-{provider_registry.fingerprint}"',
+        "Last-Modified": format_datetime(modified_at, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, headers["ETag"])
+    else:
+        try:
+            since = parsedate_to_datetime(request.headers.get("if-modified-since", ""))
+        except (TypeError, ValueError):
+            since = None
+        not_modified = since is not None and since.tzinfo is not None and modified_at <= since
+    if not_modified:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
 @router.get("/telemetry/metrics", response_model=TelemetryMetricsResponse)
 def read_telemetry_metrics(
-    start: datetime | None = Query(
-        default=None,
-        description="Inclusive lower bound (ISO 8601) for filtering telemetry events",
-    ),
-    end: datetime | None = Query(
-        default=None,
-        description="Inclusive upper bound (ISO 8601) for filtering telemetry events",
-    ),
-    provider_id: str | None = Query(
-        default=None,
-        description="Optional provider identifier to filter telemetry events",
-    ),
-    route: str | None = Query(
-        default=None,
-        description="Optional route identifier to filter telemetry events",
-    ),
-) -> TelemetryMetricsResponse:
+    request: Request,
+    response: Response,
+    start: TelemetryStartParam = None,
+    end: TelemetryEndParam = None,
+    provider_id: TelemetryProviderParam = None,
+    route: TelemetryRouteParam = None,
+) -> TelemetryMetricsResponse | Response:
     """Return aggregated telemetry metrics for the requested window."""
 
+    not_modified = _telemetry_not_modified(request, response, start, end)
+    if not_modified is not None:
+        return not_modified
+
     try:
         aggregates = aggregate_metrics(
             start=start,
@@ -2904,6 +3369,9 @@ def read_telemetry_metrics(
         if fixture is not None:
             return fixture
 
+    # Aggregates are computed in-process with the declared field types, so
+    # per-item validation is skipped; the envelope is still validated.
+    construct_provider = TelemetryProviderMetrics.model_construct
     return TelemetryMetricsResponse(
         start=aggregates.start,
         end=aggregates.end,
@@ -2914,8 +3382,7 @@ def read_telemetry_metrics(
         avg_latency_ms=aggregates.avg_latency_ms,
         success_rate=aggregates.success_rate,
         providers=[
-            TelemetryProviderMetrics(**provider.to_dict())
-            for provider in aggregates.providers
+            construct_provider(**provider.to_dict()) for provider in aggregates.providers
         ],
         extended=(
             TelemetryMetricsExtended(**aggregates.extended.to_dict())
@@ -2927,25 +3394,19 @@ def read_telemetry_metrics(
 
 @router.get("/telemetry/heatmap", response_model=TelemetryHeatmapResponse)
 def read_telemetry_heatmap(
-    start: datetime | None = Query(
-        default=None,
-        description="Inclusive lower bound (ISO 8601) for filtering telemetry events",
-    ),
-    end: datetime | None = Query(
-        default=None,
-        description="Inclusive upper bound (ISO 8601) for filtering telemetry events",
-    ),
-    provider_id: str | None = Query(
-        default=None,
-        description="Optional provider identifier to filter telemetry events",
-    ),
-    route: str | None = Query(
-        default=None,
-        description="Optional route identifier to filter telemetry events",
-    ),
-) -> TelemetryHeatmapResponse:
+    request: Request,
+    response: Response,
+    start: TelemetryStartParam = None,
+    end: TelemetryEndParam = None,
+    provider_id: TelemetryProviderParam = None,
+    route: TelemetryRouteParam = None,
+) -> TelemetryHeatmapResponse | Response:
     """Return execution counts grouped by provider and day."""
 
+    not_modified = _telemetry_not_modified(request, response, start, end)
+    if not_modified is not None:
+        return not_modified
+
     try:
         buckets = aggregate_heatmap(
             start=start,
@@ -2963,9 +3424,10 @@ def read_telemetry_heatmap(
         if fixture is not None:
             return fixture
 
+    construct_bucket = TelemetryHeatmapBucket.model_construct
     return TelemetryHeatmapResponse(
         buckets=[
-            TelemetryHeatmapBucket(
+            construct_bucket(
                 day=bucket.day,
                 provider_id=bucket.provider_id,
                 run_count=bucket.run_count,
@@ -2977,23 +3439,17 @@ def read_telemetry_heatmap(
 
 @router.get("/telemetry/timeseries", response_model=TelemetryTimeseriesResponse)
 def read_telemetry_timeseries(
-    start: datetime | None = Query(
-        default=None,
-        description="Inclusive lower bound (ISO 8601) for filtering telemetry events",
-    ),
-    end: datetime | None = Query(
-        default=None,
-        description="Inclusive upper bound (ISO 8601) for filtering telemetry events",
-    ),
-    provider_id: str | None = Query(
-        default=None,
-        description="Optional provider identifier to filter telemetry events",
-    ),
-    lane: str | None = Query(
-        default=None,
-        description="Optional lane (economy/balanced/turbo) to limit providers",
-    ),
-) -> TelemetryTimeseriesResponse:
+    request: Request,
+    response: Response,
+    start: TelemetryStartParam = None,
+    end: TelemetryEndParam = None,
+    provider_id: TelemetryProviderParam = None,
+    lane: TelemetryLaneParam = None,
+) -> TelemetryTimeseriesResponse | Response:
+    not_modified = _telemetry_not_modified(request, response, start, end)
+    if not_modified is not None:
+        return not_modified
+
     try:
         points = query_timeseries(
             start=start,
@@ -3011,31 +3467,26 @@ def read_telemetry_timeseries(
         if fixture is not None:
             return fixture
 
+    construct_point = TelemetryTimeseriesPointModel.model_construct
     return TelemetryTimeseriesResponse(
-        items=[TelemetryTimeseriesPointModel(**point.to_dict()) for point in points],
+        items=[construct_point(**point.to_dict()) for point in points],
         next_cursor=None,
     )
 
 
 @router.get("/telemetry/pareto", response_model=TelemetryParetoResponse)
 def read_telemetry_pareto(
-    start: datetime | None = Query(
-        default=None,
-        description="Inclusive lower bound (ISO 8601) for filtering telemetry events",
-    ),
-    end: datetime | None = Query(
-        default=None,
-        description="Inclusive upper bound (ISO 8601) for filtering telemetry events",
-    ),
-    provider_id: str | None = Query(
-        default=None,
-        description="Optional provider identifier to filter telemetry events",
-    ),
-    lane: str | None = Query(
-        default=None,
-        description="Optional lane (economy/balanced/turbo) to limit providers",
-    ),
-) -> TelemetryParetoResponse:
+    request: Request,
+    response: Response,
+    start: TelemetryStartParam = None,
+    end: TelemetryEndParam = None,
+    provider_id: TelemetryProviderParam = None,
+    lane: TelemetryLaneParam = None,
+) -> TelemetryParetoResponse | Response:
+    not_modified = _telemetry_not_modified(request, response, start, end)
+    if not_modified is not None:
+        return not_modified
+
     try:
         breakdown = query_route_breakdown(
             start=start,
@@ -3053,34 +3504,48 @@ def read_telemetry_pareto(
         if fixture is not None:
             return fixture
 
+    construct_entry = TelemetryRouteBreakdownModel.model_construct
     return TelemetryParetoResponse(
-        items=[TelemetryRouteBreakdownModel(**entry.to_dict()) for entry in breakdown],
+        items=[construct_entry(**entry.to_dict()) for entry in breakdown],
         next_cursor=None,
     )
 
 
+_RUN_ENTRY_FIELDS = (
+    "id",
+    "provider_id",
+    "provider_name",
+    "route",
+    "lane",
+    "ts",
+    "tokens_in",
+    "tokens_out",
+    "duration_ms",
+    "status",
+    "cost_usd",
+    "metadata",
+    "experiment_cohort",
+    "experiment_tag",
+)
+"""Response field names, positionally aligned with ``_run_entry_values``."""
+
+_run_entry_values = operator.attrgetter(
+    "record_id",
+    *_RUN_ENTRY_FIELDS[1:],
+)
+
+
+_TIMESTAMP_ADAPTER: TypeAdapter[datetime] = TypeAdapter(datetime)
+"""Parses stored run timestamps with pydantic's coercion (epoch strings included)."""
+
+
 @router.get("/telemetry/runs", response_model=TelemetryRunsResponse)
 def read_telemetry_runs(
-    start: datetime | None = Query(
-        default=None,
-        description="Inclusive lower bound (ISO 8601) for filtering telemetry events",
-    ),
-    end: datetime | None = Query(
-        default=None,
-        description="Inclusive upper bound (ISO 8601) for filtering telemetry events",
-    ),
-    provider_id: str | None = Query(
-        default=None,
-        description="Optional provider identifier to filter telemetry events",
-    ),
-    lane: str | None = Query(
-        default=None,
-        description="Optional lane (economy/balanced/turbo) to limit providers",
-    ),
-    route: str | None = Query(
-        default=None,
-        description="Optional route identifier to filter telemetry events",
-    ),
+    start: TelemetryStartParam = None,
+    end: TelemetryEndParam = None,
+    provider_id: TelemetryProviderParam = None,
+    lane: TelemetryLaneParam = None,
+    route: TelemetryRouteParam = None,
     limit: int = Query(
         default=20,
         ge=1,
@@ -3112,51 +3577,26 @@ def read_telemetry_runs(
         if fixture is not None:
             return fixture
 
-    items = [
-        TelemetryRunEntryModel(
-            id=record.record_id,
-            provider_id=record.provider_id,
-            provider_name=record.provider_name,
-            route=record.route,
-            lane=record.lane,
-            ts=record.ts,
-            tokens_in=record.tokens_in,
-            tokens_out=record.tokens_out,
-            duration_ms=record.duration_ms,
-            status=record.status,
-            cost_usd=record.cost_usd,
-            metadata=record.metadata,
-            experiment_cohort=record.experiment_cohort,
-            experiment_tag=record.experiment_tag,
-        )
-        for record in records
-    ]
+    # ``ts`` is stored as a string; parse it here since model_construct skips
+    # the coercion validation would otherwise perform.
+    construct_run = TelemetryRunEntryModel.model_construct
+    parse_ts = _TIMESTAMP_ADAPTER.validate_python
+    items = []
+    for values in map(_run_entry_values, records):
+        fields = dict(zip(_RUN_ENTRY_FIELDS, values))
+        fields["ts"] = parse_ts(fields["ts"])
+        items.append(construct_run(**fields))
 
     return TelemetryRunsResponse(items=items, next_cursor=next_cursor)
 
 
 @router.get("/telemetry/experiments", response_model=TelemetryExperimentsResponse)
 def read_telemetry_experiments(
-    start: datetime | None = Query(
-        default=None,
-        description="Inclusive lower bound (ISO 8601) for filtering telemetry events",
-    ),
-    end: datetime | None = Query(
-        default=None,
-        description="Inclusive upper bound (ISO 8601) for filtering telemetry events",
-    ),
-    provider_id: str | None = Query(
-        default=None,
-        description="Optional provider identifier to filter telemetry events",
-    ),
-    route: str | None = Query(
-        default=None,
-        description="Optional route identifier to filter telemetry events",
-    ),
-    lane: str | None = Query(
-        default=None,
-        description="Optional lane (economy/balanced/turbo) to limit providers",
-    ),
+    start: TelemetryStartParam = None,
+    end: TelemetryEndParam = None,
+    provider_id: TelemetryProviderParam = None,
+    route: TelemetryRouteParam = None,
+    lane: TelemetryLaneParam = None,
 ) -> TelemetryExperimentsResponse:
     try:
         summaries = query_experiment_summaries(
@@ -3171,33 +3611,19 @@ def read_telemetry_experiments(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
 
+    construct_summary = TelemetryExperimentSummaryEntry.model_construct
     return TelemetryExperimentsResponse(
-        items=[TelemetryExperimentSummaryEntry(**summary.to_dict()) for summary in summaries]
+        items=[construct_summary(**summary.to_dict()) for summary in summaries]
     )
 
 
 @router.get("/telemetry/lane-costs", response_model=TelemetryLaneCostResponse)
 def read_telemetry_lane_costs(
-    start: datetime | None = Query(
-        default=None,
-        description="Inclusive lower bound (ISO 8601) for filtering telemetry events",
-    ),
-    end: datetime | None = Query(
-        default=None,
-        description="Inclusive upper bound (ISO 8601) for filtering telemetry events",
-    ),
-    provider_id: str | None = Query(
-        default=None,
-        description="Optional provider identifier to filter telemetry events",
-    ),
-    route: str | None = Query(
-        default=None,
-        description="Optional route identifier to filter telemetry events",
-    ),
-    lane: str | None = Query(
-        default=None,
-        description="Optional lane (economy/balanced/turbo) to limit providers",
-    ),
+    start: TelemetryStartParam = None,
+    end: TelemetryEndParam = None,
+    provider_id: TelemetryProviderParam = None,
+    route: TelemetryRouteParam = None,
+    lane: TelemetryLaneParam = None,
 ) -> TelemetryLaneCostResponse:
     try:
         lane_costs = compute_lane_cost_breakdown(
@@ -3212,8 +3638,9 @@ def read_telemetry_lane_costs(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
 
+    construct_entry = TelemetryLaneCostEntry.model_construct
     return TelemetryLaneCostResponse(
-        items=[TelemetryLaneCostEntry(**entry.to_dict()) for entry in lane_costs]
+        items=[construct_entry(**entry.to_dict()) for entry in lane_costs]
     )
 
 
@@ -3222,22 +3649,10 @@ def read_telemetry_lane_costs(
     response_model=MarketplacePerformanceResponse,
 )
 def read_marketplace_performance(
-    start: datetime | None = Query(
-        default=None,
-        description="Inclusive lower bound (ISO 8601) for filtering telemetry events",
-    ),
-    end: datetime | None = Query(
-        default=None,
-        description="Inclusive upper bound (ISO 8601) for filtering telemetry events",
-    ),
-    provider_id: str | None = Query(
-        default=None,
-        description="Optional provider identifier to filter telemetry events",
-    ),
-    route: str | None = Query(
-        default=None,
-        description="Optional route identifier to filter telemetry events",
-    ),
+    start: TelemetryStartParam = None,
+    end: TelemetryEndParam = None,
+    provider_id: TelemetryProviderParam = None,
+    route: TelemetryRouteParam = None,
 ) -> MarketplacePerformanceResponse:
     try:
         performance = compute_marketplace_performance(
@@ -3251,8 +3666,9 @@ def read_marketplace_performance(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
 
+    construct_entry = MarketplacePerformanceEntry.model_construct
     return MarketplacePerformanceResponse(
-        items=[MarketplacePerformanceEntry(**entry.to_dict()) for entry in performance]
+        items=[construct_entry(**entry.to_dict()) for entry in performance]
     )
 
 
@@ -3391,7 +3807,7 @@ def export_telemetry(
     """Render telemetry exports in CSV or HTML."""
 
     try:
-        document, media_type = render_telemetry_export(
+        chunks, media_type = stream_telemetry_export(
             format,
             start=start,
             end=end,
@@ -3402,97 +3818,129 @@ def export_telemetry(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
-    return Response(content=document, media_type=media_type)
+    return StreamingResponse(chunks, media_type=media_type)
 
 
 @router.get("/policies", response_model=CostPoliciesResponse)
-def list_cost_policies() -> CostPoliciesResponse:
+def list_cost_policies(request: Request) -> Response:
     """Return the cost policies configured for the console."""
 
-    records = [CostPolicyResponse(**record.to_dict()) for record in list_policies()]
-    return CostPoliciesResponse(policies=records)
+    return listing_cache.respond(
+        request,
+        "policies",
+        policies_version.current(),
+        lambda: {"policies": list_policies()},
+    )
 
 
 @router.get("/policies/overrides", response_model=PolicyOverridesResponse)
-def list_cost_policy_overrides() -> PolicyOverridesResponse:
+def list_cost_policy_overrides(request: Request) -> Response:
     """Return the policy overrides configured for routes and projects."""
 
-    records = [PolicyOverrideResponse(**record.to_dict()) for record in list_policy_overrides()]
-    return PolicyOverridesResponse(overrides=records)
+    return listing_cache.respond(
+        request,
+        "policy_overrides",
+        policy_overrides_version.current(),
+        lambda: {"overrides": list_policy_overrides()},
+    )
+
+
+@lru_cache(maxsize=None)
+def _template_payload(template: PolicyTemplate) -> dict[str, Any]:
+    """Shape a template like ``PolicyTemplateResponse`` (by alias) once.
+
+    Frozen templates hash by value, so edits miss the cache.
+    """
+
+    return {
+        "id": template.id,
+        "name": template.name,
+        "tagline": template.tagline,
+        "description": template.description,
+        "priceDelta": template.price_delta,
+        "latencyTarget": template.latency_target,
+        "guardrailLevel": template.guardrail_level,
+        "features": list(template.features),
+    }
+
+
+def _rollout_plan_payload(plan: RolloutPlan) -> dict[str, Any]:
+    return {
+        "templateId": plan.template_id,
+        "generatedAt": plan.generated_at,
+        "allocations": [
+            {
+                "segment": {
+                    "id": allocation.segment.id,
+                    "name": allocation.segment.name,
+                    "description": allocation.segment.description,
+                },
+                "coverage": allocation.coverage_pct,
+                "providers": [
+                    provider.model_dump(mode="json") for provider in allocation.providers
+                ],
+            }
+            for allocation in plan.allocations
+        ],
+    }
 
 
 @router.get("/policies/templates", response_model=PolicyTemplatesResponse)
-def list_templates() -> PolicyTemplatesResponse:
+def list_templates() -> Response:
     """Expose the available guardrail policy templates."""
 
-    templates = [
-        PolicyTemplateResponse.model_validate(template.to_dict())
-        for template in list_policy_templates()
-    ]
     rollout_plans = build_rollout_plans()
-    if rollout_plans:
-        generated_at = max(plan.generated_at for plan in rollout_plans)
-        rollout = PolicyRolloutOverview(
-            generated_at=generated_at,
-            plans=[
-                PolicyRolloutPlan(
-                    template_id=plan.template_id,
-                    generated_at=plan.generated_at,
-                    allocations=[
-                        PolicyRolloutAllocation(
-                            segment=PolicyRolloutSegment(
-                                id=allocation.segment.id,
-                                name=allocation.segment.name,
-                                description=allocation.segment.description,
-                            ),
-                            coverage=allocation.coverage_pct,
-                            providers=[
-                                provider
-                                for provider in allocation.providers
-                            ],
-                        )
-                        for allocation in plan.allocations
-                    ],
-                )
-                for plan in rollout_plans
-            ],
-        )
-    else:
-        rollout = None
-    return PolicyTemplatesResponse(templates=templates, rollout=rollout)
+    rollout = (
+        {
+            "generatedAt": max(plan.generated_at for plan in rollout_plans),
+            "plans": [_rollout_plan_payload(plan) for plan in rollout_plans],
+        }
+        if rollout_plans
+        else None
+    )
+    return JSONBytesResponse(
+        {
+            "templates": [_template_payload(template) for template in iter_policy_templates()],
+            "rollout": rollout,
+        }
+    )
 
 
 @router.get("/policies/deployments", response_model=PolicyDeploymentsResponse)
-def list_policy_deployment_history() -> PolicyDeploymentsResponse:
+def list_policy_deployment_history(
+    request: Request,
+    fields: Literal["active"] | None = Query(
+        default=None,
+        description="Set to 'active' to return only the active deployment id",
+    ),
+) -> PolicyDeploymentsResponse | Response:
     """Return the recorded deployment history for policy templates."""
 
-    records = [
-        PolicyDeploymentResponse(**record.to_dict())
-        for record in list_policy_deployments()
-    ]
-    active_id = records[-1].id if records else None
-    return PolicyDeploymentsResponse(deployments=records, active_id=active_id)
+    if fields == "active":
+        return PolicyDeploymentsResponse(deployments=[], active_id=active_policy_deployment_id())
+
+    def build() -> dict[str, Any]:
+        records = list_policy_deployments()
+        return {"deployments": records, "active_id": records[-1].id if records else None}
+
+    return listing_cache.respond(
+        request, "policy_deployments", policy_deployments_version.current(), build
+    )
 
 
 @router.post("/policies", response_model=CostPolicyResponse, status_code=status.HTTP_201_CREATED)
-def create_cost_policy(payload: CostPolicyCreateRequest) -> CostPolicyResponse:
+def create_cost_policy(payload: CostPolicyCreateRequest) -> Response:
     """Persist a new cost policy definition."""
 
-    try:
-        record = create_policy(
-            policy_id=payload.id,
-            name=payload.name,
-            description=payload.description,
-            monthly_spend_limit=payload.monthly_spend_limit,
-            currency=payload.currency,
-            tags=payload.tags,
-        )
-    except CostPolicyAlreadyExistsError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Policy '{payload.id}' already exists",
-        ) from exc
-    return CostPolicyResponse(**record.to_dict())
+    record = create_policy(
+        policy_id=payload.id,
+        name=payload.name,
+        description=payload.description,
+        monthly_spend_limit=payload.monthly_spend_limit,
+        currency=payload.currency,
+        tags=payload.tags,
+    )
+    return _record_response(record, status.HTTP_201_CREATED)
 
 
 @router.post(
@@ -3500,26 +3948,20 @@ def create_cost_policy(payload: CostPolicyCreateRequest) -> CostPolicyResponse:
     response_model=PolicyOverrideResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_cost_policy_override(payload: PolicyOverrideCreateRequest) -> PolicyOverrideResponse:
+def create_cost_policy_override(payload: PolicyOverrideCreateRequest) -> Response:
     """Persist a new policy override definition."""
 
-    try:
-        record = create_policy_override(
-            override_id=payload.id,
-            route=payload.route,
-            project=payload.project,
-            template_id=payload.template_id,
-            max_latency_ms=payload.max_latency_ms,
-            max_cost_usd=payload.max_cost_usd,
-            require_manual_approval=payload.require_manual_approval,
-            notes=payload.notes,
-        )
-    except PolicyOverrideAlreadyExistsError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Policy override '{payload.id}' already exists",
-        ) from exc
-    return PolicyOverrideResponse(**record.to_dict())
+    record = create_policy_override(
+        override_id=payload.id,
+        route=payload.route,
+        project=payload.project,
+        template_id=payload.template_id,
+        max_latency_ms=payload.max_latency_ms,
+        max_cost_usd=payload.max_cost_usd,
+        require_manual_approval=payload.require_manual_approval,
+        notes=payload.notes,
+    )
+    return _record_response(record, status.HTTP_201_CREATED)
 
 
 @router.post(
@@ -3529,7 +3971,7 @@ def create_cost_policy_override(payload: PolicyOverrideCreateRequest) -> PolicyO
 )
 def create_policy_deployment_entry(
     payload: PolicyDeploymentCreateRequest,
-) -> PolicyDeploymentResponse:
+) -> Response:
     """Record a new deployment for a guardrail template."""
 
     try:
@@ -3544,229 +3986,177 @@ def create_policy_deployment_entry(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Unknown policy template '{payload.template_id}'",
         ) from exc
-    return PolicyDeploymentResponse(**record.to_dict())
+    return _record_response(record, status.HTTP_201_CREATED)
 
 
 @router.get("/policies/{policy_id}", response_model=CostPolicyResponse)
-def read_cost_policy(policy_id: str) -> CostPolicyResponse:
+def read_cost_policy(policy_id: str) -> Response:
     """Return a single cost policy."""
 
-    try:
-        record = get_policy(policy_id)
-    except CostPolicyNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Policy '{policy_id}' not found",
-        ) from exc
-    return CostPolicyResponse(**record.to_dict())
+    record = lookup_policy(policy_id)
+    if record is None:
+        raise _store_error(CostPolicyNotFoundError, policy_id)
+    return _record_response(record)
 
 
 @router.get("/policies/overrides/{override_id}", response_model=PolicyOverrideResponse)
-def read_cost_policy_override(override_id: str) -> PolicyOverrideResponse:
+def read_cost_policy_override(override_id: str) -> Response:
     """Return a single policy override."""
 
-    try:
-        record = get_policy_override(override_id)
-    except PolicyOverrideNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Policy override '{override_id}' not found",
-        ) from exc
-    return PolicyOverrideResponse(**record.to_dict())
+    record = lookup_policy_override(override_id)
+    if record is None:
+        raise _store_error(PolicyOverrideNotFoundError, override_id)
+    return _record_response(record)
 
 
 @router.delete("/policies/deployments/{deployment_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_policy_deployment_entry(deployment_id: str) -> Response:
     """Remove a recorded policy deployment (used for rollback)."""
 
-    try:
-        delete_policy_deployment(deployment_id)
-    except PolicyDeploymentNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Deployment '{deployment_id}' not found",
-        ) from exc
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    delete_policy_deployment(deployment_id)
+    return _no_content()
 
 
 @router.put("/policies/{policy_id}", response_model=CostPolicyResponse)
-def update_cost_policy(policy_id: str, payload: CostPolicyUpdateRequest) -> CostPolicyResponse:
+def update_cost_policy(policy_id: str, payload: CostPolicyUpdateRequest) -> Response:
     """Update an existing cost policy."""
 
-    try:
-        record = update_policy(
-            policy_id,
-            name=payload.name,
-            description=payload.description,
-            monthly_spend_limit=payload.monthly_spend_limit,
-            currency=payload.currency,
-            tags=payload.tags,
-        )
-    except CostPolicyNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Policy '{policy_id}' not found",
-        ) from exc
-    return CostPolicyResponse(**record.to_dict())
+    record = update_policy(
+        policy_id,
+        name=payload.name,
+        description=payload.description,
+        monthly_spend_limit=payload.monthly_spend_limit,
+        currency=payload.currency,
+        tags=payload.tags,
+    )
+    return _record_response(record)
 
 
 @router.put("/policies/overrides/{override_id}", response_model=PolicyOverrideResponse)
 def update_cost_policy_override(
     override_id: str, payload: PolicyOverrideUpdateRequest
-) -> PolicyOverrideResponse:
+) -> Response:
     """Update an existing policy override."""
 
-    try:
-        record = update_policy_override(
-            override_id,
-            route=payload.route,
-            project=payload.project,
-            template_id=payload.template_id,
-            max_latency_ms=payload.max_latency_ms,
-            max_cost_usd=payload.max_cost_usd,
-            require_manual_approval=payload.require_manual_approval,
-            notes=payload.notes,
-        )
-    except PolicyOverrideNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Policy override '{override_id}' not found",
-        ) from exc
-    return PolicyOverrideResponse(**record.to_dict())
+    record = update_policy_override(
+        override_id,
+        route=payload.route,
+        project=payload.project,
+        template_id=payload.template_id,
+        max_latency_ms=payload.max_latency_ms,
+        max_cost_usd=payload.max_cost_usd,
+        require_manual_approval=payload.require_manual_approval,
+        notes=payload.notes,
+    )
+    return _record_response(record)
 
 
 @router.delete("/policies/{policy_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_cost_policy(policy_id: str) -> Response:
     """Remove a cost policy definition."""
 
-    try:
-        delete_policy(policy_id)
-    except CostPolicyNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Policy '{policy_id}' not found",
-        ) from exc
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    delete_policy(policy_id)
+    return _no_content()
 
 
 @router.delete("/policies/overrides/{override_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_cost_policy_override(override_id: str) -> Response:
     """Remove a policy override definition."""
 
-    try:
-        delete_policy_override(override_id)
-    except PolicyOverrideNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Policy override '{override_id}' not found",
-        ) from exc
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    delete_policy_override(override_id)
+    return _no_content()
 
 
 @router.get("/prices", response_model=PriceEntriesResponse)
-def list_price_table() -> PriceEntriesResponse:
+async def list_price_table(request: Request) -> Response:
     """Return the stored price table entries."""
 
-    records = [PriceEntryResponse(**record.to_dict()) for record in list_price_entries()]
-    return PriceEntriesResponse(entries=records)
+    return await listing_cache.respond_offloaded(
+        request,
+        "prices",
+        price_entries_version.current(),
+        lambda: _encode_listing("entries", iter_price_entries()),
+    )
 
 
 @router.get("/marketplace", response_model=MarketplaceEntriesResponse)
-def list_marketplace_catalog() -> MarketplaceEntriesResponse:
+def list_marketplace_catalog(request: Request) -> Response:
     """Return the curated marketplace catalog."""
 
-    records = [MarketplaceEntryResponse(**record.to_dict()) for record in list_marketplace_entries()]
-    return MarketplaceEntriesResponse(entries=records)
+    return listing_cache.respond(
+        request,
+        "marketplace",
+        marketplace_version.current(),
+        lambda: {"entries": list_marketplace_entries()},
+    )
 
 
 @router.post("/marketplace", response_model=MarketplaceEntryResponse, status_code=status.HTTP_201_CREATED)
-def create_marketplace_catalog_entry(payload: MarketplaceEntryCreateRequest) -> MarketplaceEntryResponse:
+def create_marketplace_catalog_entry(payload: MarketplaceEntryCreateRequest) -> Response:
     """Register a new marketplace entry."""
 
-    try:
-        record = create_marketplace_entry(
-            entry_id=payload.id,
-            name=payload.name,
-            slug=payload.slug,
-            summary=payload.summary,
-            description=payload.description,
-            origin=payload.origin,
-            rating=payload.rating,
-            cost=payload.cost,
-            tags=payload.tags,
-            capabilities=payload.capabilities,
-            repository_url=payload.repository_url,
-            package_path=payload.package_path,
-            manifest_filename=payload.manifest_filename,
-            entrypoint_filename=payload.entrypoint_filename,
-            target_repository=payload.target_repository,
-            signature=payload.signature,
-        )
-    except MarketplaceEntryAlreadyExistsError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Marketplace entry '{payload.id}' already exists",
-        ) from exc
-    return MarketplaceEntryResponse(**record.to_dict())
+    record = create_marketplace_entry(
+        entry_id=payload.id,
+        name=payload.name,
+        slug=payload.slug,
+        summary=payload.summary,
+        description=payload.description,
+        origin=payload.origin,
+        rating=payload.rating,
+        cost=payload.cost,
+        tags=payload.tags,
+        capabilities=payload.capabilities,
+        repository_url=payload.repository_url,
+        package_path=payload.package_path,
+        manifest_filename=payload.manifest_filename,
+        entrypoint_filename=payload.entrypoint_filename,
+        target_repository=payload.target_repository,
+        signature=payload.signature,
+    )
+    return _record_response(record, status.HTTP_201_CREATED)
 
 
 @router.get("/marketplace/{entry_id}", response_model=MarketplaceEntryResponse)
-def read_marketplace_catalog_entry(entry_id: str) -> MarketplaceEntryResponse:
+def read_marketplace_catalog_entry(entry_id: str) -> Response:
     """Return a single marketplace entry."""
 
-    try:
-        record = get_marketplace_entry(entry_id)
-    except MarketplaceEntryNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Marketplace entry '{entry_id}' not found",
-        ) from exc
-    return MarketplaceEntryResponse(**record.to_dict())
+    record = lookup_marketplace_entry(entry_id)
+    if record is None:
+        raise _store_error(MarketplaceEntryNotFoundError, entry_id)
+    return _record_response(record)
 
 
 @router.put("/marketplace/{entry_id}", response_model=MarketplaceEntryResponse)
-def update_marketplace_catalog_entry(entry_id: str, payload: MarketplaceEntryUpdateRequest) -> MarketplaceEntryResponse:
+def update_marketplace_catalog_entry(entry_id: str, payload: MarketplaceEntryUpdateRequest) -> Response:
     """Update a marketplace entry."""
 
-    try:
-        record = update_marketplace_entry_record(
-            entry_id,
-            name=payload.name,
-            slug=payload.slug,
-            summary=payload.summary,
-            description=payload.description,
-            origin=payload.origin,
-            rating=payload.rating,
-            cost=payload.cost,
-            tags=payload.tags,
-            capabilities=payload.capabilities,
-            repository_url=payload.repository_url,
-            package_path=payload.package_path,
-            manifest_filename=payload.manifest_filename,
-            entrypoint_filename=payload.entrypoint_filename,
-            target_repository=payload.target_repository,
-            signature=payload.signature,
-        )
-    except MarketplaceEntryNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Marketplace entry '{entry_id}' not found",
-        ) from exc
-    return MarketplaceEntryResponse(**record.to_dict())
+    record = update_marketplace_entry_record(
+        entry_id,
+        name=payload.name,
+        slug=payload.slug,
+        summary=payload.summary,
+        description=payload.description,
+        origin=payload.origin,
+        rating=payload.rating,
+        cost=payload.cost,
+        tags=payload.tags,
+        capabilities=payload.capabilities,
+        repository_url=payload.repository_url,
+        package_path=payload.package_path,
+        manifest_filename=payload.manifest_filename,
+        entrypoint_filename=payload.entrypoint_filename,
+        target_repository=payload.target_repository,
+        signature=payload.signature,
+    )
+    return _record_response(record)
 
 
 @router.delete("/marketplace/{entry_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_marketplace_catalog_entry(entry_id: str) -> Response:
     """Remove a marketplace entry from the catalog."""
 
-    try:
-        delete_marketplace_entry_record(entry_id)
-    except MarketplaceEntryNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Marketplace entry '{entry_id}' not found",
-        ) from exc
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    delete_marketplace_entry_record(entry_id)
+    return _no_content()
 
 
 @router.post("/marketplace/{entry_id}/import", response_model=MarketplaceImportResponse)
@@ -3793,17 +4183,14 @@ def import_marketplace_entry(entry_id: str, http_request: Request) -> Marketplac
                 },
             )
     except MarketplaceEntryNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Marketplace entry '{entry_id}' not found",
-        ) from exc
+        raise _store_error(MarketplaceEntryNotFoundError, entry_id) from exc
     except (MarketplaceArtifactError, MarketplaceSignatureError) as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(exc),
         ) from exc
 
-    entry_response = MarketplaceEntryResponse(**bundle.entry.to_dict())
+    entry_response = MarketplaceEntryResponse.model_construct(**bundle.entry.to_dict())
     get_audit_logger(http_request).log(
         actor=user,
         action="marketplace.import",
@@ -3819,83 +4206,61 @@ def import_marketplace_entry(entry_id: str, http_request: Request) -> Marketplac
 
 
 @router.post("/prices", response_model=PriceEntryResponse, status_code=status.HTTP_201_CREATED)
-def create_price_table_entry(payload: PriceEntryCreateRequest) -> PriceEntryResponse:
+def create_price_table_entry(payload: PriceEntryCreateRequest) -> Response:
     """Persist a new price table entry."""
 
-    try:
-        record = create_price_entry(
-            entry_id=payload.id,
-            provider_id=payload.provider_id,
-            model=payload.model,
-            currency=payload.currency,
-            unit=payload.unit,
-            input_cost_per_1k=payload.input_cost_per_1k,
-            output_cost_per_1k=payload.output_cost_per_1k,
-            embedding_cost_per_1k=payload.embedding_cost_per_1k,
-            tags=payload.tags,
-            notes=payload.notes,
-            effective_at=payload.effective_at,
-        )
-    except PriceEntryAlreadyExistsError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Price entry '{payload.id}' already exists",
-        ) from exc
-    return PriceEntryResponse(**record.to_dict())
+    record = create_price_entry(
+        entry_id=payload.id,
+        provider_id=payload.provider_id,
+        model=payload.model,
+        currency=payload.currency,
+        unit=payload.unit,
+        input_cost_per_1k=payload.input_cost_per_1k,
+        output_cost_per_1k=payload.output_cost_per_1k,
+        embedding_cost_per_1k=payload.embedding_cost_per_1k,
+        tags=payload.tags,
+        notes=payload.notes,
+        effective_at=payload.effective_at,
+    )
+    return _record_response(record, status.HTTP_201_CREATED)
 
 
 @router.get("/prices/{price_id}", response_model=PriceEntryResponse)
-def read_price_table_entry(price_id: str) -> PriceEntryResponse:
+def read_price_table_entry(price_id: str) -> Response:
     """Return a single price table entry."""
 
-    try:
-        record = get_price_entry(price_id)
-    except PriceEntryNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Price entry '{price_id}' not found",
-        ) from exc
-    return PriceEntryResponse(**record.to_dict())
+    record = lookup_price_entry(price_id)
+    if record is None:
+        raise _store_error(PriceEntryNotFoundError, price_id)
+    return _record_response(record)
 
 
 @router.put("/prices/{price_id}", response_model=PriceEntryResponse)
-def update_price_table_entry(price_id: str, payload: PriceEntryUpdateRequest) -> PriceEntryResponse:
+def update_price_table_entry(price_id: str, payload: PriceEntryUpdateRequest) -> Response:
     """Update an existing price table entry."""
 
-    try:
-        record = update_price_entry(
-            price_id,
-            provider_id=payload.provider_id,
-            model=payload.model,
-            currency=payload.currency,
-            unit=payload.unit,
-            input_cost_per_1k=payload.input_cost_per_1k,
-            output_cost_per_1k=payload.output_cost_per_1k,
-            embedding_cost_per_1k=payload.embedding_cost_per_1k,
-            tags=payload.tags,
-            notes=payload.notes,
-            effective_at=payload.effective_at,
-        )
-    except PriceEntryNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Price entry '{price_id}' not found",
-        ) from exc
-    return PriceEntryResponse(**record.to_dict())
+    record = update_price_entry(
+        price_id,
+        provider_id=payload.provider_id,
+        model=payload.model,
+        currency=payload.currency,
+        unit=payload.unit,
+        input_cost_per_1k=payload.input_cost_per_1k,
+        output_cost_per_1k=payload.output_cost_per_1k,
+        embedding_cost_per_1k=payload.embedding_cost_per_1k,
+        tags=payload.tags,
+        notes=payload.notes,
+        effective_at=payload.effective_at,
+    )
+    return _record_response(record)
 
 
 @router.delete("/prices/{price_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_price_table_entry(price_id: str) -> Response:
     """Remove a price table entry."""
 
-    try:
-        delete_price_entry(price_id)
-    except PriceEntryNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Price entry '{price_id}' not found",
-        ) from exc
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    delete_price_entry(price_id)
+    return _no_content()
 
 
 @router.post("/providers/{provider_id}/sessions", response_model=SessionResponse)
@@ -3914,38 +4279,49 @@ def create_session(provider_id: str, payload: SessionCreateRequest | None = None
         reason=payload.reason if payload else None,
         client=payload.client if payload else None,
     )
+    invalidate_notifications_cache()
     return SessionResponse(session=session, provider=provider)
 
 
 @router.get("/sessions", response_model=SessionsResponse)
-def list_sessions() -> SessionsResponse:
+async def list_sessions() -> Response:
     """Return all in-memory sessions provisioned during the process lifetime."""
 
     sessions = session_registry.list()
     if not sessions:
-        fixture = load_response_fixture(SessionsResponse, "sessions")
-        if fixture is not None:
-            return fixture
-    return SessionsResponse(sessions=sessions)
+        body = _fixture_body(SessionsResponse, "sessions")
+        if body is not None:
+            return Response(content=body, media_type=JSONBytesResponse.media_type)
+    return JSONBytesResponse({"sessions": [session.model_dump() for session in sessions]})
 
 
 @router.get("/secrets", response_model=SecretsResponse)
-def list_secrets() -> SecretsResponse:
+def list_secrets(request: Request) -> Response:
     """Expose metadata about the stored secrets without revealing values."""
 
-    metadata = [
-        SecretMetadataResponse(
-            provider_id=item.provider_id,
-            has_secret=item.has_secret,
-            updated_at=item.updated_at,
-        )
-        for item in secret_store.list()
-    ]
-    return SecretsResponse(secrets=metadata)
+    return listing_cache.respond(
+        request,
+        "secrets",
+        secret_store.version,
+        lambda: {"secrets": secret_store.metadata_payloads()},
+    )
+
+
+def _secret_value_response(record: SecretValue) -> Response:
+    return Response(
+        content=json_codec.dumps_bytes(
+            {
+                "provider_id": record.provider_id,
+                "value": record.value,
+                "updated_at": record.updated_at,
+            }
+        ),
+        media_type=JSONBytesResponse.media_type,
+    )
 
 
 @router.get("/secrets/{provider_id}", response_model=SecretValueResponse)
-def read_secret(provider_id: str) -> SecretValueResponse:
+def read_secret(provider_id: str) -> Response:
     """Return the stored secret for a provider, if present."""
 
     try:
@@ -3955,7 +4331,7 @@ def read_secret(provider_id: str) -> SecretValueResponse:
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Secret for provider '{provider_id}' not found",
         ) from exc
-    return SecretValueResponse(**record.model_dump())
+    return _secret_value_response(record)
 
 
 @router.post("/secrets/{provider_id}/test", response_model=SecretTestResponse)
@@ -3984,11 +4360,11 @@ def test_secret(provider_id: str) -> SecretTestResponse:
 
 
 @router.put("/secrets/{provider_id}", response_model=SecretValueResponse)
-def upsert_secret(provider_id: str, payload: SecretWriteRequest) -> SecretValueResponse:
+def upsert_secret(provider_id: str, payload: SecretWriteRequest) -> Response:
     """Store or update the secret associated with a provider."""
 
     record = secret_store.upsert(provider_id, payload.value)
-    return SecretValueResponse(**record.model_dump())
+    return _secret_value_response(record)
 
 
 @router.delete("/secrets/{provider_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -4002,291 +4378,355 @@ def delete_secret(provider_id: str) -> Response:
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Secret for provider '{provider_id}' not found",
         ) from exc
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return _no_content()
 
 
 @router.get("/servers", response_model=MCPServersResponse)
-def list_mcp_servers() -> MCPServersResponse:
+async def list_mcp_servers(request: Request) -> Response:
     """Return the MCP servers registered with the console."""
 
-    records = [MCPServerResponse(**record.to_dict()) for record in list_servers()]
-    if not records:
-        fixture = load_response_fixture(MCPServersResponse, "servers")
-        if fixture is not None:
-            return fixture
-    return MCPServersResponse(servers=records)
+    def build() -> dict[str, Any] | None:
+        records = list_servers()
+        return {"servers": records} if records else None
+
+    response = await listing_cache.respond_offloaded(
+        request, "servers", servers_version.current(), build
+    )
+    if response is not None:
+        return response
+    body = _fixture_body(MCPServersResponse, "servers") or b'{"servers":[]}'
+    return Response(content=body, media_type=JSONBytesResponse.media_type)
 
 
 @router.get("/servers/processes", response_model=ServerProcessesResponse)
-def list_server_processes() -> ServerProcessesResponse:
+def list_server_processes() -> Response:
     """Return snapshots for all supervised MCP server processes."""
 
     snapshots = process_supervisor.list()
     if not snapshots:
-        fixture = load_response_fixture(ServerProcessesResponse, "server_processes")
-        if fixture is not None:
-            return fixture
-    return ServerProcessesResponse(
-        processes=[_process_state_from_snapshot(snapshot) for snapshot in snapshots]
-    )
+        _process_bodies.clear()
+        body = _fixture_body(ServerProcessesResponse, "server_processes")
+        if body is not None:
+            return Response(content=body, media_type=JSONBytesResponse.media_type)
+    content = _encode_listing("processes", snapshots, _encoded_process)
+    # Every listed server now has a cached body, so extra entries belong to
+    # servers the supervisor pruned; drop them with their logs.
+    if len(_process_bodies) > len(snapshots):
+        listed = {snapshot.server_id for snapshot in snapshots}
+        for server_id in [key for key in tuple(_process_bodies) if key not in listed]:
+            _process_bodies.pop(server_id, None)
+    return Response(content=content, media_type=JSONBytesResponse.media_type)
 
 
 @router.post("/servers", response_model=MCPServerResponse, status_code=status.HTTP_201_CREATED)
-def create_mcp_server(payload: MCPServerCreateRequest) -> MCPServerResponse:
+def create_mcp_server(payload: MCPServerCreateRequest) -> Response:
     """Persist a new MCP server definition."""
 
-    try:
-        record = create_server(
-            server_id=payload.id,
-            name=payload.name,
-            command=payload.command,
-            description=payload.description,
-            tags=payload.tags,
-            capabilities=payload.capabilities,
-            transport=payload.transport,
-        )
-    except MCPServerAlreadyExistsError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Server '{payload.id}' already exists",
-        ) from exc
-    return MCPServerResponse(**record.to_dict())
+    record = create_server(
+        server_id=payload.id,
+        name=payload.name,
+        command=payload.command,
+        description=payload.description,
+        tags=payload.tags,
+        capabilities=payload.capabilities,
+        transport=payload.transport,
+    )
+    return _record_response(record, status.HTTP_201_CREATED)
 
 
 @router.get("/servers/{server_id}", response_model=MCPServerResponse)
-def read_mcp_server(server_id: str) -> MCPServerResponse:
+def read_mcp_server(server_id: str) -> Response:
     """Return a single MCP server."""
 
-    try:
-        record = get_server(server_id)
-    except MCPServerNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Server '{server_id}' not found",
-        ) from exc
-    return MCPServerResponse(**record.to_dict())
+    record = lookup_server(server_id)
+    if record is None:
+        raise _store_error(MCPServerNotFoundError, server_id)
+    return _record_response(record)
 
 
 @router.put("/servers/{server_id}", response_model=MCPServerResponse)
-def update_mcp_server(server_id: str, payload: MCPServerUpdateRequest) -> MCPServerResponse:
+def update_mcp_server(server_id: str, payload: MCPServerUpdateRequest) -> Response:
     """Update an existing MCP server definition."""
 
-    try:
-        record = update_server(
-            server_id,
-            name=payload.name,
-            command=payload.command,
-            description=payload.description,
-            tags=payload.tags,
-            capabilities=payload.capabilities,
-            transport=payload.transport,
-        )
-    except MCPServerNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Server '{server_id}' not found",
-        ) from exc
-    return MCPServerResponse(**record.to_dict())
+    record = update_server(
+        server_id,
+        name=payload.name,
+        command=payload.command,
+        description=payload.description,
+        tags=payload.tags,
+        capabilities=payload.capabilities,
+        transport=payload.transport,
+    )
+    return _record_response(record)
 
 
 @router.delete("/servers/{server_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_mcp_server(server_id: str) -> Response:
     """Remove an MCP server from the catalog."""
 
-    try:
-        delete_server(server_id)
-    except MCPServerNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Server '{server_id}' not found",
-        ) from exc
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    delete_server(server_id)
+    return _no_content()
+
+
+def _log_payload(entry: ProcessLogEntry) -> dict[str, Any]:
+    return {
+        "id": str(entry.id),
+        "timestamp": entry.timestamp,
+        "level": "error" if entry.level == "error" else "info",
+        "message": entry.message,
+    }
+
+
+@lru_cache(maxsize=4096)
+def _encoded_log(entry: ProcessLogEntry) -> bytes:
+    """Encode a log entry once; supervisor entries are frozen and polled repeatedly."""
+
+    return json_codec.dumps_bytes(_log_payload(entry))
+
+
+def _process_fields(snapshot: ProcessSnapshot) -> dict[str, Any]:
+    """Everything in ``ServerProcessState`` except the log tail."""
+
+    return {
+        "server_id": snapshot.server_id,
+        "status": snapshot.status.value,
+        "command": snapshot.command,
+        "pid": snapshot.pid,
+        "started_at": snapshot.started_at,
+        "stopped_at": snapshot.stopped_at,
+        "return_code": snapshot.return_code,
+        "last_error": snapshot.last_error,
+        "cursor": str(snapshot.log_cursor) if snapshot.log_cursor else None,
+    }
+
+
+def _process_payload(snapshot: ProcessSnapshot) -> dict[str, Any]:
+    """Shape a snapshot like ``ServerProcessState`` as plain JSON-encodable data."""
 
+    payload = _process_fields(snapshot)
+    payload["logs"] = [_log_payload(entry) for entry in snapshot.logs]
+    return payload
 
-def _serialize_log(entry: ProcessLogEntry) -> ServerProcessLogEntry:
-    return ServerProcessLogEntry(
-        id=str(entry.id),
-        timestamp=entry.timestamp,
-        level="error" if entry.level == "error" else "info",
-        message=entry.message,
+
+_process_bodies: dict[str, tuple[ProcessSnapshot, bytes]] = {}
+"""Encoded snapshot per server id; pruned by ``list_server_processes``."""
+
+
+def _encoded_process(snapshot: ProcessSnapshot) -> bytes:
+    """Encode a snapshot, reusing the bytes while the supervisor republishes it.
+
+    The supervisor hands out the same snapshot object until the process state
+    changes, so an identity check is enough to detect staleness.
+    """
+
+    cached = _process_bodies.get(snapshot.server_id)
+    if cached is not None and cached[0] is snapshot:
+        return cached[1]
+    # A new log line yields a new snapshot; splice the memoized log entries in
+    # so only the scalar fields and the newest entry are encoded again.
+    body = b"".join(
+        (
+            json_codec.dumps_bytes(_process_fields(snapshot))[:-1],
+            b',"logs":[',
+            b",".join(map(_encoded_log, snapshot.logs)),
+            b"]}",
+        )
     )
+    _process_bodies[snapshot.server_id] = (snapshot, body)
+    return body
+
 
+def _process_response(snapshot: ProcessSnapshot) -> Response:
+    """Wrap a snapshot as ``ServerProcessResponse``, sharing the listing's bytes."""
 
-def _process_state_from_snapshot(snapshot: ProcessSnapshot) -> ServerProcessState:
-    return ServerProcessState(
-        server_id=snapshot.server_id,
-        command=snapshot.command,
-        status=ServerProcessLifecycle(snapshot.status.value),
-        pid=snapshot.pid,
-        started_at=snapshot.started_at,
-        stopped_at=snapshot.stopped_at,
-        return_code=snapshot.return_code,
-        last_error=snapshot.last_error,
-        logs=[_serialize_log(entry) for entry in snapshot.logs],
-        cursor=str(snapshot.log_cursor) if snapshot.log_cursor else None,
+    return Response(
+        content=b'{"process":' + _encoded_process(snapshot) + b"}",
+        media_type=JSONBytesResponse.media_type,
     )
 
 
 @router.get("/servers/{server_id}/process", response_model=ServerProcessResponse)
-def read_server_process(server_id: str) -> ServerProcessResponse:
+def read_server_process(server_id: str) -> Response:
     """Return the supervisor snapshot for a single MCP server."""
 
-    try:
-        record = get_server(server_id)
-    except MCPServerNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Server '{server_id}' not found",
-        ) from exc
+    record = lookup_server(server_id)
+    if record is None:
+        raise _store_error(MCPServerNotFoundError, server_id)
 
     snapshot = process_supervisor.status(server_id, command=record.command)
-    return ServerProcessResponse(process=_process_state_from_snapshot(snapshot))
+    return _process_response(snapshot)
 
 
 @router.post("/servers/{server_id}/process/start", response_model=ServerProcessResponse)
-def start_server_process(server_id: str) -> ServerProcessResponse:
+def start_server_process(server_id: str) -> Response:
     """Start the command configured for an MCP server."""
 
-    try:
-        record = get_server(server_id)
-    except MCPServerNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Server '{server_id}' not found",
-        ) from exc
-
-    try:
-        snapshot = process_supervisor.start(server_id, record.command)
-    except ProcessAlreadyRunningError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Server '{server_id}' is already running",
-        ) from exc
-    except ProcessStartError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(exc),
-        ) from exc
+    record = get_server(server_id)
 
-    return ServerProcessResponse(process=_process_state_from_snapshot(snapshot))
+    snapshot = process_supervisor.start(server_id, record.command)
+    return _process_response(snapshot)
 
 
 @router.post("/servers/{server_id}/process/stop", response_model=ServerProcessResponse)
-def stop_server_process(server_id: str) -> ServerProcessResponse:
+def stop_server_process(server_id: str) -> Response:
     """Terminate the supervised process associated with an MCP server."""
 
-    try:
-        snapshot = process_supervisor.stop(server_id)
-    except ProcessNotRunningError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Server '{server_id}' is not running",
-        ) from exc
-    return ServerProcessResponse(process=_process_state_from_snapshot(snapshot))
+    snapshot = process_supervisor.stop(server_id)
+    return _process_response(snapshot)
 
 
 @router.post("/servers/{server_id}/process/restart", response_model=ServerProcessResponse)
-def restart_server_process(server_id: str) -> ServerProcessResponse:
+def restart_server_process(server_id: str) -> Response:
     """Restart the supervised process associated with an MCP server."""
 
-    try:
-        record = get_server(server_id)
-    except MCPServerNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Server '{server_id}' not found",
-        ) from exc
+    record = get_server(server_id)
 
-    try:
-        snapshot = process_supervisor.restart(server_id, record.command)
-    except ProcessStartError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(exc),
-        ) from exc
+    snapshot = process_supervisor.restart(server_id, record.command)
+    return _process_response(snapshot)
 
-    return ServerProcessResponse(process=_process_state_from_snapshot(snapshot))
+
+@router.post("/servers/processes/batch", response_model=ServerProcessBatchResponse)
+def apply_server_process_batch(payload: ServerProcessBatchRequest) -> Response:
+    """Apply start/stop/restart operations to several MCP servers in one call.
+
+    Servers are resolved with a single query and the supervisor runs the
+    operations in order, locking per action. Each result carries either the
+    process snapshot or the error that the single-server route would have
+    reported.
+    """
+
+    records = lookup_servers(
+        action.server_id for action in payload.actions if action.op != "stop"
+    )
+    resolved: list[tuple[str, ProcessOperation, str | None] | None] = []
+    for action in payload.actions:
+        if action.op == "stop":
+            resolved.append((action.server_id, "stop", None))
+            continue
+        record = records.get(action.server_id)
+        resolved.append(None if record is None else (action.server_id, action.op, record.command))
+
+    outcomes = iter(process_supervisor.apply([item for item in resolved if item is not None]))
+    results: list[dict[str, Any]] = []
+    for action, item in zip(payload.actions, resolved):
+        result: dict[str, Any] = {
+            "server_id": action.server_id,
+            "op": action.op,
+            "process": None,
+            "error": None,
+        }
+        if item is None:
+            result["error"] = _store_error(MCPServerNotFoundError, action.server_id).detail
+        else:
+            outcome = next(outcomes)
+            if isinstance(outcome, ProcessSupervisorError):
+                result["error"] = str(outcome)
+            else:
+                result["process"] = _process_payload(outcome)
+        results.append(result)
+    return JSONBytesResponse({"results": results})
+
+
+@lru_cache(maxsize=1)
+def _fixture_process_logs() -> dict[str, bytes]:
+    """Encode the fixture log bodies served when a server has no supervisor logs."""
+
+    fixture = load_response_fixture(ServerProcessesResponse, "server_processes")
+    if fixture is None:
+        return {}
+    bodies: dict[str, bytes] = {}
+    for process in fixture.processes:
+        bodies.setdefault(
+            process.server_id,
+            json_codec.dumps_bytes(
+                {
+                    "logs": [log.model_dump() for log in process.logs],
+                    "cursor": process.cursor,
+                }
+            ),
+        )
+    return bodies
 
 
 @router.get("/servers/{server_id}/process/logs", response_model=ServerProcessLogsResponse)
 def read_server_process_logs(
-    server_id: str, cursor: str | None = None
-) -> ServerProcessLogsResponse:
-    """Return new log entries emitted by the process supervisor for a server."""
+    server_id: str,
+    cursor: str | None = Query(
+        default=None,
+        pattern=r"^[0-9]*$",
+        max_length=19,
+        description="Last log id already seen",
+    ),
+) -> Response:
+    """Return new log entries emitted by the process supervisor for a server.
 
-    numeric_cursor: int | None = None
-    if cursor:
-        try:
-            numeric_cursor = int(cursor)
-        except ValueError as exc:  # pragma: no cover - FastAPI validation safeguards the path
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cursor must be an integer",
-            ) from exc
+    An empty ``?cursor=`` means "no cursor". When nothing new was logged the
+    cursor is echoed back verbatim (``""`` stays ``""``, ``007`` stays ``"007"``).
+    """
 
-    entries = process_supervisor.logs(server_id, cursor=numeric_cursor)
+    entries = process_supervisor.logs(server_id, cursor=int(cursor) if cursor else None)
     if not entries:
-        fixture = load_response_fixture(ServerProcessesResponse, "server_processes")
-        if fixture is not None:
-            process = next(
-                (proc for proc in fixture.processes if proc.server_id == server_id),
-                None,
-            )
-            if process is not None:
-                return ServerProcessLogsResponse(
-                    logs=[
-                        ServerProcessLogEntry(
-                            id=log.id,
-                            timestamp=log.timestamp,
-                            level=log.level,
-                            message=log.message,
-                        )
-                        for log in process.logs
-                    ],
-                    cursor=process.cursor,
+        # "No new logs" is the common answer for tailing clients: serve it from
+        # pre-encoded bytes without touching the fixture file or pydantic.
+        body = _fixture_process_logs().get(server_id)
+        if body is None:
+            body = b"".join(
+                (
+                    b'{"logs":[],"cursor":',
+                    json_codec.dumps_bytes(cursor),
+                    b"}",
                 )
-        return ServerProcessLogsResponse(logs=[], cursor=cursor)
+            )
+        return Response(content=body, media_type=JSONBytesResponse.media_type)
+
+    body = b"".join(
+        (
+            b'{"logs":[',
+            b",".join(map(_encoded_log, entries)),
+            b'],"cursor":',
+            json_codec.dumps_bytes(str(entries[-1].id)),
+            b"}",
+        )
+    )
+    return Response(content=body, media_type=JSONBytesResponse.media_type)
+
+
+_ROUTE_PROFILE_CACHE_SIZE = 128
+_route_profiles: dict[tuple[str, ...], tuple[object, tuple[RouteProfile, ...]]] = {}
 
-    serialized = [_serialize_log(entry) for entry in entries]
-    latest_cursor = str(entries[-1].id)
-    return ServerProcessLogsResponse(logs=serialized, cursor=latest_cursor)
 
+def _catalog_version() -> tuple[object, object]:
+    """Change marker for simulation inputs: the provider catalog and the price table."""
 
-def _estimate_entry_cost(entry: "PriceEntryRecord", tokens_in: int, tokens_out: int) -> float:
-    input_cost = (entry.input_cost_per_1k or 0.0) * (tokens_in / 1000.0)
-    output_cost = (entry.output_cost_per_1k or 0.0) * (tokens_out / 1000.0)
-    return round(input_cost + output_cost, 4)
+    return (provider_registry.version, price_entries_version.current())
 
 
-def _select_pricing_entry(
-    entries: Iterable["PriceEntryRecord"],
-    provider_id: str,
-    model: str | None,
-    tokens_in: int,
-    tokens_out: int,
-) -> "PriceEntryRecord":
-    filtered = [entry for entry in entries if entry.provider_id == provider_id]
-    if model:
-        preferred = [entry for entry in filtered if entry.model == model]
-        if preferred:
-            filtered = preferred
-    if not filtered:
-        raise LookupError(f"No pricing data found for provider '{provider_id}'")
+def _cached_route_profiles(
+    provider_ids: tuple[str, ...],
+    provider_map: Mapping[str, ProviderSummary],
+    version: tuple[object, object],
+) -> tuple[RouteProfile, ...]:
+    """Return ``build_routes`` for ``provider_ids``, reused while ``version`` holds."""
 
-    def _entry_cost(entry: "PriceEntryRecord") -> float:
-        raw_cost = (entry.input_cost_per_1k or 0.0) * (tokens_in / 1000.0)
-        raw_cost += (entry.output_cost_per_1k or 0.0) * (tokens_out / 1000.0)
-        return raw_cost
+    entry = _route_profiles.get(provider_ids)
+    if entry is None or entry[0] != version:
+        if len(_route_profiles) >= _ROUTE_PROFILE_CACHE_SIZE:
+            _route_profiles.clear()
+        entry = (version, build_routes([provider_map[provider_id] for provider_id in provider_ids]))
+        _route_profiles[provider_ids] = entry
+    return entry[1]
 
-    return min(filtered, key=_entry_cost)
+
+_SIMULATION_CACHE_SIZE = 256
+_all_provider_simulations: dict[tuple[str, str | None, float], tuple[object, bytes]] = {}
 
 
 @router.post("/routing/simulate", response_model=RoutingSimulationResponse)
-def simulate_routing(payload: RoutingSimulationRequest) -> RoutingSimulationResponse:
+def simulate_routing(payload: RoutingSimulationRequest) -> Response:
     """Calculate a routing plan using the deterministic simulator."""
 
-    providers = provider_registry.providers
-    provider_map = {provider.id: provider for provider in providers}
+    provider_map = provider_registry.providers_map
+    catalog_version = _catalog_version()
 
     failover_id = payload.failover_provider_id
     normalized_failover = None if failover_id in (None, "none") else failover_id
@@ -4298,26 +4738,37 @@ def simulate_routing(payload: RoutingSimulationRequest) -> RoutingSimulationResp
             )
 
     if payload.provider_ids:
-        requested_ids = set(payload.provider_ids)
-        missing = requested_ids - provider_map.keys()
+        missing = [
+            provider_id for provider_id in payload.provider_ids if provider_id not in provider_map
+        ]
         if missing:
-            missing_list = ", ".join(sorted(missing))
+            # Reported once each, in request order.
+            missing_list = ", ".join(dict.fromkeys(missing))
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Providers not found: {missing_list}",
             )
-        selected_providers = [provider_map[provider_id] for provider_id in payload.provider_ids]
+        selected_ids = tuple(payload.provider_ids)
     else:
-        selected_providers = providers
+        selected_ids = provider_registry.provider_ids
 
     if normalized_failover:
-        selected_ids = {provider.id for provider in selected_providers}
         if normalized_failover not in selected_ids:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Failover provider must be included in provider_ids",
             )
 
+    # Requests without a provider subset, intents or rules only vary by these
+    # three scalars, so their encoded plans are reused until providers or
+    # prices change.
+    simulation_key: tuple[str, str | None, float] | None = None
+    if not (payload.provider_ids or payload.intents or payload.custom_rules):
+        simulation_key = (payload.strategy, payload.failover_provider_id, payload.volume_millions)
+        cached = _all_provider_simulations.get(simulation_key)
+        if cached is not None and cached[0] == catalog_version:
+            return Response(content=cached[1], media_type=JSONBytesResponse.media_type)
+
     def _normalise_tags(values: Sequence[str]) -> tuple[str, ...]:
         normalised: list[str] = []
         for value in values:
@@ -4360,7 +4811,7 @@ def simulate_routing(payload: RoutingSimulationRequest) -> RoutingSimulationResp
             )
         )
 
-    routes = build_routes(selected_providers)
+    routes = _cached_route_profiles(selected_ids, provider_map, catalog_version)
     plan = compute_plan(
         routes,
         payload.strategy,
@@ -4370,36 +4821,47 @@ def simulate_routing(payload: RoutingSimulationRequest) -> RoutingSimulationResp
         rules=rules_payload,
     )
 
-    if not plan.distribution:
-        fixture = load_response_fixture(RoutingSimulationResponse, "routing_simulation")
-        if fixture is not None:
-            return fixture
+    # The plan is emitted as plain data in the response schema's shape and
+    # encoded in one pass; RoutingSimulationResponse only documents it.
+    body = (
+        _fixture_body(RoutingSimulationResponse, "routing_simulation")
+        if not plan.distribution
+        else None
+    )
+    if body is None:
+        body = json_codec.dumps_bytes(render_plan_payload(plan))
+    if simulation_key is not None:
+        if len(_all_provider_simulations) >= _SIMULATION_CACHE_SIZE:
+            _all_provider_simulations.clear()
+        _all_provider_simulations[simulation_key] = (catalog_version, body)
+    return Response(content=body, media_type=JSONBytesResponse.media_type)
+
 
-    return render_plan_result(plan)
+@lru_cache(maxsize=256)
+def _missing_pricing_body(provider_id: str) -> bytes:
+    """Encode the dry-run 404 once per provider; unpriced providers are polled repeatedly."""
+
+    return json_codec.dumps_bytes(
+        {"detail": f"No pricing data found for provider '{provider_id}'"}
+    )
 
 
 @router.post("/policies/dry-run", response_model=CostDryRunResponse)
-def evaluate_cost_guardrail(payload: CostDryRunRequest) -> CostDryRunResponse:
+def evaluate_cost_guardrail(payload: CostDryRunRequest) -> CostDryRunResponse | Response:
     """Estimate execution cost and validate it against guardrail policies."""
 
-    price_entries = list_price_entries()
-    try:
-        selected_entry = _select_pricing_entry(
-            price_entries,
-            payload.provider_id,
-            payload.model,
-            payload.tokens_in,
-            payload.tokens_out,
-        )
-    except LookupError as exc:
-        raise HTTPException(
+    best_price = get_best_price(
+        payload.provider_id, payload.model, payload.tokens_in, payload.tokens_out
+    )
+    if best_price is None:
+        return Response(
+            content=_missing_pricing_body(payload.provider_id),
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(exc),
-        ) from exc
+            media_type=JSONBytesResponse.media_type,
+        )
+    selected_entry, raw_cost = best_price
 
-    estimated_cost = _estimate_entry_cost(
-        selected_entry, payload.tokens_in, payload.tokens_out
-    )
+    estimated_cost = round(raw_cost, 4)
 
     pricing_reference = CostDryRunPricingReference(
         entry_id=selected_entry.id,
@@ -4453,9 +4915,18 @@ def evaluate_cost_guardrail(payload: CostDryRunRequest) -> CostDryRunResponse:
         message=message,
     )
 @router.get("/notifications", response_model=NotificationsResponse)
-def read_notifications() -> NotificationsResponse:
+async def read_notifications() -> Response:
     """Expose curated notifications for the Console UI."""
 
+    body = _notifications_cache.get_or_build(_build_notifications_body)
+    return Response(content=body, media_type=JSONBytesResponse.media_type)
+
+
+_NOTIFICATIONS_ADAPTER: TypeAdapter[NotificationsResponse] = TypeAdapter(NotificationsResponse)
+"""Validates notification dataclasses by attribute and dumps JSON in one pydantic-core pass."""
+
+
+def _build_notifications_body() -> bytes:
     try:
         notifications = list_notifications()
     except Exception as exc:  # pragma: no cover - defensive guard
@@ -4465,21 +4936,66 @@ def read_notifications() -> NotificationsResponse:
         ) from exc
 
     if not notifications:
-        fixture = load_response_fixture(NotificationsResponse, "notifications")
-        if fixture is not None:
-            return fixture
+        body = _fixture_body(NotificationsResponse, "notifications")
+        if body is not None:
+            return body
 
-    return NotificationsResponse(
-        notifications=[
-            NotificationResponse(
-                id=item.id,
-                severity=item.severity,
-                title=item.title,
-                message=item.message,
-                timestamp=item.timestamp,
-                category=item.category,
-                tags=list(item.tags),
-            )
-            for item in notifications
-        ]
+    response = _NOTIFICATIONS_ADAPTER.validate_python(
+        {"notifications": notifications}, from_attributes=True
+    )
+    return _NOTIFICATIONS_ADAPTER.dump_json(response)
+
+
+# Starlette tries routes in registration order, one regex per route, and the
+# polled read endpoints were registered near the end of a ~100 route table.
+_POLLED_ENDPOINTS = (
+    read_health,
+    list_providers,
+    list_sessions,
+    read_notifications,
+    list_server_processes,
+    read_server_process,
+    read_server_process_logs,
+)
+
+
+def _paths_overlap(first: str, second: str) -> bool:
+    """Whether some request path could match both path templates."""
+
+    if ":path}" in first or ":path}" in second:
+        return True
+    first_parts = first.split("/")
+    second_parts = second.split("/")
+    return len(first_parts) == len(second_parts) and all(
+        left == right or left.startswith("{") or right.startswith("{")
+        for left, right in zip(first_parts, second_parts)
     )
+
+
+def _prioritize_routes(api_router: APIRouter, endpoints: Iterable[Callable[..., Any]]) -> None:
+    """Move the routes serving ``endpoints`` to the front of the match order.
+
+    A route is only moved past earlier routes that can never match the same
+    path, so every request still resolves to the handler it did before.
+    """
+
+    wanted = set(endpoints)
+    promoted: list[Any] = []
+    remaining: list[Any] = []
+    for route in api_router.routes:
+        path = getattr(route, "path_format", None)
+        if (
+            path is not None
+            and getattr(route, "endpoint", None) in wanted
+            and not any(
+                _paths_overlap(path, getattr(earlier, "path_format", "{:path}"))
+                for earlier in remaining
+            )
+        ):
+            promoted.append(route)
+        else:
+            remaining.append(route)
+    api_router.routes[:] = promoted + remaining
+
+
+_prioritize_routes(router, _POLLED_ENDPOINTS)
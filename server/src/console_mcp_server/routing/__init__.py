@@ -4,11 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import re
-from typing import Iterable, Mapping, MutableMapping, Sequence, TYPE_CHECKING
+from typing import Any, Iterable, Mapping, MutableMapping, Sequence, TYPE_CHECKING
 
 from .bandit import BanditStrategy, compute_lane_bandit_weights
 
-from ..prices import list_price_entries
+from ..prices import price_entries_by_provider
 from ..schemas import (
     ProviderSummary,
     RoutingCostProjection,
@@ -141,7 +141,7 @@ def _hash_string(value: str) -> int:
     for char in value:
         hash_value = (hash_value << 5) - hash_value + ord(char)
         hash_value &= 0xFFFFFFFF
-    return abs(hash_value)
+    return hash_value
 
 
 def _seeded_mod(value: str, modulo: int) -> int:
@@ -182,7 +182,7 @@ def _baseline_capacity(provider: ProviderSummary) -> float:
 
 
 def _cost_from_price_entries(
-    price_entries: Mapping[str, list["PriceEntryRecord"]],
+    price_entries: Mapping[str, Sequence["PriceEntryRecord"]],
     provider: ProviderSummary,
     lane: str,
 ) -> float:
@@ -204,10 +204,7 @@ def _cost_from_price_entries(
 
 
 def build_routes(providers: Iterable[ProviderSummary]) -> tuple[RouteProfile, ...]:
-    price_entries: MutableMapping[str, list["PriceEntryRecord"]] = {}
-    for entry in list_price_entries():
-        price_entries.setdefault(entry.provider_id, []).append(entry)
-
+    price_entries = price_entries_by_provider()
     routes: list[RouteProfile] = []
     for provider in providers:
         lane = _determine_lane(provider)
@@ -418,11 +415,15 @@ def compute_plan(
 
     excluded = None
     active_routes: list[RouteProfile] = []
+    routes_by_lane: dict[str, list[RouteProfile]] = {lane: [] for lane in LANES}
     for route in routes_seq:
-        if failover_id and failover_id != "none" and route.id == failover_id:
+        if normalized_failover is not None and route.id == normalized_failover:
             excluded = route
             continue
         active_routes.append(route)
+        lane_routes = routes_by_lane.get(route.lane)
+        if lane_routes is not None:
+            lane_routes.append(route)
 
     if not active_routes:
         empty_cost = CostProjection(total=0.0, per_million=0.0)
@@ -440,8 +441,7 @@ def compute_plan(
     multiplicative_rules = _rule_multipliers(tuple(active_routes), rules_seq)
 
     lane_groups: MutableMapping[str, dict[str, object]] = {}
-    for lane in LANES:
-        lane_routes = [route for route in active_routes if route.lane == lane]
+    for lane, lane_routes in routes_by_lane.items():
         capacity_total = sum(route.capacity_score for route in lane_routes)
         lane_groups[lane] = {
             "routes": lane_routes,
@@ -533,7 +533,7 @@ def compute_plan(
 
 
 def _route_profile_to_schema(route: RouteProfile) -> RoutingRouteProfile:
-    return RoutingRouteProfile(
+    return RoutingRouteProfile.model_construct(
         id=route.id,
         provider=route.provider,
         lane=route.lane,
@@ -548,7 +548,7 @@ def render_plan_result(plan: PlanResult) -> RoutingSimulationResponse:
     """Convert a computed plan into the API response schema."""
 
     distribution = [
-        RoutingDistributionEntry(
+        RoutingDistributionEntry.model_construct(
             route=_route_profile_to_schema(entry.route),
             share=entry.share,
             tokens_millions=entry.tokens_millions,
@@ -584,6 +584,71 @@ def render_plan_result(plan: PlanResult) -> RoutingSimulationResponse:
     )
 
 
+# Rendered route payloads keyed by route id. An entry is only reused for the
+# very same ``RouteProfile`` instance: callers that keep profiles between plans
+# (the API does until providers or prices change) skip the provider dump, while
+# rebuilt profiles simply replace the entry.
+_route_payloads: dict[str, tuple[RouteProfile, dict[str, Any]]] = {}
+
+
+def _route_profile_payload(route: RouteProfile) -> dict[str, Any]:
+    cached = _route_payloads.get(route.id)
+    if cached is not None and cached[0] is route:
+        return cached[1]
+    payload = {
+        "id": route.id,
+        "provider": route.provider.model_dump(),
+        "lane": route.lane,
+        "cost_per_million": route.cost_per_million,
+        "latency_p95": route.latency_p95,
+        "reliability": route.reliability,
+        "capacity_score": route.capacity_score,
+    }
+    _route_payloads[route.id] = (route, payload)
+    return payload
+
+
+def render_plan_payload(plan: PlanResult) -> dict[str, Any]:
+    """Emit the ``RoutingSimulationResponse`` shape as plain JSON-ready data.
+
+    Mirrors ``render_plan_result(plan).model_dump()`` without constructing the
+    nested response models; the computed plan is trusted internal data.
+    """
+
+    context = plan.context
+    return {
+        "context": {
+            "strategy": context.strategy_id,
+            "provider_ids": list(context.provider_ids),
+            "provider_count": len(context.provider_ids),
+            "volume_millions": context.volume_millions,
+            "failover_provider_id": context.failover_id,
+        },
+        "cost": {
+            "total_usd": plan.cost.total,
+            "cost_per_million_usd": plan.cost.per_million,
+        },
+        "latency": {
+            "avg_latency_ms": plan.latency.avg_latency,
+            "reliability_score": plan.latency.reliability_score,
+        },
+        "distribution": [
+            {
+                "route": _route_profile_payload(entry.route),
+                "share": entry.share,
+                "tokens_millions": entry.tokens_millions,
+                "cost": entry.cost,
+            }
+            for entry in plan.distribution
+        ],
+        "excluded_route": (
+            _route_profile_payload(plan.excluded_route)
+            if plan.excluded_route is not None
+            else None
+        ),
+    }
+
+
 def build_simulation_response(
     providers: Iterable[ProviderSummary],
     *,
@@ -622,5 +687,6 @@ __all__ = [
     "build_routes",
     "compute_plan",
     "render_plan_result",
+    "render_plan_payload",
     "build_simulation_response",
 ]
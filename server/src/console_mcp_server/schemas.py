@@ -631,6 +631,32 @@ class ServerProcessesResponse(BaseModel):
     processes: List[ServerProcessState]
 
 
+class ServerProcessBatchAction(BaseModel):
+    """Single lifecycle operation requested in a batch."""
+
+    server_id: str = Field(..., min_length=1)
+    op: Literal["start", "stop", "restart"]
+
+
+class ServerProcessBatchRequest(BaseModel):
+    """Lifecycle operations applied in order by the process supervisor."""
+
+    actions: List[ServerProcessBatchAction] = Field(..., min_length=1, max_length=256)
+
+
+class ServerProcessBatchResult(BaseModel):
+    """Outcome of one batched operation; ``error`` is set when it failed."""
+
+    server_id: str
+    op: Literal["start", "stop", "restart"]
+    process: Optional[ServerProcessState] = None
+    error: Optional[str] = None
+
+
+class ServerProcessBatchResponse(BaseModel):
+    results: List[ServerProcessBatchResult]
+
+
 class ServerProcessLogsResponse(BaseModel):
     """Envelope returned when requesting incremental supervisor logs."""
 
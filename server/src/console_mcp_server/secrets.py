@@ -7,7 +7,7 @@ import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Dict, Optional
 
 from pydantic import BaseModel, Field
 
@@ -60,20 +60,25 @@ class SecretStore:
         if not resolved_path.is_absolute():
             resolved_path = Path(__file__).resolve().parents[3] / resolved_path
         self._path = resolved_path
+        self._writes = 0
 
     @property
     def path(self) -> Path:
         return self._path
 
-    def list(self) -> Iterable[SecretMetadata]:
-        secrets = self._load_all()
+    @property
+    def version(self) -> tuple["SecretStore", int]:
+        """Change marker for cached metadata listings; advances on every write."""
+
+        return (self, self._writes)
+
+    def metadata_payloads(self) -> list[dict[str, object]]:
+        """Return metadata for each stored secret as plain, JSON-ready dicts."""
+
+        # Snapshot the records so concurrent writes cannot resize the cache mid-iteration.
         return [
-            SecretMetadata(
-                provider_id=provider_id,
-                has_secret=True,
-                updated_at=record.updated_at,
-            )
-            for provider_id, record in secrets.items()
+            {"provider_id": record.provider_id, "has_secret": True, "updated_at": record.updated_at}
+            for record in tuple(self._load_all().values())
         ]
 
     def get(self, provider_id: str) -> SecretValue:
@@ -82,7 +87,9 @@ class SecretStore:
             record = secrets[provider_id]
         except KeyError as exc:
             raise KeyError(provider_id) from exc
-        return SecretValue(provider_id=record.provider_id, value=record.value, updated_at=record.updated_at)
+        return SecretValue.model_construct(
+            provider_id=record.provider_id, value=record.value, updated_at=record.updated_at
+        )
 
     def upsert(self, provider_id: str, value: str) -> SecretValue:
         secrets = self._load_all()
@@ -93,7 +100,9 @@ class SecretStore:
             record = SecretRecord.new(provider_id, value)
             secrets[provider_id] = record
         self._write_all(secrets)
-        return SecretValue(provider_id=record.provider_id, value=record.value, updated_at=record.updated_at)
+        return SecretValue.model_construct(
+            provider_id=record.provider_id, value=record.value, updated_at=record.updated_at
+        )
 
     def delete(self, provider_id: str) -> None:
         secrets = self._load_all()
@@ -142,9 +151,11 @@ class SecretStore:
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
         setattr(self, "_cache", secrets)
+        self._writes += 1
 
     def clear_cache(self) -> None:
         setattr(self, "_cache", None)
+        self._writes += 1
 
 
 def _parse_datetime(value: Optional[str]) -> datetime:
@@ -6,11 +6,12 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Iterable, List
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from .database import session_scope
+from . import json_codec
+from .database import StoreVersion, session_scope
 
 
 class MCPServerNotFoundError(KeyError):
@@ -21,6 +22,10 @@ class MCPServerAlreadyExistsError(RuntimeError):
     """Raised when attempting to create an MCP server with a duplicate id."""
 
 
+servers_version = StoreVersion()
+"""Bumped on every MCP server write; keys cached listings."""
+
+
 @dataclass(frozen=True)
 class MCPServerRecord:
     """Canonical representation of a stored MCP server."""
@@ -66,6 +71,11 @@ class MCPServerRecord:
             "updated_at": self.updated_at,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Encode the record as JSON without building an intermediate dict."""
+
+        return json_codec.dumps_bytes(self)
+
 
 def _serialize_list(values: Iterable[str]) -> str:
     return json.dumps(list(values))
@@ -75,7 +85,7 @@ def _now() -> datetime:
     return datetime.now(tz=timezone.utc)
 
 
-def _fetch_one(session: Session, server_id: str) -> MCPServerRecord:
+def _fetch_optional(session: Session, server_id: str) -> MCPServerRecord | None:
     result = session.execute(
         text(
             """
@@ -86,9 +96,14 @@ def _fetch_one(session: Session, server_id: str) -> MCPServerRecord:
         ),
         {"server_id": server_id},
     ).mappings().one_or_none()
-    if result is None:
+    return MCPServerRecord.from_row(result) if result is not None else None
+
+
+def _fetch_one(session: Session, server_id: str) -> MCPServerRecord:
+    record = _fetch_optional(session, server_id)
+    if record is None:
         raise MCPServerNotFoundError(server_id)
-    return MCPServerRecord.from_row(result)
+    return record
 
 
 def list_servers() -> List[MCPServerRecord]:
@@ -107,6 +122,7 @@ def list_servers() -> List[MCPServerRecord]:
         return [MCPServerRecord.from_row(row) for row in rows]
 
 
+@servers_version.bumps
 def create_server(
     *,
     server_id: str,
@@ -154,10 +170,45 @@ def create_server(
 def get_server(server_id: str) -> MCPServerRecord:
     """Return a single MCP server."""
 
+    record = lookup_server(server_id)
+    if record is None:
+        raise MCPServerNotFoundError(server_id)
+    return record
+
+
+@servers_version.memoize()
+def lookup_server(server_id: str) -> MCPServerRecord | None:
+    """Return a single MCP server, or ``None`` when it does not exist.
+
+    Results are memoised per id until :data:`servers_version` moves, so the
+    process endpoints that resolve a server on every call skip SQLite.
+    """
+
     with session_scope() as session:
-        return _fetch_one(session, server_id)
+        return _fetch_optional(session, server_id)
+
+
+def lookup_servers(server_ids: Iterable[str]) -> dict[str, MCPServerRecord]:
+    """Return the stored servers among ``server_ids`` keyed by id, in one query."""
+
+    unique_ids = list(dict.fromkeys(server_ids))
+    if not unique_ids:
+        return {}
+    with session_scope() as session:
+        rows = session.execute(
+            text(
+                """
+                SELECT id, name, command, description, tags, capabilities, transport, created_at, updated_at
+                FROM mcp_servers
+                WHERE id IN :server_ids
+                """
+            ).bindparams(bindparam("server_ids", expanding=True)),
+            {"server_ids": unique_ids},
+        ).mappings()
+        return {str(row["id"]): MCPServerRecord.from_row(row) for row in rows}
 
 
+@servers_version.bumps
 def update_server(
     server_id: str,
     *,
@@ -205,6 +256,7 @@ def update_server(
         return _fetch_one(session, server_id)
 
 
+@servers_version.bumps
 def delete_server(server_id: str) -> None:
     """Remove an MCP server from the data store."""
 
@@ -217,12 +269,15 @@ def delete_server(server_id: str) -> None:
 
 
 __all__ = [
+    "servers_version",
     "MCPServerRecord",
     "MCPServerNotFoundError",
     "MCPServerAlreadyExistsError",
     "list_servers",
     "create_server",
     "get_server",
+    "lookup_server",
+    "lookup_servers",
     "update_server",
     "delete_server",
 ]
@@ -9,7 +9,7 @@ from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Deque, Dict, Iterable, List, Mapping, Optional
+from typing import Deque, Dict, Iterable, List, Literal, Mapping, Optional
 
 
 class ProcessSupervisorError(RuntimeError):
@@ -28,6 +28,9 @@ class ProcessStartError(ProcessSupervisorError):
     """Raised when the supervisor fails to spawn a new process."""
 
 
+ProcessOperation = Literal["start", "stop", "restart"]
+
+
 class ProcessStatus(str, Enum):
     """Normalized lifecycle states tracked for supervised processes."""
 
@@ -98,6 +101,10 @@ class _ManagedProcess:
         self.last_error: Optional[str] = None
         self._logs: Deque[ProcessLogEntry] = deque(maxlen=200)
         self._log_sequence = 0
+        self._snapshot: ProcessSnapshot | None = None
+        # Set between ``request_stop()`` and ``finish_stop()`` so ``refresh()``
+        # leaves recording the exit to the stop that caused it.
+        self._stopping = False
 
     def update_command(self, command: str) -> None:
         self.command = command
@@ -106,6 +113,13 @@ class _ManagedProcess:
     def is_running(self) -> bool:
         return self._popen is not None and self._popen.poll() is None
 
+    @property
+    def has_exited(self) -> bool:
+        """Whether a spawned process ended without ``refresh()`` noticing yet."""
+
+        popen = self._popen
+        return popen is not None and not self._stopping and popen.poll() is not None
+
     def _append_log(self, message: str, *, level: str = "info") -> None:
         self._log_sequence += 1
         entry = ProcessLogEntry(
@@ -124,7 +138,7 @@ class _ManagedProcess:
         return args
 
     def refresh(self) -> None:
-        if self._popen is None:
+        if self._popen is None or self._stopping:
             return
         result = self._popen.poll()
         if result is None:
@@ -173,29 +187,38 @@ class _ManagedProcess:
         else:
             self._append_log("Process started")
 
-    def stop(self, *, timeout: float = 5.0) -> None:
+    def request_stop(self) -> subprocess.Popen[bytes]:
+        """Signal the process to terminate and return it for ``finish_stop()``."""
+
         self.refresh()
         if self._popen is None:
             raise ProcessNotRunningError(f"Server '{self.server_id}' is not running")
 
         self._append_log("Stop requested via supervisor")
         self._popen.terminate()
+        self._stopping = True
+        return self._popen
+
+    @staticmethod
+    def wait_for_exit(popen: subprocess.Popen[bytes], *, timeout: float = 5.0) -> None:
         try:
-            self._popen.wait(timeout=timeout)
+            popen.wait(timeout=timeout)
         except subprocess.TimeoutExpired:
-            self._popen.kill()
-            self._popen.wait(timeout=timeout)
-        finally:
-            return_code = self._popen.returncode
-            self.return_code = return_code
-            self._popen = None
-            self.stopped_at = datetime.now(tz=timezone.utc)
-            self.status = ProcessStatus.STOPPED if return_code == 0 else ProcessStatus.ERROR
-            level = "info" if return_code == 0 else "error"
-            self._append_log(
-                f"Process stopped with code {return_code}",
-                level=level,
-            )
+            popen.kill()
+            popen.wait(timeout=timeout)
+
+    def finish_stop(self, popen: subprocess.Popen[bytes]) -> None:
+        return_code = popen.returncode
+        self._stopping = False
+        self.return_code = return_code
+        self._popen = None
+        self.stopped_at = datetime.now(tz=timezone.utc)
+        self.status = ProcessStatus.STOPPED if return_code == 0 else ProcessStatus.ERROR
+        level = "info" if return_code == 0 else "error"
+        self._append_log(
+            f"Process stopped with code {return_code}",
+            level=level,
+        )
 
     def logs(self, *, cursor: Optional[int] = None) -> Iterable[ProcessLogEntry]:
         if cursor is None:
@@ -205,7 +228,17 @@ class _ManagedProcess:
     def snapshot(self) -> ProcessSnapshot:
         self.refresh()
         pid = self._popen.pid if self._popen is not None and self.is_running else None
-        return ProcessSnapshot(
+        # Every lifecycle transition appends a log entry, so the log sequence
+        # (plus the command, which can change silently) identifies the state.
+        cached = self._snapshot
+        if (
+            cached is not None
+            and cached.log_cursor == self._log_sequence
+            and cached.command == self.command
+            and cached.pid == pid
+        ):
+            return cached
+        self._snapshot = ProcessSnapshot(
             server_id=self.server_id,
             command=self.command,
             status=self.status,
@@ -217,6 +250,7 @@ class _ManagedProcess:
             logs=tuple(self._logs),
             log_cursor=self._log_sequence,
         )
+        return self._snapshot
 
 
 class ProcessSupervisor:
@@ -225,6 +259,17 @@ class ProcessSupervisor:
     def __init__(self) -> None:
         self._processes: Dict[str, _ManagedProcess] = {}
         self._lock = threading.Lock()
+        # Serializes start/stop/restart. Stopping waits for the child without
+        # ``_lock``, so status, log and list readers are never held up by it.
+        self._operations = threading.Lock()
+        # Copy-on-write views read by ``list()`` without taking the lock. Both
+        # tuples are rebuilt under the lock and swapped in by plain assignment.
+        self._members: tuple[_ManagedProcess, ...] = ()
+        self._snapshots: tuple[ProcessSnapshot, ...] = ()
+
+    def _publish_locked(self) -> None:
+        self._members = tuple(self._processes.values())
+        self._snapshots = tuple(process.snapshot() for process in self._members)
 
     def _get_or_create(self, server_id: str, command: str) -> _ManagedProcess:
         process = self._processes.get(server_id)
@@ -236,29 +281,96 @@ class ProcessSupervisor:
         return process
 
     def start(self, server_id: str, command: str, *, env: Optional[Mapping[str, str]] = None) -> ProcessSnapshot:
-        with self._lock:
-            process = self._get_or_create(server_id, command)
-            process.start(env=env)
-            return process.snapshot()
+        with self._operations:
+            return self._start(server_id, command, env)
 
     def stop(self, server_id: str) -> ProcessSnapshot:
+        with self._operations:
+            return self._stop(server_id)
+
+    def restart(self, server_id: str, command: str, *, env: Optional[Mapping[str, str]] = None) -> ProcessSnapshot:
+        with self._operations:
+            return self._restart(server_id, command, env)
+
+    def apply(
+        self, actions: Iterable[tuple[str, ProcessOperation, Optional[str]]]
+    ) -> List[ProcessSnapshot | ProcessSupervisorError]:
+        """Run ``(server_id, op, command)`` actions in order.
+
+        Each action takes and releases the locks on its own, so a batch never
+        holds them for longer than a single start/stop/restart. ``command`` is
+        ignored for ``stop``. Supervisor errors are returned in place of the
+        snapshot so one failing action does not abort the batch.
+        """
+
+        results: List[ProcessSnapshot | ProcessSupervisorError] = []
+        for server_id, op, command in actions:
+            try:
+                if op == "stop":
+                    results.append(self.stop(server_id))
+                elif command is None:
+                    raise ProcessStartError(f"Server '{server_id}' has no command to {op}")
+                elif op == "start":
+                    results.append(self.start(server_id, command))
+                else:
+                    results.append(self.restart(server_id, command))
+            except ProcessSupervisorError as exc:
+                results.append(exc)
+        return results
+
+    # The helpers below expect ``_operations`` to be held and take ``_lock``
+    # themselves, only around the bookkeeping.
+
+    def _start(
+        self, server_id: str, command: str, env: Optional[Mapping[str, str]]
+    ) -> ProcessSnapshot:
+        with self._lock:
+            try:
+                process = self._get_or_create(server_id, command)
+                process.start(env=env)
+                return process.snapshot()
+            finally:
+                self._publish_locked()
+
+    def _stop(self, server_id: str) -> ProcessSnapshot:
         with self._lock:
             process = self._processes.get(server_id)
-            if process is None:
-                raise ProcessNotRunningError(f"Server '{server_id}' is not running")
-            process.stop()
-            return process.snapshot()
+        if process is None:
+            raise ProcessNotRunningError(f"Server '{server_id}' is not running")
+        return self._stop_process(process)
 
-    def restart(self, server_id: str, command: str, *, env: Optional[Mapping[str, str]] = None) -> ProcessSnapshot:
+    def _restart(
+        self, server_id: str, command: str, env: Optional[Mapping[str, str]]
+    ) -> ProcessSnapshot:
         with self._lock:
             process = self._get_or_create(server_id, command)
+        try:
+            self._stop_process(process)
+        except ProcessNotRunningError:
+            # It is acceptable to restart a stopped server; ignore missing state.
+            pass
+        return self._start(server_id, command, env)
+
+    def _stop_process(self, process: _ManagedProcess) -> ProcessSnapshot:
+        """Signal ``process`` and record its exit, waiting without ``_lock``.
+
+        The wait in between can take up to twice the stop timeout; readers
+        keep seeing the process as running meanwhile.
+        """
+
+        with self._lock:
             try:
-                process.stop()
-            except ProcessNotRunningError:
-                # It is acceptable to restart a stopped server; ignore missing state.
-                pass
-            process.start(env=env)
-            return process.snapshot()
+                popen = process.request_stop()
+            finally:
+                self._publish_locked()
+        try:
+            process.wait_for_exit(popen)
+        finally:
+            with self._lock:
+                process.finish_stop(popen)
+                snapshot = process.snapshot()
+                self._publish_locked()
+        return snapshot
 
     def status(self, server_id: str, command: Optional[str] = None) -> ProcessSnapshot:
         with self._lock:
@@ -267,11 +379,21 @@ class ProcessSupervisor:
                 if command is None:
                     raise ProcessNotRunningError(f"Server '{server_id}' has no supervised process")
                 process = self._get_or_create(server_id, command)
+            # ``snapshot()`` may observe an exit, so republish alongside it.
+            self._publish_locked()
             return process.snapshot()
 
-    def list(self) -> List[ProcessSnapshot]:
-        with self._lock:
-            return [process.snapshot() for process in self._processes.values()]
+    def list(self) -> tuple[ProcessSnapshot, ...]:
+        """Return the published snapshots, normally without taking the lock.
+
+        The lock is only taken to republish when a running process exited on
+        its own since the last write, so reported statuses stay current.
+        """
+
+        if any(process.has_exited for process in self._members):
+            with self._lock:
+                self._publish_locked()
+        return self._snapshots
 
     def logs(self, server_id: str, *, cursor: Optional[int] = None) -> List[ProcessLogEntry]:
         with self._lock:
@@ -282,17 +404,19 @@ class ProcessSupervisor:
 
     def stop_all(self) -> List[ProcessSnapshot]:
         snapshots: List[ProcessSnapshot] = []
-        with self._lock:
-            for process in list(self._processes.values()):
+        with self._operations:
+            with self._lock:
+                processes = list(self._processes.values())
+            for process in processes:
                 try:
-                    process.stop()
+                    snapshots.append(self._stop_process(process))
                 except ProcessNotRunningError:
-                    pass
-                snapshots.append(process.snapshot())
+                    with self._lock:
+                        snapshots.append(process.snapshot())
         return snapshots
 
     def prune(self, *, only_finished: bool = True) -> None:
-        with self._lock:
+        with self._operations, self._lock:
             if only_finished:
                 to_remove = [
                     server_id
@@ -305,6 +429,7 @@ class ProcessSupervisor:
                 if self._processes[server_id].is_running:
                     continue
                 self._processes.pop(server_id, None)
+            self._publish_locked()
 
 
 process_supervisor = ProcessSupervisor()
@@ -315,6 +440,7 @@ __all__ = [
     "ProcessSnapshot",
     "ProcessLogEntry",
     "ProcessStatus",
+    "ProcessOperation",
     "ProcessSupervisorError",
     "ProcessAlreadyRunningError",
     "ProcessNotRunningError",
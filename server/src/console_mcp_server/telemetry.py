@@ -14,13 +14,13 @@ import math
 from pathlib import Path
 from typing import Iterable, Iterator, Mapping, MutableMapping, Sequence, cast
 
-from sqlalchemy import text
+from sqlalchemy import TextClause, text
 from sqlalchemy.engine import Connection
 
 from .database import bootstrap_database
 from .log_model import TelemetryLogRecord
 from .marketplace import list_marketplace_entries
-from .prices import list_price_entries
+from .prices import iter_price_entries
 from .registry import provider_registry
 from .routing import build_routes
 
@@ -304,6 +304,8 @@ __all__ = [
     "compute_lane_cost_breakdown",
     "compute_marketplace_performance",
     "render_telemetry_export",
+    "stream_telemetry_export",
+    "telemetry_watermark",
 ]
 
 
@@ -707,7 +709,7 @@ def _providers_for_lane(lane: str | None) -> tuple[str, ...]:
 
 def _price_index() -> dict[str, dict[str, float | None]]:
     index: dict[str, dict[str, float | None]] = {}
-    for entry in list_price_entries():
+    for entry in iter_price_entries():
         provider_prices = index.setdefault(entry.provider_id, {"input": None, "output": None})
         if entry.input_cost_per_1k is not None:
             cost = float(entry.input_cost_per_1k)
@@ -925,19 +927,18 @@ def _extract_error_category(status: str, metadata: Mapping[str, object]) -> str
 
 
 def _compute_cost_breakdown(
-    connection: Connection, where_clause: str, params: Mapping[str, object]
+    connection: Connection, source: str, params: Mapping[str, object]
 ) -> tuple[TelemetryMetricsCostBreakdownEntry, ...]:
     statement = text(
         f"""
         SELECT
             provider_id,
             route,
-            COUNT(*) AS run_count,
-            SUM(COALESCE(cost_estimated_usd, 0)) AS base_cost,
-            SUM(CASE WHEN cost_estimated_usd IS NULL THEN tokens_in ELSE 0 END) AS missing_tokens_in,
-            SUM(CASE WHEN cost_estimated_usd IS NULL THEN tokens_out ELSE 0 END) AS missing_tokens_out
-        FROM telemetry_events
-        {where_clause}
+            SUM(run_count) AS run_count,
+            SUM(cost_usd) AS base_cost,
+            SUM(missing_tokens_in) AS missing_tokens_in,
+            SUM(missing_tokens_out) AS missing_tokens_out
+        FROM ({source})
         GROUP BY provider_id, route
         """
     )
@@ -1007,7 +1008,12 @@ def _compute_cost_breakdown(
 
 
 def _compute_extended_metrics(
-    connection: Connection, where_clause: str, params: Mapping[str, object], total_runs: int
+    connection: Connection,
+    where_clause: str,
+    params: Mapping[str, object],
+    source: str,
+    source_params: Mapping[str, object],
+    total_runs: int,
 ) -> TelemetryMetricsExtended | None:
     samples = connection.execute(
         text(
@@ -1062,7 +1068,7 @@ def _compute_extended_metrics(
     error_total = sum(error_categories.values())
     error_rate = (error_total / total_runs) if total_runs else None
 
-    cost_breakdown = _compute_cost_breakdown(connection, where_clause, params)
+    cost_breakdown = _compute_cost_breakdown(connection, source, source_params)
     error_breakdown = tuple(
         TelemetryMetricsErrorBreakdownEntry(category=category, count=count)
         for category, count in error_categories.most_common()
@@ -1092,16 +1098,21 @@ def aggregate_metrics(
     normalized_start, normalized_end, where_clause, params = _prepare_filters(
         start=start, end=end, provider_id=provider_id, route=route
     )
+    _, _, source, source_params = _rollup_source(
+        start=start, end=end, provider_id=provider_id, route=route
+    )
 
     engine = bootstrap_database()
     with engine.begin() as connection:
-        summary = _fetch_summary(connection, where_clause, params)
-        providers = _fetch_provider_breakdown(connection, where_clause, params)
+        summary = _fetch_summary(connection, source, source_params)
+        providers = _fetch_provider_breakdown(connection, source, source_params)
         extended = (
             _compute_extended_metrics(
                 connection,
                 where_clause,
                 params,
+                source,
+                source_params,
                 int(summary["run_count"])
                 if summary and summary.get("run_count")
                 else 0,
@@ -1191,6 +1202,21 @@ def aggregate_metrics(
     )
 
 
+def telemetry_watermark() -> tuple[int, datetime]:
+    """Return the revision and last change time of the data behind the aggregates.
+
+    Both advance, via triggers, on every write to ``telemetry_events`` or
+    ``price_entries`` (migration 17), so they serve as HTTP cache validators.
+    """
+
+    engine = bootstrap_database()
+    with engine.connect() as connection:
+        revision, modified_at = connection.execute(
+            text("SELECT revision, modified_at FROM telemetry_watermark WHERE id = 1")
+        ).one()
+    return int(revision), datetime.fromisoformat(modified_at.replace("Z", "+00:00"))
+
+
 def aggregate_heatmap(
     *,
     start: datetime | None = None,
@@ -1200,13 +1226,13 @@ def aggregate_heatmap(
 ) -> tuple[TelemetryHeatmapBucket, ...]:
     """Aggregate execution counts by day and provider for the requested window."""
 
-    _, _, where_clause, params = _prepare_filters(
+    _, _, source, params = _rollup_source(
         start=start, end=end, provider_id=provider_id, route=route
     )
 
     engine = bootstrap_database()
     with engine.begin() as connection:
-        rows = _fetch_heatmap(connection, where_clause, params)
+        rows = _fetch_heatmap(connection, source, params)
 
     buckets: list[TelemetryHeatmapBucket] = []
     for row in rows:
@@ -1246,7 +1272,7 @@ def query_timeseries(
     if lane and lane_providers is not None and not lane_providers:
         return tuple()
 
-    _, _, where_clause, params = _prepare_filters(
+    _, _, source, params = _rollup_source(
         start=start,
         end=end,
         provider_id=provider_id,
@@ -1256,7 +1282,7 @@ def query_timeseries(
 
     engine = bootstrap_database()
     with engine.begin() as connection:
-        rows = _fetch_timeseries(connection, where_clause, params)
+        rows = _fetch_timeseries(connection, source, params)
 
     items: list[TelemetryTimeseriesPoint] = []
     for row in rows:
@@ -1299,7 +1325,7 @@ def query_route_breakdown(
     if lane and lane_providers is not None and not lane_providers:
         return tuple()
 
-    _, _, where_clause, params = _prepare_filters(
+    _, _, source, params = _rollup_source(
         start=start,
         end=end,
         provider_id=provider_id,
@@ -1309,7 +1335,7 @@ def query_route_breakdown(
 
     engine = bootstrap_database()
     with engine.begin() as connection:
-        rows = _fetch_route_breakdown(connection, where_clause, params)
+        rows = _fetch_route_breakdown(connection, source, params)
 
     provider_names = _provider_name_index()
     provider_lanes = _provider_lane_index()
@@ -2225,22 +2251,19 @@ def _build_pr_summary(delta: float, provider_name: str, route: str | None) -> st
     )
 
 
-def _fetch_summary(
-    connection: Connection, where_clause: str, params: dict[str, object]
-):
+def _fetch_summary(connection: Connection, source: str, params: dict[str, object]):
     statement = text(
         f"""
         SELECT
-            COUNT(*) AS run_count,
+            SUM(run_count) AS run_count,
             SUM(tokens_in) AS tokens_in,
             SUM(tokens_out) AS tokens_out,
-            SUM(COALESCE(cost_estimated_usd, 0)) AS cost_usd,
-            AVG(duration_ms) AS avg_latency_ms,
-            SUM(CASE WHEN LOWER(status) = 'success' THEN 1 ELSE 0 END) AS success_count,
-            MIN(ts) AS min_ts,
-            MAX(ts) AS max_ts
-        FROM telemetry_events
-        {where_clause}
+            SUM(cost_usd) AS cost_usd,
+            CAST(SUM(duration_ms_sum) AS REAL) / SUM(run_count) AS avg_latency_ms,
+            SUM(success_count) AS success_count,
+            MIN(min_ts) AS min_ts,
+            MAX(max_ts) AS max_ts
+        FROM ({source})
         """
     )
     result = connection.execute(statement, dict(params)).mappings().first()
@@ -2248,22 +2271,21 @@ def _fetch_summary(
 
 
 def _fetch_provider_breakdown(
-    connection: Connection, where_clause: str, params: dict[str, object]
+    connection: Connection, source: str, params: dict[str, object]
 ):
     statement = text(
         f"""
         SELECT
             provider_id,
-            COUNT(*) AS run_count,
+            SUM(run_count) AS run_count,
             SUM(tokens_in) AS tokens_in,
             SUM(tokens_out) AS tokens_out,
-            SUM(COALESCE(cost_estimated_usd, 0)) AS base_cost_usd,
-            AVG(duration_ms) AS avg_latency_ms,
-            SUM(CASE WHEN LOWER(status) = 'success' THEN 1 ELSE 0 END) AS success_count,
-            SUM(CASE WHEN cost_estimated_usd IS NULL THEN tokens_in ELSE 0 END) AS missing_tokens_in,
-            SUM(CASE WHEN cost_estimated_usd IS NULL THEN tokens_out ELSE 0 END) AS missing_tokens_out
-        FROM telemetry_events
-        {where_clause}
+            SUM(cost_usd) AS base_cost_usd,
+            CAST(SUM(duration_ms_sum) AS REAL) / SUM(run_count) AS avg_latency_ms,
+            SUM(success_count) AS success_count,
+            SUM(missing_tokens_in) AS missing_tokens_in,
+            SUM(missing_tokens_out) AS missing_tokens_out
+        FROM ({source})
         GROUP BY provider_id
         ORDER BY run_count DESC, provider_id ASC
         """
@@ -2271,49 +2293,45 @@ def _fetch_provider_breakdown(
     return connection.execute(statement, dict(params)).mappings().all()
 
 
-def _fetch_timeseries(
-    connection: Connection, where_clause: str, params: dict[str, object]
-):
+def _fetch_timeseries(connection: Connection, source: str, params: dict[str, object]):
     statement = text(
         f"""
         SELECT
-            DATE(ts) AS day,
+            day,
             provider_id,
-            COUNT(*) AS run_count,
+            SUM(run_count) AS run_count,
             SUM(tokens_in) AS tokens_in,
             SUM(tokens_out) AS tokens_out,
-            AVG(duration_ms) AS avg_latency_ms,
-            SUM(CASE WHEN LOWER(status) = 'success' THEN 1 ELSE 0 END) AS success_count,
-            SUM(COALESCE(cost_estimated_usd, 0)) AS cost_usd,
-            SUM(CASE WHEN cost_estimated_usd IS NULL THEN tokens_in ELSE 0 END) AS missing_tokens_in,
-            SUM(CASE WHEN cost_estimated_usd IS NULL THEN tokens_out ELSE 0 END) AS missing_tokens_out
-        FROM telemetry_events
-        {where_clause}
-        GROUP BY DATE(ts), provider_id
-        ORDER BY DATE(ts) ASC, provider_id ASC
+            CAST(SUM(duration_ms_sum) AS REAL) / SUM(run_count) AS avg_latency_ms,
+            SUM(success_count) AS success_count,
+            SUM(cost_usd) AS cost_usd,
+            SUM(missing_tokens_in) AS missing_tokens_in,
+            SUM(missing_tokens_out) AS missing_tokens_out
+        FROM ({source})
+        GROUP BY day, provider_id
+        ORDER BY day ASC, provider_id ASC
         """
     )
     return connection.execute(statement, dict(params)).mappings().all()
 
 
 def _fetch_route_breakdown(
-    connection: Connection, where_clause: str, params: dict[str, object]
+    connection: Connection, source: str, params: dict[str, object]
 ):
     statement = text(
         f"""
         SELECT
             provider_id,
             route,
-            COUNT(*) AS run_count,
+            SUM(run_count) AS run_count,
             SUM(tokens_in) AS tokens_in,
             SUM(tokens_out) AS tokens_out,
-            AVG(duration_ms) AS avg_latency_ms,
-            SUM(CASE WHEN LOWER(status) = 'success' THEN 1 ELSE 0 END) AS success_count,
-            SUM(COALESCE(cost_estimated_usd, 0)) AS cost_usd,
-            SUM(CASE WHEN cost_estimated_usd IS NULL THEN tokens_in ELSE 0 END) AS missing_tokens_in,
-            SUM(CASE WHEN cost_estimated_usd IS NULL THEN tokens_out ELSE 0 END) AS missing_tokens_out
-        FROM telemetry_events
-        {where_clause}
+            CAST(SUM(duration_ms_sum) AS REAL) / SUM(run_count) AS avg_latency_ms,
+            SUM(success_count) AS success_count,
+            SUM(cost_usd) AS cost_usd,
+            SUM(missing_tokens_in) AS missing_tokens_in,
+            SUM(missing_tokens_out) AS missing_tokens_out
+        FROM ({source})
         GROUP BY provider_id, route
         ORDER BY cost_usd DESC, provider_id ASC
         """
@@ -2355,19 +2373,16 @@ def _fetch_runs(
     return connection.execute(statement, run_params).mappings().all()
 
 
-def _fetch_heatmap(
-    connection: Connection, where_clause: str, params: dict[str, object]
-):
+def _fetch_heatmap(connection: Connection, source: str, params: dict[str, object]):
     statement = text(
         f"""
         SELECT
-            DATE(ts) AS day,
+            day,
             provider_id,
-            COUNT(*) AS run_count
-        FROM telemetry_events
-        {where_clause}
-        GROUP BY DATE(ts), provider_id
-        ORDER BY DATE(ts) ASC, provider_id ASC
+            SUM(run_count) AS run_count
+        FROM ({source})
+        GROUP BY day, provider_id
+        ORDER BY day ASC, provider_id ASC
         """
     )
     return connection.execute(statement, dict(params)).mappings().all()
@@ -2433,6 +2448,35 @@ def render_telemetry_export(
     raise ValueError(f"Unsupported export format: {fmt}")
 
 
+def stream_telemetry_export(
+    fmt: str,
+    *,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    provider_id: str | None = None,
+    route: str | None = None,
+) -> tuple[Iterator[bytes], str]:
+    """Return an iterator of encoded export chunks and its media type.
+
+    CSV exports are written batch by batch while the result cursor is consumed,
+    so memory stays bounded by ``_EXPORT_BATCH_SIZE`` rows. HTML and JSON need
+    the full row set and are rendered by :func:`render_telemetry_export` and
+    yielded as a single chunk. Filters and the format are validated eagerly so
+    callers can report errors before streaming starts.
+    """
+
+    if fmt.lower() != "csv":
+        document, media_type = render_telemetry_export(
+            fmt, start=start, end=end, provider_id=provider_id, route=route
+        )
+        return iter((document.encode("utf-8"),)), media_type
+
+    _, _, where_clause, params = _prepare_filters(
+        start=start, end=end, provider_id=provider_id, route=route
+    )
+    return _stream_csv(where_clause, params), "text/csv"
+
+
 def _prepare_filters(
     *,
     start: datetime | None,
@@ -2441,13 +2485,40 @@ def _prepare_filters(
     route: str | None,
     allowed_provider_ids: Iterable[str] | None = None,
 ) -> tuple[datetime | None, datetime | None, str, dict[str, object]]:
+    normalized_start, normalized_end, time_clauses, scope_clauses, params = _filter_clauses(
+        start=start,
+        end=end,
+        provider_id=provider_id,
+        route=route,
+        allowed_provider_ids=allowed_provider_ids,
+    )
+    clauses = time_clauses + scope_clauses
+    where_clause = " WHERE " + " AND ".join(clauses) if clauses else ""
+    return normalized_start, normalized_end, where_clause, params
+
+
+def _filter_clauses(
+    *,
+    start: datetime | None,
+    end: datetime | None,
+    provider_id: str | None,
+    route: str | None,
+    allowed_provider_ids: Iterable[str] | None = None,
+) -> tuple[datetime | None, datetime | None, list[str], list[str], dict[str, object]]:
+    """Split the event filters into ``ts`` bounds and provider/route scope clauses.
+
+    Scope clauses only reference ``provider_id`` and ``route`` so they apply to
+    both ``telemetry_events`` and ``telemetry_rollups``.
+    """
+
     normalized_start = _normalize_bound(start) if start else None
     normalized_end = _normalize_bound(end) if end else None
     if normalized_start and normalized_end and normalized_start > normalized_end:
         raise ValueError("start must be before end")
 
     params: dict[str, object] = {}
-    clauses: list[str] = []
+    time_clauses: list[str] = []
+    scope_clauses: list[str] = []
     allowed_set = (
         None
         if allowed_provider_ids is None
@@ -2455,36 +2526,132 @@ def _prepare_filters(
     )
     if normalized_start:
         params["start"] = normalized_start.isoformat()
-        clauses.append("ts >= :start")
+        time_clauses.append("ts >= :start")
     if normalized_end:
         params["end"] = normalized_end.isoformat()
-        clauses.append("ts <= :end")
+        time_clauses.append("ts <= :end")
     if provider_id:
         if allowed_set is not None and provider_id not in allowed_set:
-            return normalized_start, normalized_end, " WHERE 0 = 1", {}
+            return normalized_start, normalized_end, [], ["0 = 1"], {}
         params["provider_id"] = provider_id
-        clauses.append("provider_id = :provider_id")
+        scope_clauses.append("provider_id = :provider_id")
     elif allowed_set is not None:
         if not allowed_set:
-            return normalized_start, normalized_end, " WHERE 0 = 1", {}
+            return normalized_start, normalized_end, [], ["0 = 1"], {}
         placeholders: list[str] = []
         for index, provider in enumerate(allowed_set):
             key = f"lane_provider_{index}"
             params[key] = provider
             placeholders.append(f":{key}")
-        clauses.append(f"provider_id IN ({', '.join(placeholders)})")
+        scope_clauses.append(f"provider_id IN ({', '.join(placeholders)})")
     if route:
         params["route"] = route
-        clauses.append("route = :route")
+        scope_clauses.append("route = :route")
 
-    where_clause = " WHERE " + " AND ".join(clauses) if clauses else ""
-    return normalized_start, normalized_end, where_clause, params
+    return normalized_start, normalized_end, time_clauses, scope_clauses, params
 
 
-def _fetch_events(
-    connection: Connection, where_clause: str, params: dict[str, object]
-) -> list[dict[str, object]]:
-    statement = text(
+# Events whose ``ts`` is a normalized UTC ISO string are folded into
+# ``telemetry_rollups`` by triggers (migration 16); anything else is only ever
+# read from ``telemetry_events``.
+_ROLLUP_BUCKET = timedelta(minutes=5)
+_ROLLUP_TS_GLOB = (
+    "'[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]T[0-9][0-9]:[0-9][0-9]:[0-9][0-9]*+00:00'"
+)
+
+
+def _floor_bucket(value: datetime) -> datetime:
+    return value.replace(
+        minute=value.minute - value.minute % 5, second=0, microsecond=0
+    )
+
+
+def _format_bucket(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:00+00:00")
+
+
+def _rollup_source(
+    *,
+    start: datetime | None,
+    end: datetime | None,
+    provider_id: str | None,
+    route: str | None,
+    allowed_provider_ids: Iterable[str] | None = None,
+) -> tuple[datetime | None, datetime | None, str, dict[str, object]]:
+    """Build a subquery yielding pre-aggregated rows for the requested window.
+
+    Buckets lying entirely inside ``[start, end]`` are read from
+    ``telemetry_rollups``; only events in the partial buckets at the window
+    edges (and events with non-normalized timestamps) are scanned from
+    ``telemetry_events``. Both halves expose the same additive columns, so
+    callers ``SUM`` them and group by ``day``, ``provider_id`` or ``route``.
+    """
+
+    normalized_start, normalized_end, time_clauses, scope_clauses, params = _filter_clauses(
+        start=start,
+        end=end,
+        provider_id=provider_id,
+        route=route,
+        allowed_provider_ids=allowed_provider_ids,
+    )
+
+    edge_clauses = [f"NOT (ts GLOB {_ROLLUP_TS_GLOB})"]
+    rollup_clauses = list(scope_clauses)
+    if normalized_start:
+        first_bucket = _floor_bucket(normalized_start)
+        if first_bucket < normalized_start:
+            first_bucket += _ROLLUP_BUCKET
+        params["rollup_start"] = _format_bucket(first_bucket)
+        edge_clauses.append("ts < :rollup_start")
+        rollup_clauses.append("bucket_start >= :rollup_start")
+    if normalized_end:
+        params["rollup_end"] = _format_bucket(_floor_bucket(normalized_end))
+        edge_clauses.append("ts >= :rollup_end")
+        rollup_clauses.append("bucket_start < :rollup_end")
+
+    event_clauses = time_clauses + scope_clauses + ["(" + " OR ".join(edge_clauses) + ")"]
+    event_where = " WHERE " + " AND ".join(event_clauses)
+    rollup_where = " WHERE " + " AND ".join(rollup_clauses) if rollup_clauses else ""
+    source = f"""
+        SELECT
+            DATE(ts) AS day,
+            provider_id,
+            route,
+            1 AS run_count,
+            tokens_in,
+            tokens_out,
+            duration_ms AS duration_ms_sum,
+            CASE WHEN LOWER(status) = 'success' THEN 1 ELSE 0 END AS success_count,
+            COALESCE(cost_estimated_usd, 0) AS cost_usd,
+            CASE WHEN cost_estimated_usd IS NULL THEN tokens_in ELSE 0 END AS missing_tokens_in,
+            CASE WHEN cost_estimated_usd IS NULL THEN tokens_out ELSE 0 END AS missing_tokens_out,
+            ts AS min_ts,
+            ts AS max_ts
+        FROM telemetry_events
+        {event_where}
+        UNION ALL
+        SELECT
+            DATE(bucket_start) AS day,
+            provider_id,
+            NULLIF(route, '') AS route,
+            run_count,
+            tokens_in,
+            tokens_out,
+            duration_ms_sum,
+            success_count,
+            cost_usd,
+            missing_tokens_in,
+            missing_tokens_out,
+            min_ts,
+            max_ts
+        FROM telemetry_rollups
+        {rollup_where}
+    """
+    return normalized_start, normalized_end, source, params
+
+
+def _events_statement(where_clause: str) -> TextClause:
+    return text(
         f"""
         SELECT
             ts,
@@ -2507,56 +2674,88 @@ def _fetch_events(
         ORDER BY ts ASC, provider_id ASC, line_number ASC
         """
     )
-    result = connection.execute(statement, dict(params))
+
+
+def _fetch_events(
+    connection: Connection, where_clause: str, params: dict[str, object]
+) -> list[dict[str, object]]:
+    result = connection.execute(_events_statement(where_clause), dict(params))
     return [dict(row) for row in result.mappings()]
 
 
+_EXPORT_CSV_HEADER = (
+    "timestamp",
+    "provider_id",
+    "tool",
+    "route",
+    "status",
+    "tokens_in",
+    "tokens_out",
+    "duration_ms",
+    "cost_estimated_usd",
+    "experiment_cohort",
+    "experiment_tag",
+    "metadata",
+    "source_file",
+)
+
+_EXPORT_BATCH_SIZE = 500
+
+
+def _csv_row(row: Mapping[str, object]) -> list[object]:
+    raw_metadata = row.get("metadata")
+    if isinstance(raw_metadata, str):
+        metadata_value = raw_metadata
+    else:
+        metadata_value = json.dumps(raw_metadata or {}, ensure_ascii=False, sort_keys=True)
+    return [
+        row.get("ts", ""),
+        row.get("provider_id", ""),
+        row.get("tool", ""),
+        row.get("route") or "",
+        row.get("status", ""),
+        row.get("tokens_in", 0),
+        row.get("tokens_out", 0),
+        row.get("duration_ms", 0),
+        "" if row.get("cost_estimated_usd") is None else row["cost_estimated_usd"],
+        row.get("experiment_cohort") or "",
+        row.get("experiment_tag") or "",
+        metadata_value,
+        row.get("source_file", ""),
+    ]
+
+
 def _render_csv(rows: list[dict[str, object]]) -> str:
     output = io.StringIO()
     writer = csv.writer(output)
-    writer.writerow(
-        [
-            "timestamp",
-            "provider_id",
-            "tool",
-            "route",
-            "status",
-            "tokens_in",
-            "tokens_out",
-            "duration_ms",
-            "cost_estimated_usd",
-            "experiment_cohort",
-            "experiment_tag",
-            "metadata",
-            "source_file",
-        ]
-    )
-    for row in rows:
-        raw_metadata = row.get("metadata")
-        if isinstance(raw_metadata, str):
-            metadata_value = raw_metadata
-        else:
-            metadata_value = json.dumps(raw_metadata or {}, ensure_ascii=False, sort_keys=True)
-        writer.writerow(
-            [
-                row.get("ts", ""),
-                row.get("provider_id", ""),
-                row.get("tool", ""),
-                row.get("route") or "",
-                row.get("status", ""),
-                row.get("tokens_in", 0),
-                row.get("tokens_out", 0),
-                row.get("duration_ms", 0),
-                "" if row.get("cost_estimated_usd") is None else row["cost_estimated_usd"],
-                row.get("experiment_cohort") or "",
-                row.get("experiment_tag") or "",
-                metadata_value,
-                row.get("source_file", ""),
-            ]
-        )
+    writer.writerow(_EXPORT_CSV_HEADER)
+    writer.writerows(_csv_row(row) for row in rows)
     return output.getvalue()
 
 
+def _stream_csv(where_clause: str, params: dict[str, object]) -> Iterator[bytes]:
+    output = io.StringIO()
+    writer = csv.writer(output)
+
+    def _drain() -> bytes:
+        chunk = output.getvalue().encode("utf-8")
+        output.seek(0)
+        output.truncate(0)
+        return chunk
+
+    writer.writerow(_EXPORT_CSV_HEADER)
+    yield _drain()
+
+    engine = bootstrap_database()
+    with engine.connect() as connection:
+        result = connection.execution_options(yield_per=_EXPORT_BATCH_SIZE).execute(
+            _events_statement(where_clause), dict(params)
+        )
+        for batch in result.mappings().partitions():
+            writer.writerows(_csv_row(row) for row in batch)
+            yield _drain()
+
+
 def _render_json(rows: list[dict[str, object]]) -> str:
     normalized: list[dict[str, object]] = []
     for row in rows:
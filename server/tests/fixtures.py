@@ -58,14 +58,16 @@ class SampleMarketplaceEntry:
 
 
 def seed_price_entries(entries: Iterable[SamplePriceEntry]) -> None:
-    for entry in entries:
-        prices_module.create_price_entry(
-            entry_id=entry.entry_id,
-            provider_id=entry.provider_id,
-            model=entry.model,
-            input_cost_per_1k=entry.input_cost_per_1k,
-            output_cost_per_1k=entry.output_cost_per_1k,
-        )
+    prices_module.create_price_entries_bulk(
+        {
+            "entry_id": entry.entry_id,
+            "provider_id": entry.provider_id,
+            "model": entry.model,
+            "input_cost_per_1k": entry.input_cost_per_1k,
+            "output_cost_per_1k": entry.output_cost_per_1k,
+        }
+        for entry in entries
+    )
 
 
 def seed_telemetry_events(engine: Engine, events: Iterable[SampleTelemetryEvent]) -> None:
@@ -44,3 +44,43 @@ def test_repeated_bootstrap_is_idempotent(database) -> None:
     versions = [row[0] for row in rows]
     expected_versions = [migration.version for migration in database.MIGRATIONS]
     assert versions == expected_versions
+
+
+def test_price_entries_listing_uses_composite_index(database) -> None:
+    engine = database.bootstrap_database()
+
+    with engine.begin() as connection:
+        plan = connection.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM price_entries "
+                "ORDER BY provider_id, model, id"
+            )
+        ).fetchall()
+
+    details = " ".join(str(row[-1]) for row in plan)
+    assert "idx_price_entries_provider_model_id" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_store_version_memoize_drops_results_after_writes(database) -> None:
+    database.bootstrap_database()
+    version = database.StoreVersion()
+    calls: list[str] = []
+
+    @version.memoize(maxsize=2)
+    def read(key: str) -> str:
+        calls.append(key)
+        return key.upper()
+
+    assert read("a") == "A"
+    assert read("a") == "A"
+    assert calls == ["a"]
+
+    version.bump()
+    assert read("a") == "A"
+    assert calls == ["a", "a"]
+
+    read("b")
+    read("c")
+    read("c")
+    assert calls == ["a", "a", "b", "c", "c"]
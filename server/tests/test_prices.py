@@ -0,0 +1,207 @@
+"""Tests covering the price table persistence helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture()
+def prices(database):
+    database.bootstrap_database()
+
+    from console_mcp_server import prices as prices_module
+
+    return prices_module
+
+
+def test_bulk_create_returns_records_in_input_order(prices) -> None:
+    records = prices.create_price_entries_bulk(
+        [
+            {"entry_id": "price-z", "provider_id": "zeta", "model": "z-1", "tags": ["batch"]},
+            {"entry_id": "price-a", "provider_id": "alpha", "model": "a-1", "input_cost_per_1k": 1},
+        ]
+    )
+
+    assert [record.id for record in records] == ["price-z", "price-a"]
+    assert all(type(record.provider_id) is str for record in records)
+    assert records[0].tags == ["batch"]
+    assert records[1].input_cost_per_1k == 1.0
+    assert records[0].created_at == records[1].created_at
+    assert [record.id for record in prices.list_price_entries()] == ["price-a", "price-z"]
+
+
+def test_bulk_create_with_no_entries_is_a_noop(prices) -> None:
+    assert prices.create_price_entries_bulk([]) == []
+    assert prices.list_price_entries() == []
+
+
+def test_bulk_create_rejects_duplicate_ids(prices) -> None:
+    prices.create_price_entry(entry_id="price-a", provider_id="alpha", model="a-1")
+
+    with pytest.raises(prices.PriceEntryAlreadyExistsError):
+        prices.create_price_entries_bulk(
+            [
+                {"entry_id": "price-b", "provider_id": "beta", "model": "b-1"},
+                {"entry_id": "price-a", "provider_id": "alpha", "model": "a-1"},
+            ]
+        )
+
+    assert [record.id for record in prices.list_price_entries()] == ["price-a"]
+
+
+def test_bulk_upsert_inserts_new_and_replaces_existing_entries(prices) -> None:
+    original = prices.create_price_entry(entry_id="price-a", provider_id="alpha", model="a-1")
+
+    written = prices.bulk_upsert_price_entries(
+        [
+            {"entry_id": "price-a", "provider_id": "alpha", "model": "a-2", "tags": ["v2"]},
+            {"entry_id": "price-b", "provider_id": "beta", "model": "b-1"},
+        ]
+    )
+
+    assert written == 2
+    assert prices.bulk_upsert_price_entries([]) == 0
+    entries = {record.id: record for record in prices.list_price_entries()}
+    assert entries["price-a"].model == "a-2"
+    assert entries["price-a"].tags == ["v2"]
+    assert entries["price-a"].created_at == original.created_at
+    assert entries["price-b"].provider_id == "beta"
+
+
+def test_iter_price_entries_streams_in_batches(prices, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(prices, "_ITER_BATCH_SIZE", 2)
+    prices.create_price_entries_bulk(
+        {"entry_id": f"price-{index}", "provider_id": "alpha", "model": f"m-{index}"}
+        for index in range(5)
+    )
+
+    iterator = prices.iter_price_entries()
+
+    first = next(iterator)
+    assert first.id == "price-0"
+    assert type(first.model) is str
+    assert [record.id for record in iterator] == ["price-1", "price-2", "price-3", "price-4"]
+
+
+def test_lookup_price_entry_returns_none_for_missing_ids(prices) -> None:
+    created = prices.create_price_entry(entry_id="price-a", provider_id="alpha", model="a-1")
+
+    assert prices.lookup_price_entry("price-a") == created
+    assert prices.lookup_price_entry("price-missing") is None
+    with pytest.raises(prices.PriceEntryNotFoundError):
+        prices.get_price_entry("price-missing")
+
+
+def test_price_entries_by_provider_is_rebuilt_after_writes(prices) -> None:
+    prices.create_price_entries_bulk(
+        [
+            {"entry_id": "price-b", "provider_id": "beta", "model": "b-1"},
+            {"entry_id": "price-a2", "provider_id": "alpha", "model": "a-2"},
+            {"entry_id": "price-a1", "provider_id": "alpha", "model": "a-1"},
+        ]
+    )
+
+    grouped = prices.price_entries_by_provider()
+    assert {key: [entry.id for entry in entries] for key, entries in grouped.items()} == {
+        "alpha": ["price-a1", "price-a2"],
+        "beta": ["price-b"],
+    }
+    assert prices.price_entries_by_provider() is grouped
+
+    prices.delete_price_entry("price-b")
+    assert "beta" not in prices.price_entries_by_provider()
+
+
+def test_get_best_price_prefers_cheapest_model_match(prices) -> None:
+    prices.create_price_entries_bulk(
+        [
+            {"entry_id": "other", "provider_id": "openai", "model": "flash", "input_cost_per_1k": 0},
+            {"entry_id": "flash-pricey", "provider_id": "gemini", "model": "flash", "input_cost_per_1k": 3},
+            {"entry_id": "pro", "provider_id": "gemini", "model": "pro", "input_cost_per_1k": 1},
+            {"entry_id": "flash-cheap", "provider_id": "gemini", "model": "flash", "input_cost_per_1k": 2},
+            {
+                "entry_id": "flash-output",
+                "provider_id": "gemini",
+                "model": "flash",
+                "input_cost_per_1k": 0.5,
+                "output_cost_per_1k": 2,
+            },
+        ]
+    )
+
+    entry, cost = prices.get_best_price("gemini", "flash", 1000, 1000)
+    assert (entry.id, cost) == ("flash-cheap", pytest.approx(2.0))
+    # Output-heavy runs re-rank by the real weights instead of the combined rate.
+    entry, cost = prices.get_best_price("gemini", "flash", 4000, 0)
+    assert (entry.id, cost) == ("flash-output", pytest.approx(2.0))
+    assert prices.get_best_price("gemini", "unknown", 1000, 1000)[0].id == "pro"
+    assert prices.get_best_price("gemini", None, 2000, 1000)[0].id == "pro"
+    assert prices.get_best_price("anthropic", None, 1000, 1000) is None
+
+
+def test_get_best_price_breaks_cost_ties_by_listing_order(prices) -> None:
+    prices.create_price_entries_bulk(
+        [
+            {
+                "entry_id": "a-expensive-out",
+                "provider_id": "openai",
+                "model": "gpt",
+                "input_cost_per_1k": 1.0,
+                "output_cost_per_1k": 5.0,
+            },
+            {
+                "entry_id": "b-cheap",
+                "provider_id": "openai",
+                "model": "gpt",
+                "input_cost_per_1k": 1.0,
+                "output_cost_per_1k": 1.0,
+            },
+        ]
+    )
+
+    entry, cost = prices.get_best_price("openai", "gpt", 1000, 0)
+    assert (entry.id, cost) == ("a-expensive-out", pytest.approx(1.0))
+    entry, cost = prices.get_best_price("openai", None, 0, 0)
+    assert (entry.id, cost) == ("a-expensive-out", 0.0)
+    assert prices.get_best_price("openai", "gpt", 1000, 1000)[0].id == "b-cheap"
+
+
+def test_delete_price_entries_removes_all_requested_ids(prices) -> None:
+    prices.create_price_entries_bulk(
+        {"entry_id": entry_id, "provider_id": "alpha", "model": entry_id}
+        for entry_id in ("price-a", "price-b", "price-c")
+    )
+
+    assert prices.delete_price_entries(["price-a", "price-c", "price-a"]) == 2
+    assert [record.id for record in prices.list_price_entries()] == ["price-b"]
+    assert prices.delete_price_entries([]) == 0
+
+
+def test_delete_price_entries_is_atomic_when_ids_are_missing(prices) -> None:
+    prices.create_price_entry(entry_id="price-a", provider_id="alpha", model="a-1")
+
+    with pytest.raises(prices.PriceEntryNotFoundError):
+        prices.delete_price_entries(["price-a", "price-missing"])
+
+    assert [record.id for record in prices.list_price_entries()] == ["price-a"]
+
+
+def test_bulk_update_rolls_back_when_an_entry_is_missing(prices) -> None:
+    prices.create_price_entry(entry_id="price-a", provider_id="alpha", model="a-1")
+
+    updated = prices.update_price_entries_bulk(
+        [{"entry_id": "price-a", "provider_id": "alpha", "model": "a-2", "tags": ["v2"]}]
+    )
+    assert [(record.id, record.model, record.tags) for record in updated] == [
+        ("price-a", "a-2", ["v2"])
+    ]
+
+    with pytest.raises(prices.PriceEntryNotFoundError):
+        prices.update_price_entries_bulk(
+            [
+                {"entry_id": "price-a", "provider_id": "alpha", "model": "a-3"},
+                {"entry_id": "price-missing", "provider_id": "alpha", "model": "x"},
+            ]
+        )
+
+    assert prices.get_price_entry("price-a").model == "a-2"
@@ -0,0 +1,81 @@
+"""Tests covering the in-memory provider registry."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from console_mcp_server import config
+from console_mcp_server.registry import ProviderRegistry
+
+
+def _write_manifest(path: Path, *provider_ids: str) -> Path:
+    payload = {
+        "providers": [
+            {"id": provider_id, "name": provider_id.upper(), "command": provider_id}
+            for provider_id in provider_ids
+        ]
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+@pytest.fixture()
+def manifest(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = _write_manifest(tmp_path / "servers.json", "alpha", "beta")
+    monkeypatch.setenv(config.MANIFEST_ENV_VAR, str(path))
+    config.reload_settings()
+    yield path
+    monkeypatch.delenv(config.MANIFEST_ENV_VAR)
+    config.reload_settings()
+
+
+def test_registry_reuses_summaries_between_accesses(manifest: Path) -> None:
+    registry = ProviderRegistry()
+
+    first = registry.providers
+    second = registry.providers
+
+    assert [provider.id for provider in first] == ["alpha", "beta"]
+    assert first is not second
+    assert all(left is right for left, right in zip(first, second))
+    assert all(provider.is_available for provider in first)
+
+
+def test_registry_get_looks_up_by_id(manifest: Path) -> None:
+    registry = ProviderRegistry()
+
+    assert registry.get("beta") is registry.providers[1]
+    with pytest.raises(KeyError):
+        registry.get("missing")
+
+
+def test_registry_follows_reloaded_settings(manifest: Path) -> None:
+    registry = ProviderRegistry()
+    assert [provider.id for provider in registry.providers] == ["alpha", "beta"]
+    assert registry.provider_ids == ("alpha", "beta")
+    fingerprint = registry.fingerprint
+    assert ProviderRegistry().fingerprint == fingerprint
+
+    _write_manifest(manifest, "gamma")
+    config.reload_settings()
+
+    assert registry.fingerprint != fingerprint
+
+    assert [provider.id for provider in registry.providers] == ["gamma"]
+    assert registry.provider_ids == ("gamma",)
+    assert list(registry.providers_map) == ["gamma"]
+    assert registry.get("gamma").name == "GAMMA"
+    with pytest.raises(KeyError):
+        registry.get("alpha")
+
+
+def test_registry_with_explicit_settings_ignores_reloads(manifest: Path) -> None:
+    registry = ProviderRegistry(settings=config.get_settings())
+
+    _write_manifest(manifest, "gamma")
+    config.reload_settings()
+
+    assert [provider.id for provider in registry.providers] == ["alpha", "beta"]
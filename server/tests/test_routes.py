@@ -7,6 +7,7 @@ import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import sys
+import time
 
 import json
 import os
@@ -24,8 +25,11 @@ from console_mcp_server import telemetry as telemetry_module
 from console_mcp_server.security import hash_token, Role
 from console_mcp_server.fixtures import load_response_fixture
 from console_mcp_server.schemas import (
+    HealthStatus,
     MCPServersResponse,
     NotificationsResponse,
+    RoutingSimulationResponse,
+    ServerProcessesResponse,
     SessionsResponse,
     TelemetryRunsResponse,
 )
@@ -107,6 +111,71 @@ def test_healthz_endpoint_reports_ok(client: TestClient) -> None:
     payload = response.json()
     assert payload['status'] == 'ok'
     assert 'timestamp' in payload
+    assert payload['version'] == HealthStatus().version
+    assert datetime.fromisoformat(payload['timestamp'].replace('Z', '+00:00')).tzinfo is not None
+
+
+def test_healthz_body_is_reused_until_it_expires(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    import console_mcp_server.routes as routes_module
+
+    builds: list[bytes] = []
+    build = routes_module._build_health_body
+
+    def counting_build() -> bytes:
+        builds.append(build())
+        return builds[-1]
+
+    monkeypatch.setattr(routes_module, '_build_health_body', counting_build)
+
+    first = client.get('/api/v1/healthz').content
+    assert client.get('/api/v1/healthz').content == first
+    assert len(builds) == 1
+
+    routes_module._health_cache.clear()
+    assert client.get('/api/v1/healthz').status_code == 200
+    assert len(builds) == 2
+
+
+def test_polled_routes_are_matched_first_without_shadowing(client: TestClient) -> None:
+    import console_mcp_server.routes as routes_module
+
+    polled = set(routes_module._POLLED_ENDPOINTS)
+    leading = routes_module.router.routes[: len(polled)]
+    assert {route.endpoint for route in leading} == polled
+
+    assert routes_module._paths_overlap('/servers/processes', '/servers/{server_id}')
+    assert not routes_module._paths_overlap('/servers/{server_id}/process', '/servers/{server_id}')
+    assert routes_module._paths_overlap('/healthz', '/{rest:path}')
+
+    assert client.get('/api/v1/servers/processes').json().keys() == {'processes'}
+    assert client.get('/api/v1/servers/missing/process').status_code == 404
+
+
+def test_ttl_body_cache_builds_once_under_concurrent_misses(client: TestClient) -> None:
+    import threading
+
+    import console_mcp_server.routes as routes_module
+
+    cache = routes_module._TTLBodyCache(60.0)
+    builds: list[int] = []
+
+    def slow_build() -> bytes:
+        builds.append(1)
+        time.sleep(0.05)
+        return b'{}'
+
+    bodies: list[bytes] = []
+    threads = [
+        threading.Thread(target=lambda: bodies.append(cache.get_or_build(slow_build)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert bodies == [b'{}'] * 8
+    assert len(builds) == 1
 
 
 def test_providers_endpoint_uses_example_manifest(client: TestClient) -> None:
@@ -120,6 +189,11 @@ def test_providers_endpoint_uses_example_manifest(client: TestClient) -> None:
     assert {'gemini', 'codex', 'glm46', 'claude'} <= provider_ids
     assert all(provider['is_available'] for provider in payload['providers'])
 
+    assert response.headers['cache-control'] == 'no-cache'
+    cached = client.get('/api/v1/providers', headers={'If-None-Match': response.headers['etag']})
+    assert cached.status_code == 304
+    assert cached.headers['cache-control'] == 'no-cache'
+
 
 def test_notifications_endpoint_returns_curated_payload(client: TestClient) -> None:
     response = client.get('/api/v1/notifications')
@@ -131,6 +205,8 @@ def test_notifications_endpoint_returns_curated_payload(client: TestClient) -> N
 
     sample = payload['notifications'][0]
     assert {'id', 'severity', 'title', 'message', 'timestamp', 'category', 'tags'} <= sample.keys()
+    assert all(isinstance(item['tags'], list) for item in payload['notifications'])
+    assert all(isinstance(item.tags, tuple) for item in notifications_module.list_notifications())
 
 
 def test_notifications_endpoint_handles_empty_sources(
@@ -147,6 +223,27 @@ def test_notifications_endpoint_handles_empty_sources(
     assert payload == fixture.model_dump(mode='json')
 
 
+def test_notifications_are_cached_until_invalidated(
+    monkeypatch: pytest.MonkeyPatch, client: TestClient
+) -> None:
+    calls: list[int] = []
+
+    def counting_notifications() -> list:
+        calls.append(1)
+        return notifications_module.list_notifications()
+
+    monkeypatch.setattr(routes_module, 'list_notifications', counting_notifications)
+
+    first = client.get('/api/v1/notifications')
+    second = client.get('/api/v1/notifications')
+    assert first.json() == second.json()
+    assert len(calls) == 1
+
+    routes_module.invalidate_notifications_cache()
+    client.get('/api/v1/notifications')
+    assert len(calls) == 2
+
+
 def test_notifications_endpoint_surfaces_errors(
     monkeypatch: pytest.MonkeyPatch, client: TestClient
 ) -> None:
@@ -185,7 +282,7 @@ def test_session_provisioning_flow(client: TestClient) -> None:
     assert list_after.status_code == 200
 
     sessions = list_after.json()['sessions']
-    assert any(session['id'] == body['session']['id'] for session in sessions)
+    assert body['session'] in sessions
 
 
 def test_secret_crud_flow(client: TestClient, tmp_path: Path) -> None:
@@ -210,11 +307,11 @@ def test_secret_crud_flow(client: TestClient, tmp_path: Path) -> None:
     gemini_summary = summary[0]
     assert gemini_summary['provider_id'] == 'gemini'
     assert gemini_summary['has_secret'] is True
-    assert gemini_summary['updated_at']
+    assert gemini_summary['updated_at'] == created_payload['updated_at']
 
     read_response = client.get('/api/v1/secrets/gemini')
     assert read_response.status_code == 200
-    assert read_response.json()['value'] == 'api-key-123'
+    assert read_response.json() == created_payload
 
     update_response = client.put('/api/v1/secrets/gemini', json={'value': 'api-key-456'})
     assert update_response.status_code == 200
@@ -296,7 +393,7 @@ def test_policy_override_crud_flow(client: TestClient) -> None:
 
     read_response = client.get('/api/v1/policies/overrides/route-ops-balance')
     assert read_response.status_code == 200
-    assert read_response.json()['notes'] == 'Incident response route requires manual approval.'
+    assert read_response.json() == created
 
     update_payload = {
         'route': 'ops/incident',
@@ -802,6 +899,70 @@ def test_telemetry_heatmap_endpoint_returns_daily_buckets(client: TestClient) ->
     assert all(entry['provider_id'] == 'gemini' for entry in filtered_payload['buckets'])
 
 
+def test_telemetry_aggregates_support_conditional_requests(
+    telemetry_dataset, client: TestClient
+) -> None:
+    first = client.get('/api/v1/telemetry/metrics')
+    assert first.status_code == 200
+    etag = first.headers['etag']
+    last_modified = first.headers['last-modified']
+    assert first.headers['cache-control'] == 'no-cache'
+
+    assert client.get('/api/v1/telemetry/metrics', headers={'If-None-Match': etag}).status_code == 304
+    assert (
+        client.get('/api/v1/telemetry/heatmap', headers={'If-Modified-Since': last_modified}).status_code
+        == 304
+    )
+
+    price_payload = {'id': 'watermark', 'provider_id': 'gemini', 'model': 'g-1'}
+    assert client.post('/api/v1/prices', json=price_payload).status_code == 201
+
+    refreshed = client.get('/api/v1/telemetry/metrics', headers={'If-None-Match': etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers['etag'] != etag
+
+
+def test_telemetry_preconditions_follow_bounds_and_provider_reloads(
+    telemetry_dataset, client: TestClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    import console_mcp_server.config as config_module
+
+    first = client.get('/api/v1/telemetry/timeseries')
+    etag = first.headers['etag']
+    assert client.get('/api/v1/telemetry/pareto', headers={'If-None-Match': etag}).status_code == 304
+
+    inverted = client.get(
+        '/api/v1/telemetry/timeseries',
+        params={'start': '2025-04-12T00:00:00Z', 'end': '2025-04-09T00:00:00Z'},
+        headers={'If-None-Match': etag},
+    )
+    assert inverted.status_code == 400
+    assert inverted.json() == {'detail': 'start must be before end'}
+
+    manifest = json.loads(MANIFEST_PATH.read_text(encoding='utf-8'))
+    manifest['providers'] = manifest['providers'][:1]
+    reduced = tmp_path / 'servers.json'
+    reduced.write_text(json.dumps(manifest), encoding='utf-8')
+    monkeypatch.setenv('CONSOLE_MCP_SERVERS_PATH', str(reduced))
+    config_module.reload_settings()
+
+    reloaded = client.get('/api/v1/telemetry/timeseries', headers={'If-None-Match': etag})
+    assert reloaded.status_code == 200
+    assert reloaded.headers['etag'] != etag
+
+
+def test_telemetry_bounds_accept_zulu_and_reject_garbage(client: TestClient) -> None:
+    routes_module._parse_query_timestamp.cache_clear()
+    params = {'start': '2025-04-09T00:00:00Z', 'end': '2025-04-12T00:00:00Z'}
+
+    assert client.get('/api/v1/telemetry/timeseries', params=params).status_code == 200
+    assert client.get('/api/v1/telemetry/timeseries', params=params).status_code == 200
+    assert routes_module._parse_query_timestamp.cache_info().hits == 2
+
+    invalid = client.get('/api/v1/telemetry/timeseries', params={'start': '2025-04-09Tnoon:00:00'})
+    assert invalid.status_code == 422
+
+
 def test_telemetry_timeseries_endpoint_returns_daily_metrics(
     telemetry_dataset, client: TestClient
 ) -> None:
@@ -929,6 +1090,32 @@ def test_telemetry_runs_endpoint_supports_pagination(
     assert empty_page.json() == runs_fixture.model_dump(mode='json')
 
 
+def test_telemetry_runs_endpoint_coerces_non_iso_timestamps(
+    client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from console_mcp_server import telemetry
+
+    monkeypatch.setenv('CONSOLE_MCP_LOGS_DIR', str(tmp_path))
+    provider_dir = tmp_path / 'glm46'
+    provider_dir.mkdir()
+    record = {
+        'ts': '1700000000',
+        'tool': 'glm46.chat',
+        'tokens_in': 1,
+        'tokens_out': 1,
+        'duration_ms': 5,
+        'status': 'success',
+    }
+    (provider_dir / 'epoch.jsonl').write_text(json.dumps(record) + '\n', encoding='utf-8')
+    # ``fromisoformat`` rejects the epoch string, so it is stored verbatim.
+    assert telemetry.ingest_logs() == 1
+
+    response = client.get('/api/v1/telemetry/runs')
+
+    assert response.status_code == 200
+    assert [item['ts'] for item in response.json()['items']] == ['2023-11-14T22:13:20Z']
+
+
 def test_telemetry_timeseries_endpoint_supports_lane_filter(
     telemetry_dataset, client: TestClient, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -1159,16 +1346,17 @@ def test_cost_policies_crud_flow(client: TestClient) -> None:
 
     duplicate = client.post('/api/v1/policies', json=create_payload)
     assert duplicate.status_code == 409
+    assert duplicate.json()['detail'] == "Policy 'global-spend' already exists"
 
     list_after_create = client.get('/api/v1/policies')
     assert list_after_create.status_code == 200
     policies = list_after_create.json()['policies']
     assert len(policies) == 1
-    assert policies[0]['id'] == 'global-spend'
+    assert policies[0] == created
 
     read_response = client.get('/api/v1/policies/global-spend')
     assert read_response.status_code == 200
-    assert read_response.json()['name'] == 'Global Spend Ceiling'
+    assert read_response.json() == created
 
     update_payload = {
         'name': 'Updated Spend Ceiling',
@@ -1220,8 +1408,10 @@ def test_policy_templates_catalog(client: TestClient) -> None:
 
     sample = templates[0]
     assert sample['name']
+    assert {'priceDelta', 'latencyTarget', 'guardrailLevel'} <= set(sample)
     assert isinstance(sample['features'], list)
     assert all(isinstance(item, str) for item in sample['features'])
+    assert client.get('/api/v1/policies/templates').json()['templates'] == templates
 
     rollout = payload.get('rollout')
     assert rollout is not None
@@ -1271,14 +1461,23 @@ def test_policy_deployments_flow(client: TestClient) -> None:
     assert list_after_create.status_code == 200
     payload_after = list_after_create.json()
     assert payload_after['active_id'] == created['id']
-    ids = [item['id'] for item in payload_after['deployments']]
-    assert created['id'] in ids
+    active_only = client.get('/api/v1/policies/deployments', params={'fields': 'active'})
+    assert active_only.json() == {'deployments': [], 'active_id': created['id']}
+    assert created in payload_after['deployments']
+    etag = list_after_create.headers['etag']
+    cached = client.get('/api/v1/policies/deployments', headers={'If-None-Match': etag})
+    assert cached.status_code == 304
 
     delete_response = client.delete(f"/api/v1/policies/deployments/{created['id']}")
     assert delete_response.status_code == 204
 
+    after_delete = client.get('/api/v1/policies/deployments', headers={'If-None-Match': etag})
+    assert after_delete.status_code == 200
+    assert after_delete.json() == payload
+
     missing_delete = client.delete(f"/api/v1/policies/deployments/{created['id']}")
     assert missing_delete.status_code == 404
+    assert missing_delete.json() == {'detail': f"Deployment '{created['id']}' not found"}
 
     bad_create = client.post(
         '/api/v1/policies/deployments', json={'template_id': 'missing', 'author': 'Ops'}
@@ -1330,11 +1529,11 @@ def test_price_table_crud_flow(client: TestClient) -> None:
     assert list_after_create.status_code == 200
     entries = list_after_create.json()['entries']
     assert len(entries) == 1
-    assert entries[0]['id'] == 'openai-gpt4-turbo'
+    assert entries[0] == created
 
     read_response = client.get('/api/v1/prices/openai-gpt4-turbo')
     assert read_response.status_code == 200
-    assert read_response.json()['provider_id'] == 'openai'
+    assert read_response.json() == created
 
     new_effective_at = datetime(2024, 6, 1, tzinfo=timezone.utc)
     update_payload = {
@@ -1380,6 +1579,61 @@ def test_price_table_crud_flow(client: TestClient) -> None:
     assert list_after_delete.json()['entries'] == []
 
 
+def test_cached_listings_are_served_without_the_threadpool(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import console_mcp_server.routes as routes_module
+
+    offloaded: list[object] = []
+    run_in_threadpool = routes_module.run_in_threadpool
+
+    async def counting_run_in_threadpool(func, *args, **kwargs):
+        offloaded.append(func)
+        return await run_in_threadpool(func, *args, **kwargs)
+
+    monkeypatch.setattr(routes_module, 'run_in_threadpool', counting_run_in_threadpool)
+    payload = {'id': 'price-a', 'provider_id': 'gemini', 'model': 'g-1'}
+    assert client.post('/api/v1/prices', json=payload).status_code == 201
+
+    first = client.get('/api/v1/prices')
+    second = client.get('/api/v1/prices', headers={'If-None-Match': first.headers['etag']})
+
+    assert [entry['id'] for entry in first.json()['entries']] == ['price-a']
+    assert second.status_code == 304
+    assert len(offloaded) == 1
+
+
+def test_price_table_listing_supports_conditional_requests(client: TestClient) -> None:
+    first = client.get('/api/v1/prices')
+    etag = first.headers['etag']
+
+    not_modified = client.get('/api/v1/prices', headers={'If-None-Match': etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers['etag'] == etag
+    for header in (f'W/{etag}', f'"stale", {etag}', '*'):
+        assert client.get('/api/v1/prices', headers={'If-None-Match': header}).status_code == 304
+    assert client.get('/api/v1/prices', headers={'If-None-Match': '"stale"'}).status_code == 200
+
+    create_response = client.post(
+        '/api/v1/prices',
+        json={'id': 'openai-gpt4o', 'provider_id': 'openai', 'model': 'gpt-4o'},
+    )
+    assert create_response.status_code == 201
+
+    refreshed = client.get('/api/v1/prices', headers={'If-None-Match': etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers['etag'] != etag
+    assert [entry['id'] for entry in refreshed.json()['entries']] == ['openai-gpt4o']
+
+    client.post(
+        '/api/v1/prices',
+        json={'id': 'anthropic-sonnet', 'provider_id': 'anthropic', 'model': 'sonnet'},
+    )
+    listing = client.get('/api/v1/prices').json()['entries']
+    assert [entry['id'] for entry in listing] == ['anthropic-sonnet', 'openai-gpt4o']
+    assert listing[0] == client.get('/api/v1/prices/anthropic-sonnet').json()
+
+
 def test_marketplace_catalog_flow(client: TestClient, database) -> None:
     token = 'marketplace-token'
     _seed_rag_user(database, token=token, roles=(Role.PLANNER,))
@@ -1478,6 +1732,21 @@ def test_marketplace_import_validates_signature(client: TestClient, database) ->
     assert 'Assinatura' in import_response.json()['detail']
 
 
+def test_cost_dry_run_reports_providers_without_pricing(client: TestClient) -> None:
+    payload = {
+        'provider_id': 'gemini',
+        'project': 'console',
+        'route': 'chat.default',
+        'tokens_in': 10,
+        'tokens_out': 10,
+    }
+
+    for _ in range(2):
+        response = client.post('/api/v1/policies/dry-run', json=payload)
+        assert response.status_code == 404
+        assert response.json() == {'detail': "No pricing data found for provider 'gemini'"}
+
+
 def test_cost_dry_run_estimates_cost_without_override(client: TestClient) -> None:
     price_payload = {
         'id': 'gemini-standard',
@@ -1677,6 +1946,57 @@ def test_routing_simulation_uses_price_table(client: TestClient) -> None:
     assert entry['cost'] == pytest.approx(100.0)
 
 
+def test_routing_simulation_reuses_route_profiles_until_prices_change(
+    monkeypatch: pytest.MonkeyPatch, client: TestClient
+) -> None:
+    built: list[tuple[str, ...]] = []
+    original_build_routes = routes_module.build_routes
+
+    def counting_build_routes(providers):
+        providers = list(providers)
+        built.append(tuple(provider.id for provider in providers))
+        return original_build_routes(providers)
+
+    monkeypatch.setattr(routes_module, 'build_routes', counting_build_routes)
+    payload = {'provider_ids': ['gemini', 'codex'], 'strategy': 'balanced', 'volume_millions': 5}
+
+    first = client.post('/api/v1/routing/simulate', json=payload)
+    second = client.post('/api/v1/routing/simulate', json=payload)
+    assert first.json() == second.json()
+    assert built == [('gemini', 'codex')]
+
+    created = client.post(
+        '/api/v1/prices',
+        json={'id': 'gemini-cache', 'provider_id': 'gemini', 'model': 'flash', 'input_cost_per_1k': 0.01},
+    )
+    assert created.status_code == 201
+    client.post('/api/v1/routing/simulate', json=payload)
+    assert len(built) == 2
+
+
+def test_routing_simulation_for_all_providers_is_cached(
+    monkeypatch: pytest.MonkeyPatch, client: TestClient
+) -> None:
+    plans: list[str] = []
+    original_compute_plan = routes_module.compute_plan
+
+    def counting_compute_plan(routes, strategy, *args, **kwargs):
+        plans.append(strategy)
+        return original_compute_plan(routes, strategy, *args, **kwargs)
+
+    monkeypatch.setattr(routes_module, 'compute_plan', counting_compute_plan)
+
+    first = client.post('/api/v1/routing/simulate', json={'strategy': 'finops'})
+    second = client.post('/api/v1/routing/simulate', json={'strategy': 'finops'})
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert plans == ['finops']
+
+    client.post('/api/v1/routing/simulate', json={'strategy': 'latency'})
+    client.post('/api/v1/routing/simulate', json={'strategy': 'finops', 'provider_ids': ['gemini']})
+    assert plans == ['finops', 'latency', 'finops']
+
+
 def test_routing_simulation_rejects_unknown_provider(client: TestClient) -> None:
     response = client.post(
         '/api/v1/routing/simulate', json={'provider_ids': ['missing'], 'volume_millions': 5}
@@ -1684,6 +2004,13 @@ def test_routing_simulation_rejects_unknown_provider(client: TestClient) -> None
     assert response.status_code == 404
     assert 'Providers not found' in response.text
 
+    several = client.post(
+        '/api/v1/routing/simulate',
+        json={'provider_ids': ['missing', 'gemini', 'absent', 'missing'], 'volume_millions': 5},
+    )
+    assert several.status_code == 404
+    assert several.json()['detail'] == 'Providers not found: missing, absent'
+
 
 def test_routing_simulation_rejects_unknown_failover_provider(client: TestClient) -> None:
     response = client.post(
@@ -1715,6 +2042,22 @@ def test_routing_simulation_requires_failover_in_subset(client: TestClient) -> N
     assert response.json()['detail'] == 'Failover provider must be included in provider_ids'
 
 
+def test_routing_simulation_without_active_routes_serves_fixture(client: TestClient) -> None:
+    payload = {
+        'provider_ids': ['gemini'],
+        'strategy': 'balanced',
+        'failover_provider_id': 'gemini',
+        'volume_millions': 5,
+    }
+
+    first = client.post('/api/v1/routing/simulate', json=payload)
+    assert first.status_code == 200
+    fixture = load_response_fixture(RoutingSimulationResponse, 'routing_simulation')
+    assert fixture is not None
+    assert first.json() == fixture.model_dump(mode='json')
+    assert client.post('/api/v1/routing/simulate', json=payload).content == first.content
+
+
 def test_mcp_servers_crud_flow(client: TestClient) -> None:
     list_empty = client.get('/api/v1/servers')
     assert list_empty.status_code == 200
@@ -1748,6 +2091,7 @@ def test_mcp_servers_crud_flow(client: TestClient) -> None:
     read_response = client.get('/api/v1/servers/anthropic')
     assert read_response.status_code == 200
     assert read_response.json()['command'] == '~/.local/bin/claude-mcp'
+    assert read_response.json() == body
 
     update_payload = {
         'name': 'Anthropic Claude 3',
@@ -1767,6 +2111,7 @@ def test_mcp_servers_crud_flow(client: TestClient) -> None:
     assert updated['capabilities'] == ['chat']
     assert updated['description'] == 'Updated description'
     assert updated['updated_at'] != updated['created_at']
+    assert client.get('/api/v1/servers/anthropic').json() == updated
 
     list_after_update = client.get('/api/v1/servers')
     assert list_after_update.status_code == 200
@@ -1822,6 +2167,180 @@ def test_routing_simulation_endpoint_validates_provider_ids(client: TestClient)
     assert 'Providers not found' in detail
 
 
+def test_server_lookups_are_cached_until_the_next_write(
+    monkeypatch: pytest.MonkeyPatch, client: TestClient
+) -> None:
+    from console_mcp_server import servers as servers_module
+
+    fetched: list[str] = []
+    original_fetch = servers_module._fetch_optional
+
+    def counting_fetch(session, server_id):
+        fetched.append(server_id)
+        return original_fetch(session, server_id)
+
+    monkeypatch.setattr(servers_module, '_fetch_optional', counting_fetch)
+
+    assert servers_module.lookup_server('cached') is None
+    created = servers_module.create_server(server_id='cached', name='Cached', command='run')
+    fetched.clear()
+    assert servers_module.lookup_server('cached') == created
+    assert servers_module.get_server('cached') == created
+    assert fetched == ['cached']
+
+    servers_module.delete_server('cached')
+    assert servers_module.lookup_server('cached') is None
+
+
+def test_process_logs_fall_back_to_fixture_entries(client: TestClient) -> None:
+    fixture = load_response_fixture(ServerProcessesResponse, "server_processes")
+    assert fixture is not None
+    process = fixture.processes[0]
+
+    response = client.get(f'/api/v1/servers/{process.server_id}/process/logs')
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload['cursor'] == process.cursor
+    assert payload['logs'] == [log.model_dump(mode='json') for log in process.logs]
+
+    unknown = client.get('/api/v1/servers/not-in-fixture/process/logs?cursor=7')
+    assert unknown.json() == {'logs': [], 'cursor': '7'}
+
+    invalid = client.get('/api/v1/servers/not-in-fixture/process/logs?cursor=abc')
+    assert invalid.status_code == 422
+    assert client.get('/api/v1/servers/not-in-fixture/process/logs?cursor=-1').status_code == 422
+    oversized = client.get('/api/v1/servers/not-in-fixture/process/logs?cursor=' + '9' * 5000)
+    assert oversized.status_code == 422
+
+    empty = client.get('/api/v1/servers/not-in-fixture/process/logs?cursor=')
+    assert empty.status_code == 200
+    assert empty.json() == {'logs': [], 'cursor': ''}
+    padded = client.get('/api/v1/servers/not-in-fixture/process/logs?cursor=007')
+    assert padded.json() == {'logs': [], 'cursor': '007'}
+
+
+def test_process_batch_applies_actions_in_order(client: TestClient) -> None:
+    command = f"{sys.executable} -c 'import time; time.sleep(60)'"
+    for server_id in ('batch-a', 'batch-b'):
+        created = client.post(
+            '/api/v1/servers',
+            json={'id': server_id, 'name': server_id, 'command': command, 'transport': 'stdio'},
+        )
+        assert created.status_code == 201
+
+    response = client.post(
+        '/api/v1/servers/processes/batch',
+        json={
+            'actions': [
+                {'server_id': 'batch-a', 'op': 'start'},
+                {'server_id': 'batch-b', 'op': 'restart'},
+                {'server_id': 'batch-a', 'op': 'start'},
+                {'server_id': 'missing', 'op': 'start'},
+                {'server_id': 'batch-a', 'op': 'stop'},
+                {'server_id': 'batch-b', 'op': 'stop'},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    results = response.json()['results']
+
+    assert [(item['server_id'], item['op']) for item in results] == [
+        ('batch-a', 'start'),
+        ('batch-b', 'restart'),
+        ('batch-a', 'start'),
+        ('missing', 'start'),
+        ('batch-a', 'stop'),
+        ('batch-b', 'stop'),
+    ]
+    assert results[0]['process']['status'] == 'running'
+    assert results[1]['process']['status'] == 'running'
+    assert results[2] == {
+        'server_id': 'batch-a',
+        'op': 'start',
+        'process': None,
+        'error': "Server 'batch-a' is already running",
+    }
+    assert results[3]['error'] == "Server 'missing' not found"
+    assert results[4]['process']['status'] in {'stopped', 'error'}
+    assert results[5]['error'] is None
+
+    empty = client.post('/api/v1/servers/processes/batch', json={'actions': []})
+    assert empty.status_code == 422
+
+
+def test_process_batch_releases_the_lock_between_actions(client: TestClient) -> None:
+    from console_mcp_server import supervisor
+
+    process_supervisor = supervisor.process_supervisor
+    command = f"{sys.executable} -c 'import time; time.sleep(60)'"
+    held: list[bool] = []
+
+    def actions():
+        for action in (('lock-a', 'start', command), ('lock-a', 'stop', None), ('lock-b', 'stop', None)):
+            held.append(process_supervisor._lock.locked() or process_supervisor._operations.locked())
+            yield action
+
+    results = process_supervisor.apply(actions())
+
+    assert held == [False, False, False]
+    assert results[0].status == supervisor.ProcessStatus.RUNNING
+    assert results[1].status in {supervisor.ProcessStatus.STOPPED, supervisor.ProcessStatus.ERROR}
+    assert isinstance(results[2], supervisor.ProcessNotRunningError)
+    assert [snapshot.server_id for snapshot in process_supervisor.list()] == ['lock-a']
+
+
+def test_process_stop_waits_without_blocking_readers(client: TestClient, tmp_path: Path) -> None:
+    import threading
+
+    from console_mcp_server import supervisor
+
+    process_supervisor = supervisor.process_supervisor
+    ready = tmp_path / 'ready'
+    release = tmp_path / 'release'
+    # The child only exits on SIGTERM once the test creates ``release``.
+    child = tmp_path / 'child.py'
+    child.write_text(
+        'import pathlib, signal, sys, time\n'
+        'def terminate(*_):\n'
+        f'    while not pathlib.Path({str(release)!r}).exists():\n'
+        '        time.sleep(0.01)\n'
+        '    sys.exit(0)\n'
+        'signal.signal(signal.SIGTERM, terminate)\n'
+        f'pathlib.Path({str(ready)!r}).touch()\n'
+        'time.sleep(60)\n',
+        encoding='utf-8',
+    )
+    process_supervisor.start('slow-stop', f'{sys.executable} {child}')
+    deadline = time.monotonic() + 10
+    while not ready.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    stopper = threading.Thread(target=process_supervisor.stop, args=('slow-stop',))
+    stopper.start()
+    while time.monotonic() < deadline:
+        if any(entry.message == 'Stop requested via supervisor' for entry in process_supervisor.logs('slow-stop')):
+            break
+        time.sleep(0.01)
+
+    # Readers answer while the child is still held, before its exit is recorded.
+    assert process_supervisor.status('slow-stop').status == supervisor.ProcessStatus.RUNNING
+    assert client.get('/api/v1/servers/slow-stop/process/logs').json()['logs'][-1]['message'] == (
+        'Stop requested via supervisor'
+    )
+    listed = client.get('/api/v1/servers/processes').json()['processes']
+    assert [entry['status'] for entry in listed] == ['running']
+
+    release.touch()
+    stopper.join(timeout=15)
+    snapshot = process_supervisor.status('slow-stop')
+    assert snapshot.status == supervisor.ProcessStatus.STOPPED
+    assert snapshot.return_code == 0
+    assert [entry.message for entry in snapshot.logs][-2:] == [
+        'Stop requested via supervisor',
+        'Process stopped with code 0',
+    ]
+
+
 def test_process_supervisor_flow(client: TestClient) -> None:
     command = f"{sys.executable} -c 'import time; time.sleep(60)'"
     create_payload = {
@@ -1856,6 +2375,7 @@ def test_process_supervisor_flow(client: TestClient) -> None:
 
     duplicate_start = client.post('/api/v1/servers/supervisor-test/process/start')
     assert duplicate_start.status_code == 409
+    assert duplicate_start.json() == {'detail': "Server 'supervisor-test' is already running"}
 
     list_response = client.get('/api/v1/servers/processes')
     assert list_response.status_code == 200
@@ -1863,6 +2383,11 @@ def test_process_supervisor_flow(client: TestClient) -> None:
     assert any(proc['server_id'] == 'supervisor-test' for proc in processes)
     process_entry = next(proc for proc in processes if proc['server_id'] == 'supervisor-test')
     assert process_entry['logs']
+    assert set(process_entry) == set(start_body)
+    assert process_entry['status'] == start_body['status']
+    assert all(isinstance(entry['id'], str) for entry in process_entry['logs'])
+    single = client.get('/api/v1/servers/supervisor-test/process')
+    assert single.json()['process'] == process_entry
 
     stop_response = client.post('/api/v1/servers/supervisor-test/process/stop')
     assert stop_response.status_code == 200
@@ -1878,9 +2403,57 @@ def test_process_supervisor_flow(client: TestClient) -> None:
     assert tail_payload['logs']
     assert tail_payload['cursor'] == stop_cursor
     assert all(int(entry['id']) > int(start_cursor) for entry in tail_payload['logs'])
+    assert tail_payload['logs'] == [
+        entry for entry in stopped_body['logs'] if int(entry['id']) > int(start_cursor)
+    ]
 
     second_stop = client.post('/api/v1/servers/supervisor-test/process/stop')
     assert second_stop.status_code == 409
+    assert second_stop.json() == {'detail': "Server 'supervisor-test' is not running"}
+
+
+def test_process_list_reuses_snapshots_and_notices_exits(client: TestClient) -> None:
+    from console_mcp_server import supervisor
+
+    process_supervisor = supervisor.process_supervisor
+    process_supervisor.start('short-lived', f"{sys.executable} -c 'pass'")
+    process_supervisor.start('long-lived', f"{sys.executable} -c 'import time; time.sleep(60)'")
+
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        listed = {snapshot.server_id: snapshot for snapshot in process_supervisor.list()}
+        if listed['short-lived'].status != supervisor.ProcessStatus.RUNNING:
+            break
+        time.sleep(0.05)
+
+    assert listed['short-lived'].status == supervisor.ProcessStatus.STOPPED
+    assert listed['short-lived'].pid is None
+    assert listed['long-lived'].status == supervisor.ProcessStatus.RUNNING
+    assert process_supervisor.list() is process_supervisor.list()
+
+    import console_mcp_server.routes as routes_module
+
+    for snapshot in listed.values():
+        spliced = routes_module._encoded_process(snapshot)
+        encoded = routes_module.json_codec.dumps_bytes(routes_module._process_payload(snapshot))
+        assert json.loads(spliced) == json.loads(encoded)
+
+    first = client.get('/api/v1/servers/processes').json()['processes']
+    assert client.get('/api/v1/servers/processes').json()['processes'] == first
+    assert [entry['server_id'] for entry in first] == ['short-lived', 'long-lived']
+
+    process_supervisor.stop('long-lived')
+    stopped = client.get('/api/v1/servers/processes').json()['processes']
+    assert stopped[1]['status'] in {'stopped', 'error'}
+    assert stopped[1]['cursor'] != first[1]['cursor']
+    assert set(routes_module._process_bodies) == {'short-lived', 'long-lived'}
+
+    process_supervisor.start('long-lived', f"{sys.executable} -c 'import time; time.sleep(60)'")
+    process_supervisor.prune()
+    remaining = client.get('/api/v1/servers/processes').json()['processes']
+    assert [entry['server_id'] for entry in remaining] == ['long-lived']
+    assert set(routes_module._process_bodies) == {'long-lived'}
+    process_supervisor.stop('long-lived')
 
 
 def _flow_graph_payload() -> dict[str, object]:
@@ -2151,3 +2724,17 @@ def test_config_rag_query_endpoint(client: TestClient, database) -> None:
     assert payload["documents"], "expected rag documents to be returned"
     assert payload["latency_ms"] >= 0
     assert all(doc["path"].startswith("docs/") for doc in payload["documents"])
+
+
+def test_large_responses_are_gzip_compressed(client: TestClient) -> None:
+    listing = client.get('/api/v1/policies/templates', headers={'Accept-Encoding': 'gzip'})
+    assert listing.status_code == 200
+    assert listing.headers['content-encoding'] == 'gzip'
+    assert listing.json()['templates']
+
+    health = client.get('/api/v1/healthz', headers={'Accept-Encoding': 'gzip'})
+    assert 'content-encoding' not in health.headers
+
+    plain = client.get('/api/v1/policies/templates', headers={'Accept-Encoding': 'identity'})
+    assert 'content-encoding' not in plain.headers
+    assert plain.json() == listing.json()
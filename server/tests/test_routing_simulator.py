@@ -14,6 +14,8 @@ from console_mcp_server.routing import (
     RoutingRule,
     build_simulation_response,
     compute_plan,
+    render_plan_payload,
+    render_plan_result,
 )
 from console_mcp_server.schemas import ProviderSummary, RoutingSimulationResponse
 
@@ -144,6 +146,29 @@ def test_compute_plan_intents_influence_lane_weights() -> None:
     assert turbo_adjusted.tokens_millions > turbo_base.tokens_millions
 
 
+def test_render_plan_payload_matches_response_schema_dump() -> None:
+    routes = (
+        _route("alpha", lane="economy", cost=12.0, latency=1500.0, reliability=95.0, capacity=70.0),
+        _route("beta", lane="turbo", cost=30.0, latency=800.0, reliability=94.0, capacity=80.0),
+    )
+
+    for failover in (None, "beta"):
+        plan = compute_plan(routes, DEFAULT_STRATEGY, failover, 8.0)
+        assert render_plan_payload(plan) == render_plan_result(plan).model_dump()
+
+
+def test_render_plan_payload_reuses_route_payloads_per_profile() -> None:
+    routes = (_route("alpha", lane="economy", cost=12.0, latency=1500.0, reliability=95.0, capacity=70.0),)
+    plan = compute_plan(routes, DEFAULT_STRATEGY, None, 8.0)
+
+    first = render_plan_payload(plan)["distribution"][0]["route"]
+    assert render_plan_payload(plan)["distribution"][0]["route"] is first
+
+    repriced = (_route("alpha", lane="economy", cost=20.0, latency=1500.0, reliability=95.0, capacity=70.0),)
+    route = render_plan_payload(compute_plan(repriced, DEFAULT_STRATEGY, None, 8.0))["distribution"][0]["route"]
+    assert route["cost_per_million"] == 20.0
+
+
 def test_compute_plan_applies_rule_weights() -> None:
     routes = (
         _route("alpha", lane="balanced", cost=16.0, latency=900.0, reliability=96.0, capacity=80.0),
@@ -513,7 +513,9 @@ def test_aggregate_heatmap_groups_by_day_and_provider(database, telemetry_module
         )
 
 
-def test_render_export_generates_csv_and_html(database, telemetry_module) -> None:
+def test_render_export_generates_csv_and_html(
+    database, telemetry_module, monkeypatch: pytest.MonkeyPatch
+) -> None:
     engine = database.bootstrap_database()
     base_ts = datetime(2025, 2, 1, 9, 0, tzinfo=timezone.utc)
 
@@ -607,3 +609,78 @@ def test_render_export_generates_csv_and_html(database, telemetry_module) -> Non
 
     with pytest.raises(ValueError):
         telemetry_module.render_telemetry_export("pdf")
+
+    monkeypatch.setattr(telemetry_module, "_EXPORT_BATCH_SIZE", 1)
+    chunks, stream_type = telemetry_module.stream_telemetry_export("csv")
+    assert stream_type == "text/csv"
+    streamed = list(chunks)
+    assert len(streamed) > 2
+    assert b"".join(streamed).decode("utf-8") == csv_doc
+
+    with pytest.raises(ValueError):
+        telemetry_module.stream_telemetry_export("pdf")
+
+
+def test_rollups_answer_windows_with_partial_edge_buckets(database, telemetry_module) -> None:
+    engine = database.bootstrap_database()
+    base_ts = datetime(2025, 3, 1, 9, 0, tzinfo=timezone.utc)
+    offsets = (1, 3, 7, 8, 12)
+
+    with engine.begin() as connection:
+        for index, minutes in enumerate(offsets, start=1):
+            connection.execute(
+                text(
+                    """
+                    INSERT INTO telemetry_events (
+                        provider_id, tool, route, tokens_in, tokens_out, duration_ms,
+                        status, cost_estimated_usd, metadata, ts, source_file,
+                        line_number, ingested_at
+                    ) VALUES (
+                        'glm46', 'glm46.chat', 'default', :tokens_in, 10, :duration_ms,
+                        'success', 0.5, '{}', :ts, 'glm46/rollups.jsonl',
+                        :line_number, :ts
+                    )
+                    """
+                ),
+                {
+                    "tokens_in": minutes * 100,
+                    "duration_ms": minutes * 10,
+                    "ts": (base_ts + timedelta(minutes=minutes)).isoformat(),
+                    "line_number": index,
+                },
+            )
+        rollup_rows = connection.execute(
+            text("SELECT bucket_start, run_count FROM telemetry_rollups ORDER BY bucket_start")
+        ).all()
+
+    assert [tuple(row) for row in rollup_rows] == [
+        ("2025-03-01T09:00:00+00:00", 2),
+        ("2025-03-01T09:05:00+00:00", 2),
+        ("2025-03-01T09:10:00+00:00", 1),
+    ]
+
+    aggregates = telemetry_module.aggregate_metrics(
+        start=base_ts + timedelta(minutes=2),
+        end=base_ts + timedelta(minutes=11),
+    )
+    assert aggregates.total_runs == 3
+    assert aggregates.total_tokens_in == 300 + 700 + 800
+    assert aggregates.avg_latency_ms == pytest.approx((30 + 70 + 80) / 3)
+    assert aggregates.start == base_ts + timedelta(minutes=3)
+    assert aggregates.end == base_ts + timedelta(minutes=8)
+    assert [(entry.run_count, entry.cost_usd) for entry in aggregates.extended.cost_breakdown] == [
+        (3, pytest.approx(1.5))
+    ]
+
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM telemetry_events WHERE line_number = 3"))
+        remaining = connection.execute(
+            text(
+                "SELECT run_count, tokens_in FROM telemetry_rollups "
+                "WHERE bucket_start = '2025-03-01T09:05:00+00:00'"
+            )
+        ).one()
+
+    assert tuple(remaining) == (1, 800)
+    (bucket,) = telemetry_module.aggregate_heatmap()
+    assert bucket.run_count == 4